@@ -0,0 +1,128 @@
+"""
+Benchmark game-log read throughput across storage formats.
+
+Usage:
+    PYTHONPATH=src python scripts/bench_game_logs.py                 # 10k logs
+    PYTHONPATH=src python scripts/bench_game_logs.py --num-logs 2000 --rounds 10
+
+Generates the same synthetic games (Firebase-style card URLs) in each
+format under a temporary directory, then times the two local read paths the
+API uses: full loads (leaderboard / card stats, via iter_logs) and list-view
+summaries (read_summary).  Formats:
+
+  legacy     pretty-printed v1 JSON document (the original format)
+  jsonl      compact v2 JSONL
+  jsonl.gz   compact v2 JSONL, gzip
+  jsonl.zst  compact v2 JSONL, zstd (skipped without the zstandard package)
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from core.game_log import LOG_PREFIX, GameLogWriter, compress_file, iter_logs, log_codec, log_paths, read_summary
+
+_URL = "https://firebasestorage.googleapis.com/v0/b/dixit-arena.appspot.com/o/collections%2F1_full%2F{:04d}.jpg?alt=media"
+
+
+def synthetic_log(rng: random.Random, game_id: str, rounds: int, players: int = 4) -> dict:
+    names = [f"model-{i}_{i + 1}" for i in range(players)]
+    deck = [_URL.format(i) for i in rng.sample(range(2000), 84)]
+    hands = {n: [deck.pop() for _ in range(6)] for n in names}
+    scores = {n: 0 for n in names}
+    log = {
+        "game_id": game_id,
+        "game_configuration": {
+            "timestamp": game_id, "prompt_style": "creative", "image_directory": "1_full", "max_rounds": rounds,
+            "players": [{"name": n, "model": f"vendor/model-{i}", "provider": "vendor", "prompt_style": "creative", "score": 0}
+                        for i, n in enumerate(names)],
+        },
+        "rounds": [],
+    }
+    for r in range(1, rounds + 1):
+        teller = names[(r - 1) % players]
+        teller_card = hands[teller][0]
+        played = {}
+        for n in names:
+            if n != teller:
+                card_scores = {c: float(rng.randint(0, 10)) for c in hands[n]}
+                played[n] = {"selected_card": max(card_scores, key=card_scores.get), "card_scores": card_scores}
+        table = [teller_card] + [p["selected_card"] for p in played.values()]
+        rng.shuffle(table)
+        votes = {}
+        for n in played:
+            card_scores = {c: float(rng.randint(0, 10)) for c in table}
+            votes[n] = {"selected_card": max(card_scores, key=card_scores.get), "card_scores": card_scores}
+        changes = {n: rng.randint(0, 5) for n in names}
+        for n in names:
+            scores[n] += changes[n]
+            hands[n] = hands[n][1:] + [deck.pop()]
+        log["rounds"].append({
+            "round": r, "storyteller": teller, "clue": "a quiet storm over glass",
+            "storyteller_card": teller_card, "played_cards": played, "votes": votes,
+            "storyteller_votes": rng.randint(0, players - 1), "score_changes": changes,
+            "current_scores": dict(scores), "scores_reused": players - 1,
+        })
+    return log
+
+
+def write_formats(root: str, num_logs: int, rounds: int, seed: int) -> dict[str, str]:
+    formats = ["legacy", "jsonl", "jsonl.gz"] + (["jsonl.zst"] if log_codec("zstd") == "zstd" else [])
+    dirs = {f: os.path.join(root, f) for f in formats}
+    for d in dirs.values():
+        os.makedirs(d)
+    rng = random.Random(seed)
+    for i in range(num_logs):
+        game_id = f"bench_{i:05d}"
+        log = synthetic_log(rng, game_id, rounds)
+        with open(os.path.join(dirs["legacy"], f"{LOG_PREFIX}{game_id}.json"), "w") as f:
+            json.dump(log, f, indent=2)
+        path = os.path.join(dirs["jsonl"], f"{LOG_PREFIX}{game_id}.jsonl")
+        writer = GameLogWriter(path)
+        writer.rewrite(log)
+        writer.trailer(log["rounds"][-1]["current_scores"], rounds)
+        for fmt, codec in (("jsonl.gz", "gzip"), ("jsonl.zst", "zstd")):
+            if fmt in dirs:
+                copy = os.path.join(dirs[fmt], os.path.basename(path))
+                shutil.copyfile(path, copy)
+                compress_file(copy, codec)
+    return dirs
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--num-logs", type=int, default=10_000)
+    p.add_argument("--rounds", type=int, default=8)
+    p.add_argument("--seed", type=int, default=0)
+    args = p.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="dixit_log_bench_") as root:
+        print(f"Writing {args.num_logs} synthetic {args.rounds}-round logs per format…")
+        dirs = write_formats(root, args.num_logs, args.rounds, args.seed)
+
+        print(f"\n{'format':<10} {'size MB':>9} {'full load s':>12} {'logs/s':>9} {'summaries s':>12} {'logs/s':>9}")
+        for fmt, d in dirs.items():
+            size = sum(os.path.getsize(p) for p in log_paths(d)) / 1e6
+            full = _timed(lambda: sum(1 for _ in iter_logs(d)))
+            summaries = _timed(lambda: [read_summary(p) for p in log_paths(d)])
+            print(f"{fmt:<10} {size:>9.1f} {full:>12.2f} {args.num_logs / full:>9.0f} "
+                  f"{summaries:>12.2f} {args.num_logs / summaries:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
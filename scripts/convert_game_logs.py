@@ -0,0 +1,116 @@
+"""
+Convert existing game logs to the compact v2 schema.
+
+Usage:
+    PYTHONPATH=src python scripts/convert_game_logs.py               # game_logs/
+    PYTHONPATH=src python scripts/convert_game_logs.py --logs-dir other/dir --dry-run
+    PYTHONPATH=src python scripts/convert_game_logs.py --firestore   # also rewrite Firestore documents
+
+Legacy ``dixit_game_log_{id}.json`` documents and version-1 JSONL logs are
+rewritten as version-2 JSONL (card table + integer ids, see
+core.log_schema); the original file is removed once the new one is in place.
+Logs already in v2 are left alone.  Readers understand every format, so the
+conversion only saves space and read time — it can run at any point.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from core.game_log import LOG_PREFIX, LOG_VERSION, GameLogWriter, game_id_from_path, load_log, log_paths
+from core.log_schema import compact_log
+
+logger = logging.getLogger("convert_game_logs")
+
+# Keys of a loaded log that are not trailer stats
+_LOG_KEYS = {"game_id", "game_configuration", "rounds", "status"}
+
+
+def _is_current(path: str) -> bool:
+    if not path.endswith(".jsonl"):
+        return False
+    with open(path) as f:
+        header = json.loads(f.readline() or "{}")
+    return header.get("version") == LOG_VERSION
+
+
+def convert_file(path: str, dry_run: bool = False) -> tuple[int, int] | None:
+    """Rewrite one log as v2 JSONL; returns (old_bytes, new_bytes), or None if already current."""
+    if _is_current(path):
+        return None
+    log = load_log(path)
+    game_id = log.get("game_id") or game_id_from_path(path)
+    out = os.path.join(os.path.dirname(path), f"{LOG_PREFIX}{game_id}.jsonl")
+    tmp = out + ".part"
+
+    writer = GameLogWriter(tmp)
+    writer.rewrite({**log, "game_id": game_id})
+    rounds = log.get("rounds", [])
+    if log.get("status") == "finished":
+        stats = {k: v for k, v in log.items() if k not in _LOG_KEYS}
+        writer.trailer(rounds[-1].get("current_scores", {}) if rounds else {}, len(rounds), stats)
+
+    sizes = os.path.getsize(path), os.path.getsize(tmp)
+    if dry_run:
+        os.remove(tmp)
+    else:
+        os.replace(tmp, out)
+        if out != path:
+            os.remove(path)
+    return sizes
+
+
+def convert_firestore() -> int:
+    from core.firebase_store import is_available, list_games, save_game
+
+    if not is_available():
+        logger.warning("Firestore is not configured; skipping")
+        return 0
+    converted = 0
+    for log in list_games():  # readers hand back v1; store the compact form
+        if log.get("game_id"):
+            save_game(log["game_id"], compact_log(log))
+            converted += 1
+    return converted
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--logs-dir", default=os.getenv("GAME_LOGS_DIR", "game_logs"))
+    p.add_argument("--dry-run", action="store_true", help="Report the size savings without replacing any file")
+    p.add_argument("--firestore", action="store_true", help="Also rewrite Firestore game documents in the compact schema")
+    args = p.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    converted = skipped = failed = 0
+    before = after = 0
+    for path in sorted(log_paths(args.logs_dir)):
+        try:
+            sizes = convert_file(path, dry_run=args.dry_run)
+        except Exception as exc:
+            logger.warning("Could not convert %s: %s", path, exc)
+            failed += 1
+            continue
+        if sizes is None:
+            skipped += 1
+            continue
+        converted += 1
+        before += sizes[0]
+        after += sizes[1]
+
+    verb = "Would convert" if args.dry_run else "Converted"
+    print(f"{verb} {converted} logs ({skipped} already current, {failed} failed)")
+    if converted:
+        print(f"Size: {before / 1e6:.2f} MB -> {after / 1e6:.2f} MB ({after / before:.0%})")
+    if args.firestore and not args.dry_run:
+        print(f"Rewrote {convert_firestore()} Firestore documents")
+
+
+if __name__ == "__main__":
+    main()
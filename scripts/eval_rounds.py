@@ -0,0 +1,86 @@
+"""
+Screen models on rounds already played, without running full games.
+
+Usage:
+    PYTHONPATH=src python scripts/eval_rounds.py --models openai/gpt-4o-mini google/gemini-2.5-flash
+    PYTHONPATH=src python scripts/eval_rounds.py --task clue --models qwen/qwen-vl-plus \\
+        --judges openai/gpt-4o-mini anthropic/claude-haiku-4.5 --limit 200 --max-concurrent-requests 64
+
+Logged rounds from finished games in --logs-dir are replayed (see
+core.round_eval).  With --task vote each model only votes on the logged
+clue and table; with --task clue it only writes a clue for the logged
+storyteller card, which the --judges then vote on.  Responses are cached,
+so repeated screening runs only pay for new calls.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from core.concurrency import ConcurrencyBudget
+from core.round_eval import TASKS, evaluate_models, logged_rounds
+from core.tournament import parse_provider_limits
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--models", nargs="+", required=True, help="Models to evaluate")
+    p.add_argument("--task", choices=TASKS, default="vote")
+    p.add_argument("--judges", nargs="+", help="Models that vote on generated clues (--task clue)")
+    p.add_argument("--logs-dir", default=os.getenv("GAME_LOGS_DIR", "game_logs"))
+    p.add_argument("--limit", type=int, help="Evaluate a random sample of this many rounds")
+    p.add_argument("--seed", type=int, default=0, help="Seed for the --limit sample")
+    p.add_argument("--prompt-style", default="creative")
+    p.add_argument("--no-cache", action="store_true", help="Disable response cache")
+    p.add_argument("--max-concurrent-requests", type=int, default=32, help="Global cap on in-flight vision requests")
+    p.add_argument(
+        "--provider-limit",
+        action="append",
+        metavar="PROVIDER=N",
+        help="Per-provider cap on in-flight requests (repeatable), e.g. openai=8",
+    )
+    p.add_argument("--out", help="Also write the reports to this JSON file")
+    args = p.parse_args()
+    if args.task == "clue" and not args.judges:
+        p.error("--task clue needs --judges")
+    return args
+
+
+async def main() -> None:
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    rounds = logged_rounds(args.logs_dir, args.limit, args.seed)
+    if not rounds:
+        print(f"No complete rounds found in {args.logs_dir}")
+        sys.exit(1)
+    logging.info("Evaluating %d models on %d logged rounds (%s task)", len(args.models), len(rounds), args.task)
+
+    reports = await evaluate_models(
+        args.models, rounds, args.task, judges=args.judges, prompt_style=args.prompt_style,
+        concurrency=ConcurrencyBudget(args.max_concurrent_requests, parse_provider_limits(args.provider_limit)),
+        use_cache=not args.no_cache,
+    )
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(reports, f, indent=2)
+        print(f"Reports written to {args.out}")
+    metric = "accuracy" if args.task == "vote" else "judge_accuracy"
+    print(f"\n{'model':<40} {'rounds':>7} {'errors':>7} {metric:>15}")
+    for r in sorted(reports, key=lambda r: -(r[metric] or 0)):
+        value = "n/a" if r[metric] is None else f"{r[metric]:.1%}"
+        print(f"{r['model']:<40} {r['rounds']:>7} {r['errors']:>7} {value:>15}")
+    if args.task == "vote" and reports:
+        print(f"\nchance {reports[0]['chance']:.1%}, original voters {reports[0]['logged_voter_accuracy'] or 0:.1%}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,61 @@
+"""
+Bulk (re)compress game logs on disk.
+
+Usage:
+    PYTHONPATH=src python scripts/recompress_game_logs.py --codec zstd
+    PYTHONPATH=src python scripts/recompress_game_logs.py --codec gzip --level 6 --logs-dir other/dir
+    PYTHONPATH=src python scripts/recompress_game_logs.py --codec none     # decompress everything
+
+Every finished log (JSONL or legacy JSON, in any codec) is re-encoded with
+``--codec`` and the original removed.  Logs of games still in progress are
+skipped — they must stay plain JSONL while rounds are being appended.
+Readers handle every codec, so this can run while the API is serving.
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from core.game_log import compress_file, log_codec, log_paths, read_summary
+
+logger = logging.getLogger("recompress_game_logs")
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--codec", required=True, choices=["none", "gzip", "zstd"])
+    p.add_argument("--level", type=int, help="Compression level (default: gzip 9, zstd 3)")
+    p.add_argument("--logs-dir", default=os.getenv("GAME_LOGS_DIR", "game_logs"))
+    args = p.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    codec = log_codec(args.codec)
+
+    done = running = failed = 0
+    before = after = 0
+    for path in sorted(log_paths(args.logs_dir)):
+        try:
+            if read_summary(path).get("status") != "finished":
+                running += 1
+                continue
+            size = os.path.getsize(path)
+            new_path = compress_file(path, codec, args.level)
+        except Exception as exc:
+            logger.warning("Could not recompress %s: %s", path, exc)
+            failed += 1
+            continue
+        done += 1
+        before += size
+        after += os.path.getsize(new_path)
+
+    print(f"Recompressed {done} logs as {codec or 'plain'} ({running} in progress skipped, {failed} failed)")
+    if done:
+        print(f"Size: {before / 1e6:.2f} MB -> {after / 1e6:.2f} MB ({after / before:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,15 +3,31 @@ Run Dixit games from a JSON run-configuration file.
 
 Usage:
     PYTHONPATH=src python scripts/run_from_config.py path/to/runs.json
+    PYTHONPATH=src python scripts/run_from_config.py runs.json --max-concurrent-games 8 \
+        --provider-limit openai=16 --provider-limit anthropic=8
+    PYTHONPATH=src python scripts/run_from_config.py --resume game_logs/tournaments/<id>.json
+    PYTHONPATH=src python scripts/run_from_config.py runs.json --dry-run --max-concurrent-requests 16
+
+Trials run concurrently through core.tournament; progress is written to a
+state file after every trial, so an interrupted run can be resumed and will
+skip the trials already completed.
 
 Config file schema (JSON):
 {
+  "budget": {"cost": 25.0, "requests": 20000},  // optional, caps the whole run (see core.budget)
   "defaults": {                  // optional, merged into each run
     "cards": "data/1_full",
     "max_rounds": 10,
     "score_to_win": 30,
     "use_cache": true,
-    "prompt_style": "creative"
+    "prompt_style": "creative",
+    "phase_timeouts": {"pick": 60, "vote": 60},   // optional, seconds
+    "round_timeout": 180,                         // optional, seconds
+    "timeout_fill": "default",                    // or "best"
+    "speculative_clues": 2,                       // optional, pre-generate next storyteller clues
+    "speculation_budget": 10,                     // optional, max unused speculative calls per game
+    "seed": 42,                                   // optional, trial t of a run plays with seed + t
+    "budget": {"requests": 400, "on_exhausted": "stop"}   // optional, caps each game
   },
   "runs": [
     {
@@ -38,7 +54,20 @@ Config file schema (JSON):
   ]
 }
 
-Per-player `prompt_style` overrides the run-level style.
+Per-player `prompt_style` overrides the run-level style.  With a `seed`,
+rerunning the same config deals the same cards and replays the same calls,
+which the response cache then serves.
+
+`--dry-run` plays nothing: it prints the expected requests per phase and
+player, the clue requests the response cache will serve, and the tokens,
+spend and wall time predicted from the recorded per-model call history
+(call_history.db) under the given concurrency settings (see core.estimate).
+With `--resume` it covers the trials not yet done.
+
+When a budget runs out, the games it covers stop after their last completed
+round (or, with "on_exhausted": "degrade", play on without requests); the
+run summary and state file record the final budget status, and `--resume`
+continues once the budget is raised.
 """
 from __future__ import annotations
 
@@ -46,74 +75,120 @@ import argparse
 import asyncio
 import json
 import logging
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
-from core.game import play_game
+from core.concurrency import ConcurrencyBudget
+from core.estimate import estimate_trials
+from core.tournament import Tournament, parse_provider_limits, trials_from_config
 
 
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
-    p.add_argument("config", help="Path to JSON run-configuration file")
+    p.add_argument("config", nargs="?", help="Path to JSON run-configuration file")
     p.add_argument("--continue-on-error", action="store_true", help="Don't abort on a failed trial")
-    return p.parse_args()
-
-
-def merge(defaults: dict, run: dict) -> dict:
-    merged = {**defaults, **run}
-    return merged
-
-
-async def run_trial(run: dict, trial_idx: int) -> dict:
-    game_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{run.get('name', 'run')}_{trial_idx:02d}"
-    return await play_game(
-        image_directory=run["cards"],
-        players=run["players"],
-        prompt_style=run.get("prompt_style", "creative"),
-        max_rounds=run.get("max_rounds", 10),
-        score_to_win=run.get("score_to_win", 30),
-        use_cache=run.get("use_cache", True),
-        game_id=game_id,
+    p.add_argument("--max-concurrent-games", type=int, default=4)
+    p.add_argument("--max-concurrent-requests", type=int, help="Global cap on in-flight vision requests")
+    p.add_argument(
+        "--provider-limit",
+        action="append",
+        metavar="PROVIDER=N",
+        help="Per-provider cap on in-flight requests (repeatable), e.g. openai=8",
     )
+    p.add_argument("--resume", metavar="STATE_FILE", help="Resume a tournament from its state file")
+    p.add_argument("--budget-requests", type=int, help="Cap on requests for the whole run (retries count)")
+    p.add_argument("--budget-tokens", type=int, help="Cap on prompt + completion tokens for the whole run")
+    p.add_argument("--budget-cost", type=float, help="Cap on estimated cost (USD) for the whole run")
+    p.add_argument("--dry-run", action="store_true", help="Estimate requests, spend and wall time; run nothing")
+    args = p.parse_args()
+    if not args.config and not args.resume:
+        p.error("a config file or --resume STATE_FILE is required")
+    return args
+
+
+def _fmt(value, spec: str = ",.0f") -> str:
+    return "?" if value is None else format(value, spec)
+
+
+def print_estimate(est: dict) -> None:
+    print(f"\n=== Dry run: {est['trials']} games, ~{est['expected_rounds']} rounds each ===")
+    print(f"{'run':20s} {'player':24s} {'model':32s} {'clue':>7s} {'cached':>7s} {'pick':>7s} {'vote':>7s} {'cost $':>8s}")
+    for p in est["players"]:
+        print(
+            f"{p['run'][:20]:20s} {p['player'][:24]:24s} {p['model'][:32]:32s} {p['clue']:7.1f} "
+            f"{p['clue_cache_hits']:7.1f} {p['pick']:7.1f} {p['vote']:7.1f} {_fmt(p['cost'], '8.2f'):>8s}"
+        )
+    req = est["requests"]
+    print(
+        f"\nRequests: ~{req['total']:,.0f} (clue {req['clue']:,.0f}, pick {req['pick']:,.0f}, vote {req['vote']:,.0f}); "
+        f"at most {est['requests_max']:,} if every game plays all its rounds"
+    )
+    if est["speculative_max"]:
+        print(f"Speculative clues: up to {est['speculative_max']:,} extra requests")
+    print(f"Clue requests served by the cache: ~{est['clue_cache_hits']:,.0f}")
+    print(f"Tokens: ~{_fmt(est['prompt_tokens'])} prompt, ~{_fmt(est['completion_tokens'])} completion")
+    cost = _fmt(est["cost"], ",.2f")
+    if est["unpriced_models"]:
+        cost += f" (no cost history for {', '.join(est['unpriced_models'])})"
+    print(f"Spend: ~${cost}")
+    print(f"Wall time: ~{est['wall_time_s'] / 60:,.1f} min (bottleneck: {est['bottleneck']})")
+    if est["no_history_models"]:
+        print(f"No call history for {', '.join(est['no_history_models'])}: default latencies assumed")
+    for warning in est["warnings"]:
+        print(f"Warning: {warning}")
 
 
 async def main() -> None:
     args = parse_args()
     logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
 
-    with open(args.config) as f:
-        cfg = json.load(f)
-    defaults = cfg.get("defaults", {})
-    runs = cfg["runs"]
-
-    summary: list[dict] = []
-    for run in runs:
-        merged = merge(defaults, run)
-        trials = merged.get("trials", 1)
-        name = merged.get("name", "unnamed")
-        logging.info("=== Run '%s' (%d trials) ===", name, trials)
-        for t in range(trials):
-            try:
-                log = await run_trial(merged, t)
-                final = log["rounds"][-1]["current_scores"] if log["rounds"] else {}
-                summary.append({"run": name, "trial": t, "game_id": log["game_id"], "final_scores": final})
-                logging.info("  trial %d done: %s", t, final)
-            except Exception as exc:
-                logging.exception("  trial %d FAILED: %s", t, exc)
-                summary.append({"run": name, "trial": t, "error": str(exc)})
-                if not args.continue_on_error:
-                    raise
-
-    out_path = Path("game_logs") / f"run_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    overrides = {
+        k: v for k, v in
+        (("requests", args.budget_requests), ("tokens", args.budget_tokens), ("cost", args.budget_cost))
+        if v is not None
+    }
+    if args.resume:
+        tour = Tournament.resume(args.resume)
+        if overrides:
+            tour.set_budget({**(tour.budget or {}), **overrides})
+    else:
+        with open(args.config) as f:
+            cfg = json.load(f)
+        budget = cfg.get("budget")
+        tour = Tournament(
+            trials_from_config(cfg),
+            max_concurrent_games=args.max_concurrent_games,
+            concurrency=ConcurrencyBudget(args.max_concurrent_requests, parse_provider_limits(args.provider_limit)),
+            stop_on_error=not args.continue_on_error,
+            budget={**(budget or {}), **overrides} if budget or overrides else None,
+        )
+    if args.dry_run:
+        print_estimate(estimate_trials(tour.trials, tour.max_concurrent_games, tour.concurrency))
+        return
+    logging.info("Tournament %s: %d trials, state file %s", tour.tournament_id, len(tour.trials), tour.state_path)
+
+    summary = await tour.run()
+    budget = tour.spend.status()
+
+    out_path = Path(os.getenv("GAME_LOGS_DIR", "game_logs")) / f"run_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
     out_path.parent.mkdir(exist_ok=True)
     with open(out_path, "w") as f:
-        json.dump(summary, f, indent=2)
+        json.dump({"tournament_id": tour.tournament_id, "status": tour.status, "budget": budget, "trials": summary}, f, indent=2)
     print(f"\nSummary written to {out_path}")
     for s in summary:
         print(s)
+    spent = budget["spent"]
+    print(f"\nSpend: {spent['requests']} requests, {spent['tokens']} tokens, ${spent['cost']:.4f}"
+          + (f" ({spent['unpriced']} requests unpriced)" if spent["unpriced"] else ""))
+    if budget["status"] != "ok":
+        print(f"Budget {budget['status']}: {'; '.join(budget.get('exhausted') or list(budget.get('degraded', {}).values()))}")
+    if tour.status != "completed":
+        print(f"\nTournament {tour.status}; resume with --resume {tour.state_path}")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -12,7 +12,15 @@ Usage:
 
 `--cards` may be a local directory or a Firebase Storage collection name.
 Each game randomly samples `--players-per-game` models from `--models`
-and a prompt style from `--prompt-styles`.
+and a prompt style from `--prompt-styles`.  Lineups are sampled up front
+(reproducibly with `--seed`) and the games run concurrently through
+core.tournament; `--resume STATE_FILE` continues an interrupted run.
+
+With `--active`, lineups are chosen adaptively instead (core.matchmaking):
+each batch of games goes where model ratings are least certain, the run
+stops once neighbouring models in the ranking are ordered with
+`--confidence` (or after `--num-games`), and the report estimates the games
+and API calls saved versus uniform sampling.
 """
 from __future__ import annotations
 
@@ -21,23 +29,23 @@ import asyncio
 import logging
 import random
 import sys
-from datetime import datetime
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
-from core.game import play_game
+from core.concurrency import ConcurrencyBudget
+from core.matchmaking import new_active_tournament, run_active
+from core.tournament import Tournament, parse_provider_limits, random_trials
 
 
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
-    p.add_argument("--cards", required=True, help="Local image dir or Firebase collection name")
-    p.add_argument("--num-games", type=int, default=5)
+    p.add_argument("--cards", help="Local image dir or Firebase collection name")
+    p.add_argument("--num-games", type=int, default=5, help="Games to play (with --active: at most)")
     p.add_argument("--players-per-game", type=int, default=4)
     p.add_argument(
         "--models",
         nargs="+",
-        required=True,
         help="Pool of model identifiers (e.g. openai/gpt-4o anthropic/claude-3-5-sonnet)",
     )
     p.add_argument(
@@ -49,29 +57,25 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--max-rounds", type=int, default=10)
     p.add_argument("--score-to-win", type=int, default=30)
     p.add_argument("--no-cache", action="store_true", help="Disable response cache")
-    p.add_argument("--seed", type=int, help="Random seed for reproducibility")
-    return p.parse_args()
-
-
-async def run_one_game(idx: int, args: argparse.Namespace) -> dict:
-    if args.players_per_game > len(args.models):
-        raise ValueError(
-            f"--players-per-game ({args.players_per_game}) > number of --models ({len(args.models)})"
-        )
-    chosen_models = random.sample(args.models, args.players_per_game)
-    style = random.choice(args.prompt_styles)
-    players = [{"model": m} for m in chosen_models]
-    game_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{idx:03d}"
-    logging.info("[Game %d/%d] id=%s style=%s models=%s", idx + 1, args.num_games, game_id, style, chosen_models)
-    return await play_game(
-        image_directory=args.cards,
-        players=players,
-        prompt_style=style,
-        max_rounds=args.max_rounds,
-        score_to_win=args.score_to_win,
-        use_cache=not args.no_cache,
-        game_id=game_id,
+    p.add_argument("--seed", type=int, help="Random seed for reproducibility (lineups, and game i plays with seed + i)")
+    p.add_argument("--max-concurrent-games", type=int, default=4)
+    p.add_argument("--max-concurrent-requests", type=int, help="Global cap on in-flight vision requests")
+    p.add_argument(
+        "--provider-limit",
+        action="append",
+        metavar="PROVIDER=N",
+        help="Per-provider cap on in-flight requests (repeatable), e.g. openai=8",
     )
+    p.add_argument("--active", action="store_true", help="Pick lineups adaptively until the ranking is confident")
+    p.add_argument("--confidence", type=float, default=0.9, help="With --active: target P(order) for neighbouring models")
+    p.add_argument("--budget-requests", type=int, help="Cap on requests for the whole run (retries count)")
+    p.add_argument("--budget-tokens", type=int, help="Cap on prompt + completion tokens for the whole run")
+    p.add_argument("--budget-cost", type=float, help="Cap on estimated cost (USD) for the whole run")
+    p.add_argument("--resume", metavar="STATE_FILE", help="Resume a tournament from its state file")
+    args = p.parse_args()
+    if not args.resume and (not args.cards or not args.models):
+        p.error("--cards and --models are required unless --resume is given")
+    return args
 
 
 async def main() -> None:
@@ -80,20 +84,70 @@ async def main() -> None:
     if args.seed is not None:
         random.seed(args.seed)
 
-    summary = []
-    for i in range(args.num_games):
-        try:
-            log = await run_one_game(i, args)
-            winner = max(log["game_configuration"]["players"], key=lambda p: 0)  # placeholder
-            final = log["rounds"][-1]["current_scores"] if log["rounds"] else {}
-            summary.append({"game_id": log["game_id"], "final_scores": final})
-        except Exception as exc:
-            logging.exception("Game %d failed: %s", i + 1, exc)
-            summary.append({"game_id": f"game_{i}", "error": str(exc)})
+    concurrency = ConcurrencyBudget(args.max_concurrent_requests, parse_provider_limits(args.provider_limit))
+    game_kwargs = {"max_rounds": args.max_rounds, "score_to_win": args.score_to_win, "use_cache": not args.no_cache}
+    budget = {
+        k: v for k, v in
+        (("requests", args.budget_requests), ("tokens", args.budget_tokens), ("cost", args.budget_cost))
+        if v is not None
+    } or None
+    if args.resume:
+        tour = Tournament.resume(args.resume)
+        if budget:
+            tour.set_budget({**(tour.budget or {}), **budget})
+    elif args.active:
+        tour = new_active_tournament(
+            args.models,
+            args.players_per_game,
+            args.cards,
+            args.prompt_styles,
+            confidence=args.confidence,
+            max_games=args.num_games,
+            seed=args.seed,
+            game_kwargs=game_kwargs,
+            max_concurrent_games=args.max_concurrent_games,
+            concurrency=concurrency,
+            budget=budget,
+        )
+    else:
+        trials = random_trials(
+            args.cards,
+            args.num_games,
+            args.players_per_game,
+            args.models,
+            args.prompt_styles,
+            seed=args.seed,
+            **game_kwargs,
+        )
+        tour = Tournament(trials, max_concurrent_games=args.max_concurrent_games, concurrency=concurrency, budget=budget)
+    logging.info("Tournament %s: %d games, state file %s", tour.tournament_id, len(tour.trials), tour.state_path)
+
+    if tour.matchmaking is not None:
+        report = await run_active(tour)
+        summary = tour.summary()
+    else:
+        report = None
+        summary = await tour.run()
 
     print("\n=== Summary ===")
     for s in summary:
         print(s)
+    if report is not None:
+        print("\n=== Ranking ===")
+        for r in report["ranking"]:
+            print(f"{r['model']:40s} mu={r['mu']:6.2f} sigma={r['sigma']:5.2f} games={r['games']}")
+        if report["converged"]:
+            cmp = report["uniform_comparison"]
+            print(
+                f"\nConfident ranking after {report['games']} games; uniform sampling would need "
+                f"~{cmp['uniform_games']:.0f} (saved ~{report['games_saved']:.0f} games, ~{report['calls_saved']} calls)"
+            )
+        else:
+            print(f"\nStopped after {report['games']} games without reaching {report['confidence']:.0%} confidence")
+    spent = tour.spend.status()["spent"]
+    print(f"\nSpend: {spent['requests']} requests, {spent['tokens']} tokens, ${spent['cost']:.4f}")
+    if tour.status != "completed":
+        print(f"\nTournament {tour.status}; resume with --resume {tour.state_path}")
 
 
 if __name__ == "__main__":
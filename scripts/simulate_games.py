@@ -0,0 +1,90 @@
+"""
+Simulate Dixit games headlessly with scripted agents (see core.simulate).
+
+Usage:
+    PYTHONPATH=src python scripts/simulate_games.py --agents oracle:0.6 random random random
+    PYTHONPATH=src python scripts/simulate_games.py --agents random random random --num-games 1000000 \\
+        --max-rounds 12 --score-to-win 40 --workers 8 --seed 1
+
+No models are called: games run on the core.rules state machine with
+integer cards, so this measures the rules themselves — win rates, scores and
+game lengths for a rule/agent mix — at about ten thousand games per second
+per worker process (without move validation; --validate checks every move
+on core.rules, at about a third of the speed); --workers splits a run across
+cores.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from core.rules import HAND_SIZE
+from core.simulate import DECK_SIZE, make_agent, simulate
+
+
+def _run_chunk(specs: list[str], num_games: int, seed: int, game_kwargs: dict, validate: bool = False):
+    return simulate([make_agent(s) for s in specs], num_games, seed=seed, validate=validate, **game_kwargs)
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--agents", nargs="+", required=True, help="Agent specs, one per seat (random, oracle:<p>)")
+    p.add_argument("--num-games", type=int, default=100_000)
+    p.add_argument("--max-rounds", type=int, default=10)
+    p.add_argument("--score-to-win", type=int, default=30)
+    p.add_argument("--deck-size", type=int, default=DECK_SIZE)
+    p.add_argument("--hand-size", type=int, default=HAND_SIZE)
+    p.add_argument("--seed", type=int, help="Random seed for reproducibility")
+    p.add_argument("--workers", type=int, default=1, help="Worker processes to split the games across")
+    p.add_argument("--validate", action="store_true", help="Check every move against core.rules (slower)")
+    p.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    args = p.parse_args()
+    try:
+        for spec in args.agents:
+            make_agent(spec)
+    except ValueError as exc:
+        p.error(str(exc))
+    if len(args.agents) < 3:
+        p.error("Dixit needs at least 3 players")
+
+    game_kwargs = dict(
+        max_rounds=args.max_rounds, score_to_win=args.score_to_win,
+        deck_size=args.deck_size, hand_size=args.hand_size,
+    )
+    seed = args.seed if args.seed is not None else random.randrange(2**32)
+    workers = max(1, min(args.workers, args.num_games))
+    chunks = [args.num_games // workers + (i < args.num_games % workers) for i in range(workers)]
+
+    start = time.perf_counter()
+    if workers == 1:
+        summary = _run_chunk(args.agents, args.num_games, seed, game_kwargs, args.validate)
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            parts = list(pool.map(_run_chunk, [args.agents] * workers, chunks,
+                                  [seed + i for i in range(workers)], [game_kwargs] * workers,
+                                  [args.validate] * workers))
+        summary = parts[0]
+        for part in parts[1:]:
+            summary.merge(part)
+    summary.seconds = time.perf_counter() - start
+
+    result = summary.to_dict()
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+    print(f"{result['games']} games in {summary.seconds:.2f}s ({result['games_per_second']} games/s, "
+          f"{result['mean_rounds']} rounds on average, seed {seed})")
+    print(f"\n{'agent':<16} {'win rate':>9} {'mean score':>11}")
+    for row in result["agents"]:
+        print(f"{row['agent']:<16} {row['win_rate']:>9.1%} {row['mean_score']:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
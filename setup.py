@@ -12,6 +12,8 @@ setup(
         "httpx>=0.27.0",
         "python-dotenv>=1.0.0",
         "pydantic>=2.0.0",
+        # Monte Carlo leaderboard baselines (core.baselines)
+        "numpy>=1.24.0",
         # Direct provider fallbacks
         "anthropic>=0.25.0",
         "openai>=1.30.0",
@@ -20,5 +22,9 @@ setup(
         # Firebase storage backend (optional — falls back to local JSON if not installed)
         "firebase-admin>=6.0.0",
     ],
+    extras_require={
+        # zstd-compressed game logs (GAME_LOG_COMPRESSION=zstd); gzip is used without it
+        "zstd": ["zstandard>=0.22.0"],
+    },
     python_requires=">=3.11",
 )
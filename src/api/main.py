@@ -24,6 +24,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 from api.routes.collections import router as collections_router
 from api.routes.games import router as games_router
 from api.routes.leaderboard import router as leaderboard_router
+from api.routes.tournaments import router as tournaments_router
 from api.routes.ws import router as ws_router
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
@@ -45,8 +46,26 @@ app.add_middleware(
 app.include_router(collections_router)
 app.include_router(games_router)
 app.include_router(leaderboard_router)
+app.include_router(tournaments_router)
 app.include_router(ws_router)
 
+@app.on_event("startup")
+async def _start_game_jobs() -> None:
+    # Resumes games interrupted by the last shutdown and starts queued ones
+    from api.events import bus
+    from core.jobs import get_job_queue
+    get_job_queue().start(bus)
+
+
+@app.on_event("shutdown")
+def _stop_game_workers() -> None:
+    from core.jobs import get_job_queue
+    from core.workers import get_pool, worker_count
+    get_job_queue().stop()
+    if worker_count():
+        get_pool().shutdown()
+
+
 # Serve card images from data/ directory
 DATA_DIR = os.getenv("DATA_DIR", "data")
 
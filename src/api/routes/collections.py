@@ -10,8 +10,6 @@ POST /api/collections/{name}/upload            — upload images via multipart f
 GET  /api/collections/{name}/cards/{filename}/stats  — per-card game stats
 """
 
-import glob
-import json
 import logging
 import os
 from pathlib import Path
@@ -20,6 +18,9 @@ from fastapi import APIRouter, HTTPException, UploadFile, File, Form
 from fastapi.responses import JSONResponse
 from typing import List
 
+from core.game_log import iter_logs
+from core.manifest import get_manifests
+
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api")
 
@@ -32,32 +33,8 @@ DATA_DIR = os.getenv("DATA_DIR", "data")
 # ---------------------------------------------------------------------------
 
 def _local_collections() -> list[dict]:
-    """Discover local image directories under DATA_DIR."""
-    results = []
-    try:
-        for entry in sorted(Path(DATA_DIR).iterdir()):
-            if not entry.is_dir():
-                continue
-            images = [
-                f for f in entry.iterdir()
-                if f.suffix.lower() in {".jpg", ".jpeg", ".png"}
-            ]
-            if not images:
-                continue
-            cards = [
-                {"filename": f.name, "url": f"/api/images/{entry.name}/{f.name}"}
-                for f in sorted(images)
-            ]
-            results.append({
-                "name": entry.name,
-                "display_name": entry.name,
-                "source": "local",
-                "image_count": len(images),
-                "cards": cards,
-            })
-    except Exception as exc:
-        logger.warning("Could not scan local collections: %s", exc)
-    return results
+    """Image directories under DATA_DIR, from the shared manifest cache."""
+    return [m.to_collection() for m in get_manifests().local_collections()]
 
 
 def _all_game_logs() -> list[dict]:
@@ -68,14 +45,7 @@ def _all_game_logs() -> list[dict]:
         if docs:
             return docs
     # Local fallback
-    logs = []
-    for path in glob.glob(os.path.join(GAME_LOGS_DIR, "dixit_game_log_*.json")):
-        try:
-            with open(path) as f:
-                logs.append(json.load(f))
-        except Exception:
-            pass
-    return logs
+    return list(iter_logs(GAME_LOGS_DIR))
 
 
 def _card_key(image_path: str) -> str:
@@ -183,7 +153,7 @@ def _compute_card_stats(collection_name: str, filename: str, logs: list[dict]) -
 @router.get("/collections")
 async def list_collections():
     """List all available image collections (local dirs + Firebase Storage)."""
-    from core.firebase_storage import list_collections as fb_list, is_available as storage_ok
+    from core.firebase_storage import is_available as storage_ok
 
     collections = {}
 
@@ -193,10 +163,8 @@ async def list_collections():
 
     # Firebase (overrides local entry if same name, adding source=firebase)
     if storage_ok():
-        for col in fb_list():
-            name = col.get("name", "")
-            col["source"] = "firebase"
-            collections[name] = col
+        for manifest in get_manifests().remote_collections():
+            collections[manifest.name] = manifest.to_collection()
 
     return list(collections.values())
 
@@ -204,31 +172,18 @@ async def list_collections():
 @router.get("/collections/{name}")
 async def get_collection(name: str):
     """Return metadata + card list for a collection."""
-    from core.firebase_storage import get_collection as fb_get, is_available as storage_ok
+    from core.firebase_storage import is_available as storage_ok
 
+    manifests = get_manifests()
     if storage_ok():
-        meta = fb_get(name)
-        if meta:
-            meta["source"] = "firebase"
-            return meta
+        manifest = manifests.remote(name)
+        if manifest:
+            return manifest.to_collection()
 
     # Local fallback
     local_path = os.path.join(DATA_DIR, name)
     if os.path.isdir(local_path):
-        images = sorted(
-            f for f in Path(local_path).iterdir()
-            if f.suffix.lower() in {".jpg", ".jpeg", ".png"}
-        )
-        return {
-            "name": name,
-            "display_name": name,
-            "source": "local",
-            "image_count": len(images),
-            "cards": [
-                {"filename": f.name, "url": f"/api/images/{name}/{f.name}"}
-                for f in images
-            ],
-        }
+        return manifests.local(local_path).to_collection()
 
     raise HTTPException(status_code=404, detail=f"Collection '{name}' not found")
 
@@ -239,6 +194,7 @@ async def delete_collection(name: str):
     if not storage_ok():
         raise HTTPException(status_code=503, detail="Firebase Storage not configured")
     deleted = fb_delete(name)
+    get_manifests().invalidate(name)
     return {"deleted_blobs": deleted, "collection": name}
 
 
@@ -289,6 +245,7 @@ async def upload_collection(
     col = _col()
     if col:
         col.document(name).set(metadata)
+    get_manifests().invalidate(name)
 
     return metadata
 
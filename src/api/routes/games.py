@@ -2,27 +2,35 @@ from __future__ import annotations
 """
 Game management routes.
 
-POST /api/games        — start a new game (runs in background)
-GET  /api/games        — list all finished game logs
-GET  /api/games/{id}   — full log for a specific game
+POST   /api/games        — queue a new game (see core.jobs; it runs in the
+                           background, or in a worker process when
+                           GAME_WORKERS > 0 — see core.workers)
+GET    /api/games        — list all finished game logs
+GET    /api/games/{id}   — full log for a specific game
+DELETE /api/games/{id}   — cancel a queued or running game (API tournament games too)
+GET    /api/games/{id}/tail?after=N — rounds after N of a running (or finished) game
+POST   /api/games/{id}/resume — continue an interrupted game from its last checkpoint
+GET    /api/jobs?status=  — queued / running / finished game jobs
 GET  /api/prompt-styles — list available prompt styles
 """
 
-import glob
 import json
 import logging
 import os
 
 import httpx
 from typing import Optional, List
-from fastapi import APIRouter, BackgroundTasks, HTTPException
+from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
 from api.events import bus
 from core.firebase_store import get_game as fb_get_game, list_games as fb_list_games, is_available as fb_available, clear_all_games as fb_clear_all
-from core.game import play_game
+from core.checkpoint import load_checkpoint
+from core.game_log import find_log, game_id_from_path, load_log, log_paths, read_summary, tail_log
 from core.model_filter import is_vision_chat
+from core.jobs import JOB_STATUSES, JobQueue, get_job_queue
 from core.prompts import PROMPT_STYLES
+from core.tournament import cancel_game as cancel_tournament_game
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api")
@@ -48,6 +56,14 @@ class StartGameRequest(BaseModel):
     score_to_win: int = 30
     use_cache: bool = True
     image_directory: str = "data/1_full"
+    phase_timeouts: Optional[dict[str, float]] = None  # {"clue"|"pick"|"vote": seconds}
+    round_timeout: Optional[float] = None
+    timeout_fill: str = "default"
+    speculative_clues: int = 0
+    speculation_budget: Optional[int] = None
+    seed: Optional[int] = None  # same seed + models = same deal and calls (cache hits on reruns)
+    budget: Optional[dict] = None  # per-game spend limits (see core.budget)
+    priority: int = 0  # higher starts first when MAX_CONCURRENT_GAMES are already running
 
 
 class StartGameResponse(BaseModel):
@@ -60,9 +76,15 @@ class StartGameResponse(BaseModel):
 # Helpers
 # ---------------------------------------------------------------------------
 
+def _job_queue() -> JobQueue:
+    """The queue games are started through (dispatching from first use, or from app startup)."""
+    queue = get_job_queue()
+    queue.start(bus)
+    return queue
+
+
 def _load_log(path: str) -> dict:
-    with open(path) as f:
-        return json.load(f)
+    return load_log(path)
 
 
 def _summarise(log: dict, game_id: str | None = None) -> dict:
@@ -80,22 +102,21 @@ def _summarise(log: dict, game_id: str | None = None) -> dict:
         "prompt_style_name": cfg.get("prompt_style_name", ""),
         "players": [p.get("name") for p in players_cfg],
         "models": [p.get("model") for p in players_cfg],
-        "rounds_played": len(rounds),
+        "rounds_played": log.get("rounds_total", len(rounds)),
         "max_rounds": cfg.get("max_rounds", game_params.get("max_number_of_rounds", 10)),
         "winner": winner,
         "final_scores": final_scores,
+        "status": log.get("status", "finished"),
     }
 
 
 def _list_logs_local() -> list[dict]:
-    """Fallback: read game summaries from local JSON files."""
-    pattern = os.path.join(GAME_LOGS_DIR, "dixit_game_log_*.json")
+    """Fallback: read game summaries from local log files (header + last round only)."""
     logs = []
-    for path in sorted(glob.glob(pattern), reverse=True):
+    for path in sorted(log_paths(GAME_LOGS_DIR), key=game_id_from_path, reverse=True):
         try:
-            log = _load_log(path)
-            fname = os.path.basename(path)
-            game_id = log.get("game_id") or fname.replace("dixit_game_log_", "").replace(".json", "")
+            log = read_summary(path)
+            game_id = log.get("game_id") or game_id_from_path(path)
             logs.append(_summarise(log, game_id))
         except Exception as exc:
             logger.warning("Could not read log %s: %s", path, exc)
@@ -222,10 +243,9 @@ async def delete_all_games():
     # Clear Firestore
     deleted_fb = fb_clear_all() if fb_available() else 0
 
-    # Clear local JSON logs
-    import glob as _glob
+    # Clear local logs
     deleted_local = 0
-    for path in _glob.glob(os.path.join(GAME_LOGS_DIR, "dixit_game_log_*.json")):
+    for path in log_paths(GAME_LOGS_DIR):
         try:
             os.remove(path)
             deleted_local += 1
@@ -243,10 +263,10 @@ async def get_game(game_id: str):
             return doc
 
     # Local file fallback
-    path = os.path.join(GAME_LOGS_DIR, f"dixit_game_log_{game_id}.json")
-    if os.path.isfile(path):
+    path = find_log(GAME_LOGS_DIR, game_id)
+    if path:
         return _load_log(path)
-    for p in glob.glob(os.path.join(GAME_LOGS_DIR, "dixit_game_log_*.json")):
+    for p in log_paths(GAME_LOGS_DIR):
         try:
             log = _load_log(p)
             if log.get("game_id") == game_id:
@@ -256,33 +276,79 @@ async def get_game(game_id: str):
     raise HTTPException(status_code=404, detail=f"Game '{game_id}' not found")
 
 
-@router.post("/games", response_model=StartGameResponse)
-async def start_game(req: StartGameRequest, background_tasks: BackgroundTasks):
-    from datetime import datetime
-    game_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+@router.get("/games/{game_id}/tail")
+async def tail_game(game_id: str, after: int = 0):
+    """Rounds completed after round ``after``, read from the local log as it is appended."""
+    path = find_log(GAME_LOGS_DIR, game_id)
+    if path is None:
+        raise HTTPException(status_code=404, detail=f"Game '{game_id}' not found")
+    return tail_log(path, after)
+
+
+@router.delete("/games/{game_id}")
+async def cancel_game(game_id: str):
+    """Cancel a queued or running game; a running game's in-flight requests are cancelled with it."""
+    job = await _job_queue().cancel(game_id)
+    if job is None:
+        # Not a queued game: maybe one of a running tournament's
+        job = await cancel_tournament_game(game_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"No job for game '{game_id}'")
+    if job["status"] != "cancelled":
+        raise HTTPException(status_code=409, detail=f"Game '{game_id}' already {job['status']}")
+    return job
 
+
+@router.get("/jobs")
+async def list_jobs(status: Optional[str] = None, limit: int = 100):
+    if status is not None and status not in JOB_STATUSES:
+        raise HTTPException(status_code=422, detail=f"Unknown status '{status}'. Available: {list(JOB_STATUSES)}")
+    return _job_queue().list(status, limit)
+
+
+@router.post("/games", response_model=StartGameResponse)
+async def start_game(req: StartGameRequest):
     players = [p.model_dump() for p in req.players]
+    kwargs = dict(
+        image_directory=req.image_directory,
+        players=players,
+        prompt_style=req.prompt_style,
+        max_rounds=req.max_rounds,
+        score_to_win=req.score_to_win,
+        use_cache=req.use_cache,
+        phase_timeouts=req.phase_timeouts,
+        round_timeout=req.round_timeout,
+        timeout_fill=req.timeout_fill,
+        speculative_clues=req.speculative_clues,
+        speculation_budget=req.speculation_budget,
+        seed=req.seed,
+        budget=req.budget,
+    )
+    job = _job_queue().enqueue(kwargs, priority=req.priority)
+    game_id = job["game_id"]
+
+    return StartGameResponse(
+        game_id=game_id,
+        message="Game started" if job["status"] == "running" else "Game queued",
+        live_url=f"/live/{game_id}",
+    )
 
-    async def _run():
-        try:
-            await play_game(
-                image_directory=req.image_directory,
-                players=players,
-                prompt_style=req.prompt_style,
-                max_rounds=req.max_rounds,
-                score_to_win=req.score_to_win,
-                use_cache=req.use_cache,
-                game_id=game_id,
-                event_bus=bus,
-            )
-        except Exception as exc:
-            logger.exception("Game %s failed: %s", game_id, exc)
-            await bus.publish(game_id, {"type": "error", "message": str(exc)})
 
-    background_tasks.add_task(_run)
+@router.post("/games/{game_id}/resume", response_model=StartGameResponse)
+async def resume_interrupted_game(game_id: str):
+    try:
+        state = load_checkpoint(game_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    if state is None:
+        raise HTTPException(status_code=404, detail=f"No checkpoint for game '{game_id}' (unknown or already finished)")
+    try:
+        job = _job_queue().enqueue({"game_id": game_id}, kind="resume")
+    except ValueError as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
 
     return StartGameResponse(
         game_id=game_id,
-        message="Game started",
+        message=f"Game resumed after round {state['round']}" + ("" if job["status"] == "running" else " (queued)"),
         live_url=f"/live/{game_id}",
     )
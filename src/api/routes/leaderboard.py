@@ -2,24 +2,35 @@
 Leaderboard route.
 
 GET /api/leaderboard  — aggregated per-model stats from all game logs
-                        reads from Firebase when available, falls back to local JSON files
+                        reads from Firebase when available, falls back to local log files
+
+Each model is also compared with chance play in the same configurations
+(player count, max_rounds, score_to_win, seat) — see core.baselines:
+  baseline_win_rate / win_rate_vs_baseline   chance win rate and the model's excess over it
+                                             (tied winners share the win, as in the baselines)
+  avg_score_vs_baseline / score_z            final score minus the chance mean, and in chance stds
+  score_percentile                           mean percentile of final scores among chance players
+  storyteller_success_vs_baseline            storyteller success rate minus chance
 """
 
-import glob
-import json
+import asyncio
 import logging
 import os
 from collections import defaultdict
+from typing import Iterable
 
 from fastapi import APIRouter
 
+from core.baselines import get_baselines, score_percentile
+from core.game_log import iter_logs
+
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api")
 
 GAME_LOGS_DIR = os.getenv("GAME_LOGS_DIR", "game_logs")
 
 
-def _aggregate_from_logs(logs: list[dict]) -> list[dict]:
+def _aggregate_from_logs(logs: Iterable[dict]) -> list[dict]:
     stats: dict[str, dict] = defaultdict(lambda: {
         "model": "",
         "provider": "",
@@ -29,7 +40,15 @@ def _aggregate_from_logs(logs: list[dict]) -> list[dict]:
         "total_rounds_played": 0,
         "storyteller_successes": 0,
         "storyteller_rounds": 0,
+        "baseline_games": 0,
+        "baseline_wins": 0.0,       # expected wins under chance play
+        "wins_with_baseline": 0.0,  # actual wins in the games that have a baseline, ties shared
+        "score_vs_baseline": 0.0,
+        "score_z": 0.0,
+        "score_percentile": 0.0,
+        "baseline_storyteller_successes": 0.0,
     })
+    baselines = get_baselines()
 
     for log in logs:
         cfg = log.get("game_configuration", {})
@@ -49,16 +68,37 @@ def _aggregate_from_logs(logs: list[dict]) -> list[dict]:
         if not final_scores:
             continue
         winner_name = max(final_scores, key=final_scores.get)
+        best = final_scores[winner_name]
+        tied_winners = [name for name, score in final_scores.items() if score == best]
 
-        for player_name, model in name_to_model.items():
+        try:
+            baseline = baselines.get(
+                len(players_cfg),
+                cfg.get("max_rounds", game_params.get("max_number_of_rounds", 10)),
+                cfg.get("score_to_win", 30),
+            )
+        except ValueError:
+            baseline = None  # fewer than 3 players
+
+        for seat, (player_name, model) in enumerate(name_to_model.items()):
             s = stats[model]
             s["model"] = model
             s["provider"] = name_to_provider.get(player_name, "")
             s["games_played"] += 1
-            s["total_score"] += final_scores.get(player_name, 0)
+            score = final_scores.get(player_name, 0)
+            s["total_score"] += score
             s["total_rounds_played"] += len(rounds)
             if player_name == winner_name:
                 s["wins"] += 1
+            if baseline is not None:
+                mean, std = baseline["seat_score_means"][seat], baseline["seat_score_stds"][seat]
+                s["baseline_games"] += 1
+                s["baseline_wins"] += baseline["seat_win_rates"][seat]
+                if player_name in tied_winners:
+                    s["wins_with_baseline"] += 1 / len(tied_winners)
+                s["score_vs_baseline"] += score - mean
+                s["score_z"] += (score - mean) / std if std else 0.0
+                s["score_percentile"] += score_percentile(baseline, score)
 
         for round_data in rounds:
             storyteller_name = round_data.get("storyteller")
@@ -69,11 +109,15 @@ def _aggregate_from_logs(logs: list[dict]) -> list[dict]:
                 stats[model]["storyteller_rounds"] += 1
                 if 0 < storyteller_votes < num_non_storytellers:
                     stats[model]["storyteller_successes"] += 1
+                if baseline is not None:
+                    stats[model]["baseline_storyteller_successes"] += baseline["storyteller_success_rate"]
 
     leaderboard = []
     for model, s in stats.items():
         gp = s["games_played"]
         sr = s["storyteller_rounds"]
+        bg = s["baseline_games"]
+        baseline_win_rate = s["baseline_wins"] / bg if bg else None
         leaderboard.append({
             "model": model,
             "provider": s["provider"],
@@ -87,6 +131,14 @@ def _aggregate_from_logs(logs: list[dict]) -> list[dict]:
             "storyteller_success_rate": round(
                 s["storyteller_successes"] / sr, 3
             ) if sr else 0,
+            "baseline_win_rate": round(baseline_win_rate, 3) if bg else None,
+            "win_rate_vs_baseline": round(s["wins_with_baseline"] / bg - baseline_win_rate, 3) if bg else None,
+            "avg_score_vs_baseline": round(s["score_vs_baseline"] / bg, 1) if bg else None,
+            "score_z": round(s["score_z"] / bg, 2) if bg else None,
+            "score_percentile": round(s["score_percentile"] / bg, 3) if bg else None,
+            "storyteller_success_vs_baseline": round(
+                (s["storyteller_successes"] - s["baseline_storyteller_successes"]) / sr, 3
+            ) if sr and bg else None,
         })
 
     leaderboard.sort(key=lambda x: (-x["win_rate"], -x["avg_score"]))
@@ -101,18 +153,11 @@ def _aggregate_leaderboard() -> list[dict]:
         if logs:
             return _aggregate_from_logs(logs)
 
-    # Fall back to local JSON files
-    pattern = os.path.join(GAME_LOGS_DIR, "dixit_game_log_*.json")
-    logs = []
-    for path in glob.glob(pattern):
-        try:
-            with open(path) as f:
-                logs.append(json.load(f))
-        except Exception as exc:
-            logger.warning("Skipping %s: %s", path, exc)
-    return _aggregate_from_logs(logs)
+    # Fall back to local log files, streamed one game at a time; unfinished games don't count
+    return _aggregate_from_logs(iter_logs(GAME_LOGS_DIR, finished_only=True))
 
 
 @router.get("/leaderboard")
 async def get_leaderboard():
-    return _aggregate_leaderboard()
+    # Off the event loop: a new configuration's baseline is a ~1 s simulation, plus log and Firestore reads
+    return await asyncio.to_thread(_aggregate_leaderboard)
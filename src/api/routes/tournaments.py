@@ -0,0 +1,122 @@
+from __future__ import annotations
+"""
+Tournament routes.
+
+POST /api/tournaments        — start a concurrent tournament (runs in background)
+GET  /api/tournaments/{id}   — progress / per-trial status
+
+Live progress events are also published on the event bus under
+``tournament_{id}`` (WS /ws/live/tournament_{id}); each game streams under
+its own game_id as usual.
+
+Tournament games do not go through the job queue (core.jobs): they share the
+tournament's spend budget and request limits, which a queued job cannot
+carry.  They have a cap of their own instead — at most MAX_TOURNAMENT_GAMES
+(default 4) games across all tournaments run at once, on top of each
+tournament's max_concurrent_games — and DELETE /api/games/{id} cancels one
+(see core.tournament.cancel_game).
+"""
+
+import asyncio
+import logging
+import os
+from typing import List, Optional
+
+from fastapi import APIRouter, BackgroundTasks, HTTPException
+from pydantic import BaseModel
+
+from api.events import bus
+from core.concurrency import ConcurrencyBudget
+from core.tournament import Tournament, get_status, random_trials, register, trials_from_config
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/api")
+
+MAX_TOURNAMENT_GAMES = int(os.getenv("MAX_TOURNAMENT_GAMES", 4))
+_game_slots: asyncio.Semaphore | None = None
+
+
+def _tournament_game_slots() -> asyncio.Semaphore:
+    """Games running across every API tournament (created lazily, on the serving event loop)."""
+    global _game_slots
+    if _game_slots is None:
+        _game_slots = asyncio.Semaphore(max(1, MAX_TOURNAMENT_GAMES))
+    return _game_slots
+
+
+class RandomTournamentSpec(BaseModel):
+    cards: str = "data/1_full"
+    num_games: int = 5
+    players_per_game: int = 4
+    models: List[str]
+    prompt_styles: List[str] = ["creative"]
+    max_rounds: int = 10
+    score_to_win: int = 30
+    use_cache: bool = True
+    seed: Optional[int] = None
+
+
+class StartTournamentRequest(BaseModel):
+    # Exactly one of: a run-configuration ({"defaults": …, "runs": […]}) or a random spec
+    config: Optional[dict] = None
+    random: Optional[RandomTournamentSpec] = None
+    max_concurrent_games: int = 4
+    max_concurrent_requests: Optional[int] = None
+    provider_limits: Optional[dict[str, int]] = None  # e.g. {"openai": 8, "anthropic": 4}
+    stop_on_error: bool = False
+
+
+class StartTournamentResponse(BaseModel):
+    tournament_id: str
+    trials: int
+    status_url: str
+
+
+@router.post("/tournaments", response_model=StartTournamentResponse)
+async def start_tournament(req: StartTournamentRequest, background_tasks: BackgroundTasks):
+    if (req.config is None) == (req.random is None):
+        raise HTTPException(status_code=422, detail="Provide exactly one of 'config' or 'random'")
+    try:
+        if req.config is not None:
+            trials = trials_from_config(req.config)
+        else:
+            spec = req.random
+            trials = random_trials(
+                spec.cards, spec.num_games, spec.players_per_game, spec.models, spec.prompt_styles,
+                seed=spec.seed, max_rounds=spec.max_rounds, score_to_win=spec.score_to_win, use_cache=spec.use_cache,
+            )
+        # The config's top-level "budget" caps the whole tournament (see core.budget)
+        tour = Tournament(
+            trials,
+            max_concurrent_games=req.max_concurrent_games,
+            concurrency=ConcurrencyBudget(req.max_concurrent_requests, req.provider_limits),
+            stop_on_error=req.stop_on_error,
+            budget=req.config.get("budget") if req.config is not None else None,
+            game_slots=_tournament_game_slots(),
+        )
+    except (KeyError, TypeError, ValueError) as exc:
+        raise HTTPException(status_code=422, detail=f"Invalid tournament spec: {exc}")
+
+    register(tour)
+    tour.save_state()
+
+    async def _run():
+        try:
+            await tour.run(event_bus=bus)
+        except Exception as exc:
+            logger.exception("Tournament %s failed: %s", tour.tournament_id, exc)
+
+    background_tasks.add_task(_run)
+    return StartTournamentResponse(
+        tournament_id=tour.tournament_id,
+        trials=len(trials),
+        status_url=f"/api/tournaments/{tour.tournament_id}",
+    )
+
+
+@router.get("/tournaments/{tournament_id}")
+async def tournament_status(tournament_id: str):
+    status = get_status(tournament_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail=f"Tournament '{tournament_id}' not found")
+    return status
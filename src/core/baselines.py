@@ -0,0 +1,194 @@
+from __future__ import annotations
+"""
+Chance baselines for the leaderboard, from vectorised Monte Carlo games.
+
+What a win rate or an average score means depends on the player count,
+max_rounds and score_to_win.  simulate_baseline() plays many games between
+chance-level voters at once with NumPy, one array operation per round over
+every game, applying the core.scoring rules:
+
+  - "random" voters pick uniformly among the cards other than their own;
+  - "oracle:<p>" voters find the storyteller's card with probability p and
+    otherwise vote like random ones (a heuristic reference point).
+
+Cards have no content in these games, so only the voting matters: which
+player's card each voter picks.  A baseline records per-seat win rates
+(storytelling starts at seat 0), per-seat score mean / std, a histogram of
+final scores and the storyteller success rate.
+
+Baselines are cached by configuration in memory and in BASELINE_CACHE_PATH
+(JSON, default baseline_cache.json); BASELINE_GAMES (default 200000) sets
+how many games each one simulates.  Access via get_baselines() to get the
+module-level singleton.
+"""
+
+import json
+import logging
+import os
+import threading
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+BASELINE_CACHE_PATH = os.getenv("BASELINE_CACHE_PATH", "baseline_cache.json")
+BASELINE_GAMES = int(os.getenv("BASELINE_GAMES", 200_000))
+_BATCH = 100_000
+_instance: "BaselineCache | None" = None
+
+
+def get_baselines() -> "BaselineCache":
+    global _instance
+    if _instance is None:
+        _instance = BaselineCache()
+    return _instance
+
+
+def _voter_accuracy(voter: str) -> float:
+    kind, _, arg = voter.partition(":")
+    if kind == "random" and not arg:
+        return 0.0
+    if kind == "oracle":
+        return float(arg) if arg else 1.0
+    raise ValueError(f"Unknown voter '{voter}'. Available: random, oracle:<p>")
+
+
+def round_deltas(votes: np.ndarray, storyteller: int, num_players: int) -> np.ndarray:
+    """Score changes for a batch of rounds, by the rules of core.scoring.compute_score_changes.
+
+    ``votes`` is (games, num_players - 1): for each non-storyteller in seat
+    order, the seat whose card they voted for.  Returns (games, num_players).
+    """
+    voters = [p for p in range(num_players) if p != storyteller]
+    found = votes == storyteller
+    k = found.sum(axis=1)
+    all_or_none = (k == 0) | (k == len(voters))
+
+    deltas = np.zeros((votes.shape[0], num_players), dtype=np.int32)
+    deltas[:, voters] += 2 * all_or_none[:, None]
+    deltas[:, storyteller] += 3 * ~all_or_none
+    deltas[:, voters] += 3 * (found & ~all_or_none[:, None])
+    # +1 per vote a non-storyteller's card received from another player
+    for owner in voters:
+        from_others = (votes == owner) & (np.asarray(voters) != owner)
+        deltas[:, owner] += from_others.sum(axis=1)
+    return deltas
+
+
+def _play_batch(rng: np.random.Generator, games: int, num_players: int, max_rounds: int,
+                score_to_win: int, accuracy: float) -> tuple[np.ndarray, np.ndarray, int, int]:
+    """Returns (final scores, rounds played, storyteller rounds, storyteller successes)."""
+    scores = np.zeros((games, num_players), dtype=np.int32)
+    rounds = np.zeros(games, dtype=np.int32)
+    active = np.ones(games, dtype=bool)
+    told = successes = 0
+    for r in range(max_rounds):
+        if not active.any():
+            break
+        storyteller = r % num_players
+        voters = np.array([p for p in range(num_players) if p != storyteller])
+        # Uniform over the num_players - 1 cards that aren't the voter's own
+        pick = rng.integers(0, num_players - 1, size=(games, len(voters)))
+        votes = pick + (pick >= voters)
+        if accuracy:
+            votes = np.where(rng.random((games, len(voters))) < accuracy, storyteller, votes)
+        deltas = round_deltas(votes, storyteller, num_players)
+        scores += deltas * active[:, None]
+        rounds += active
+        told += int(active.sum())
+        successes += int((active & (deltas[:, storyteller] > 0)).sum())
+        active &= scores.max(axis=1) < score_to_win
+    return scores, rounds, told, successes
+
+
+def simulate_baseline(num_players: int, max_rounds: int = 10, score_to_win: int = 30,
+                      voter: str = "random", games: int = BASELINE_GAMES, seed: int = 0) -> dict:
+    """Play ``games`` chance-level games and summarise their outcomes."""
+    if num_players < 3:
+        raise ValueError("Dixit needs at least 3 players")
+    accuracy = _voter_accuracy(voter)
+    rng = np.random.default_rng(seed)
+    wins = np.zeros(num_players)
+    score_sum = np.zeros(num_players)
+    score_sq = np.zeros(num_players)
+    histogram = np.zeros(0, dtype=np.int64)
+    total_rounds = told = successes = 0
+    for start in range(0, games, _BATCH):
+        size = min(_BATCH, games - start)
+        scores, rounds, t, s = _play_batch(rng, size, num_players, max_rounds, score_to_win, accuracy)
+        best = scores == scores.max(axis=1, keepdims=True)
+        wins += (best / best.sum(axis=1, keepdims=True)).sum(axis=0)  # ties share the win
+        score_sum += scores.sum(axis=0)
+        score_sq += (scores.astype(np.float64) ** 2).sum(axis=0)
+        counts = np.bincount(scores.ravel())
+        if len(counts) > len(histogram):
+            histogram = np.pad(histogram, (0, len(counts) - len(histogram)))
+        histogram[:len(counts)] += counts
+        total_rounds += int(rounds.sum())
+        told += t
+        successes += s
+    mean = score_sum / games
+    std = np.sqrt(np.maximum(score_sq / games - mean ** 2, 0.0))
+    return {
+        "num_players": num_players,
+        "max_rounds": max_rounds,
+        "score_to_win": score_to_win,
+        "voter": voter,
+        "games": games,
+        "mean_rounds": round(total_rounds / games, 3),
+        "seat_win_rates": [round(float(w), 4) for w in wins / games],
+        "seat_score_means": [round(float(m), 3) for m in mean],
+        "seat_score_stds": [round(float(s), 3) for s in std],
+        "score_mean": round(float(score_sum.sum() / (games * num_players)), 3),
+        "score_histogram": histogram.tolist(),  # index = final score, pooled over seats
+        "storyteller_success_rate": round(successes / told, 4) if told else None,
+    }
+
+
+def score_percentile(baseline: dict, score: int) -> float:
+    """Share of baseline players (all seats) who finished below ``score``, ties counting half."""
+    hist = baseline["score_histogram"]
+    total = sum(hist)
+    below = sum(hist[:max(0, min(score, len(hist)))])
+    at = hist[score] if 0 <= score < len(hist) else 0
+    return (below + at / 2) / total if total else 0.5
+
+
+class BaselineCache:
+    def __init__(self, path: str = BASELINE_CACHE_PATH, games: int = BASELINE_GAMES):
+        self.path = path
+        self.games = games
+        self._lock = threading.Lock()
+        self._baselines: dict[str, dict] | None = None
+
+    @staticmethod
+    def _key(num_players: int, max_rounds: int, score_to_win: int, voter: str, games: int) -> str:
+        return f"{num_players}p/{max_rounds}r/{score_to_win}pts/{voter}/{games}"
+
+    def _load(self) -> dict[str, dict]:
+        if self._baselines is None:
+            self._baselines = {}
+            if os.path.isfile(self.path):
+                try:
+                    with open(self.path) as f:
+                        self._baselines = json.load(f)
+                except (OSError, ValueError) as exc:
+                    logger.warning("Ignoring unreadable baseline cache %s: %s", self.path, exc)
+        return self._baselines
+
+    def get(self, num_players: int, max_rounds: int = 10, score_to_win: int = 30, voter: str = "random") -> dict:
+        """The baseline for a configuration, simulated on first use and cached."""
+        key = self._key(num_players, max_rounds, score_to_win, voter, self.games)
+        with self._lock:
+            baselines = self._load()
+            if key not in baselines:
+                logger.info("Simulating %d-game baseline for %s", self.games, key)
+                baselines[key] = simulate_baseline(num_players, max_rounds, score_to_win, voter, self.games)
+                try:
+                    tmp = f"{self.path}.tmp"
+                    with open(tmp, "w") as f:
+                        json.dump(baselines, f)
+                    os.replace(tmp, self.path)
+                except OSError as exc:
+                    logger.warning("Could not write baseline cache %s: %s", self.path, exc)
+            return baselines[key]
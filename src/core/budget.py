@@ -0,0 +1,252 @@
+from __future__ import annotations
+"""
+Spend budgets: caps on the requests, tokens and estimated cost of vision calls.
+
+SpendBudget scopes nest.  Every game has one (limits from play_game's
+``budget``) whose parent is its tournament's (Tournament ``budget``), whose
+parent is the process-wide global budget (SPEND_BUDGET_REQUESTS,
+SPEND_BUDGET_TOKENS, SPEND_BUDGET_COST; unset = unlimited).  Any scope can
+also cap single models (``per_model``).  A call is charged to its scope and
+every ancestor.
+
+Enforcement is in AIPlayer._call: before each uncached request, check()
+raises BudgetExceeded once a limit on the chain is reached, so a cap is
+overshot by at most the requests already in flight.  Each HTTP attempt
+counts as a request — retries included, so a failing model cannot retry
+forever.  Tokens and the provider-reported cost come from the call's
+CallRecord (vision.instrumentation); when a provider reports no cost it is
+estimated from ``prices`` if given, else the request is counted as
+unpriced.  Clients that emit no CallRecord are charged one request a call.
+
+Limits, as in play_game's ``budget`` and run configs:
+
+    {"requests": 5000, "tokens": 2000000, "cost": 25.0,
+     "per_model": {"openai/gpt-4o": {"cost": 10.0}},
+     "prices": {"openai/gpt-4o": {"prompt": 2.5, "completion": 10.0}},   # $ per 1M tokens
+     "on_exhausted": "stop"}                                           # or "degrade"
+
+When the exhausted scope says "stop", a game stops at its last completed
+round (its checkpoint is kept, so it resumes once the budget allows) and a
+tournament starts no new games.  With "degrade", exhausted players stop
+making requests and play on with fallback answers (clue "mysterious",
+card score DEFAULT_SCORE).
+
+The global budget lives in process memory: it starts from zero on restart
+and in every GAME_WORKERS process.  Access via get_global_budget() to get
+the module-level singleton.
+"""
+
+import contextlib
+import logging
+import os
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Iterator
+
+from vision import instrumentation
+from vision.instrumentation import CallRecord
+
+logger = logging.getLogger(__name__)
+
+LIMIT_KEYS = ("requests", "tokens", "cost")
+ON_EXHAUSTED = ("stop", "degrade")
+_instance: "SpendBudget | None" = None
+
+
+def _env_number(name: str, kind=int):
+    value = os.getenv(name)
+    return kind(value) if value else None
+
+
+def get_global_budget() -> "SpendBudget":
+    global _instance
+    if _instance is None:
+        _instance = SpendBudget("global", {
+            "requests": _env_number("SPEND_BUDGET_REQUESTS"),
+            "tokens": _env_number("SPEND_BUDGET_TOKENS"),
+            "cost": _env_number("SPEND_BUDGET_COST", float),
+            "on_exhausted": os.getenv("SPEND_BUDGET_ON_EXHAUSTED", "stop"),
+        })
+    return _instance
+
+
+class BudgetExceeded(Exception):
+    def __init__(self, scope: str, reason: str, model: str | None = None, degrade: bool = False):
+        self.scope = scope
+        self.reason = reason
+        self.model = model
+        self.degrade = degrade
+        target = f" for {model}" if model else ""
+        super().__init__(f"{scope} budget exhausted{target}: {reason}")
+
+    def __reduce__(self):
+        # Picklable with its fields, so it crosses from GAME_WORKERS processes intact
+        return type(self), (self.scope, self.reason, self.model, self.degrade)
+
+
+@dataclass
+class Usage:
+    requests: int = 0
+    tokens: int = 0
+    cost: float = 0.0
+    unpriced: int = 0   # requests whose cost is unknown (not reported, no price)
+
+    def add(self, other: "Usage") -> None:
+        self.requests += other.requests
+        self.tokens += other.tokens
+        self.cost += other.cost
+        self.unpriced += other.unpriced
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "cost": round(self.cost, 6)}
+
+
+# CallRecords of the request in flight in this context, collected by _on_record
+_ledger: ContextVar[list[CallRecord] | None] = ContextVar("spend_ledger", default=None)
+
+
+def _on_record(rec: CallRecord) -> None:
+    records = _ledger.get()
+    if records is not None:
+        records.append(rec)
+
+
+instrumentation.add_listener(_on_record)
+
+
+def _limits(raw: dict) -> dict:
+    unknown = set(raw) - set(LIMIT_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown budget limit(s) {sorted(unknown)}. Available: {list(LIMIT_KEYS)}")
+    return {k: v for k, v in raw.items() if v is not None}
+
+
+class SpendBudget:
+    def __init__(self, scope: str = "game", limits: dict | None = None, parent: "SpendBudget | None" = None):
+        """
+        Args:
+            scope: Label used in messages and status ("game", "tournament", "global").
+            limits: See the module docstring; None = unlimited (spend is still tracked).
+            parent: Enclosing budget, charged and checked along with this one.
+        """
+        limits = dict(limits or {})
+        self.scope = scope
+        self.per_model = {m: _limits(v) for m, v in limits.pop("per_model", {}).items()}
+        self.prices = limits.pop("prices", {})
+        self.on_exhausted = limits.pop("on_exhausted", "stop")
+        if self.on_exhausted not in ON_EXHAUSTED:
+            raise ValueError(f"Unknown on_exhausted '{self.on_exhausted}'. Available: {list(ON_EXHAUSTED)}")
+        self.limits = _limits(limits)
+        self.parent = parent
+        self.spent = Usage()
+        self.model_spent: dict[str, Usage] = {}
+        self.degraded: dict[str, str] = {}  # model -> why its requests stopped (on_exhausted "degrade")
+
+    def _chain(self) -> Iterator["SpendBudget"]:
+        budget = self
+        while budget is not None:
+            yield budget
+            budget = budget.parent
+
+    @staticmethod
+    def _over(limits: dict, usage: Usage | None) -> str | None:
+        for key, cap in limits.items():
+            value = getattr(usage, key) if usage is not None else 0
+            if value >= cap:
+                return f"{key} {round(value, 4)}/{cap}"
+        return None
+
+    def exhausted(self) -> list[str]:
+        """The limits of this scope (not its parents) already reached."""
+        reasons = []
+        reason = self._over(self.limits, self.spent)
+        if reason:
+            reasons.append(reason)
+        for model, limits in self.per_model.items():
+            reason = self._over(limits, self.model_spent.get(model))
+            if reason:
+                reasons.append(f"{model}: {reason}")
+        return reasons
+
+    def check(self, model: str) -> None:
+        """Raise BudgetExceeded if a request for ``model`` would go over a limit here or in a parent."""
+        for budget in self._chain():
+            reason = budget._over(budget.limits, budget.spent)
+            target = None
+            if reason is None and model in budget.per_model:
+                reason = budget._over(budget.per_model[model], budget.model_spent.get(model))
+                target = model
+            if reason is not None:
+                raise BudgetExceeded(budget.scope, reason, target, degrade=budget.on_exhausted == "degrade")
+
+    def charge(self, model: str, usage: Usage) -> None:
+        for budget in self._chain():
+            budget.spent.add(usage)
+            budget.model_spent.setdefault(model, Usage()).add(usage)
+
+    def degrade(self, model: str, exc: BudgetExceeded) -> None:
+        """Note that ``model`` plays on without requests in this scope (logged once per model)."""
+        if model not in self.degraded:
+            logger.warning("%s: %s — degrading to fallback answers", model, exc)
+            self.degraded[model] = str(exc)
+
+    def _price(self, model: str) -> dict | None:
+        for budget in self._chain():
+            if model in budget.prices:
+                return budget.prices[model]
+        return None
+
+    def _usage(self, model: str, records: list[CallRecord]) -> Usage:
+        if not records:
+            return Usage(requests=1, unpriced=1)
+        usage = Usage()
+        for rec in records:
+            usage.requests += rec.attempts
+            usage.tokens += rec.prompt_tokens + rec.completion_tokens
+            if rec.cost is not None:
+                usage.cost += rec.cost
+                continue
+            price = self._price(model)
+            if price is None:
+                usage.unpriced += rec.attempts
+            else:
+                usage.cost += (rec.prompt_tokens * price.get("prompt", 0.0)
+                               + rec.completion_tokens * price.get("completion", 0.0)) / 1e6
+        return usage
+
+    @contextlib.contextmanager
+    def track(self, model: str) -> Iterator[None]:
+        """Charge the request made inside the block (however it ends) to this budget and its parents."""
+        records: list[CallRecord] = []
+        token = _ledger.set(records)
+        try:
+            yield
+        finally:
+            _ledger.reset(token)
+            self.charge(model, self._usage(model, records))
+
+    def restore(self, status: dict | None) -> None:
+        """Reload the spend of a status() dict (e.g. from a checkpoint) without charging the parents."""
+        if not status:
+            return
+        self.spent = Usage(**status.get("spent", {}))
+        self.model_spent = {m: Usage(**u) for m, u in status.get("models", {}).items()}
+        self.degraded = dict(status.get("degraded", {}))
+
+    def status(self) -> dict:
+        limits = dict(self.limits)
+        if self.per_model:
+            limits["per_model"] = self.per_model
+        reasons = self.exhausted()
+        out = {
+            "scope": self.scope,
+            "status": "exhausted" if reasons else "degraded" if self.degraded else "ok",
+            "limits": limits,
+            "spent": self.spent.to_dict(),
+            "models": {m: u.to_dict() for m, u in sorted(self.model_spent.items())},
+        }
+        if reasons:
+            out["exhausted"] = reasons
+        if self.degraded:
+            out["degraded"] = self.degraded
+        return out
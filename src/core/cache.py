@@ -14,6 +14,8 @@ import logging
 import sqlite3
 from datetime import datetime
 
+from core.manifest import get_manifests
+
 logger = logging.getLogger(__name__)
 
 _DB_PATH = "image_analysis_cache.db"
@@ -49,6 +51,10 @@ class ImageAnalysisCache:
     def _hash(self, image_path: str) -> str:
         if image_path.startswith(("http://", "https://")):
             return hashlib.sha256(image_path.encode("utf-8")).hexdigest()
+        # Deck cards were already hashed by their collection manifest
+        known = get_manifests().sha256(image_path)
+        if known is not None:
+            return known
         with open(image_path, "rb") as f:
             return hashlib.sha256(f.read()).hexdigest()
 
@@ -63,6 +69,15 @@ class ImageAnalysisCache:
             logger.debug("Cache hit: %s / %s", model, image_path)
         return row[0] if row else None
 
+    def count_cached(self, model: str, prompt: str, image_paths: list[str]) -> int:
+        """How many of ``image_paths`` already have a cached response for (model, prompt)."""
+        hashes = {self._hash(p) for p in image_paths}
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(
+                "SELECT image_hash FROM analysis_cache WHERE model=? AND prompt=?", (model, prompt),
+            ).fetchall()
+        return len(hashes & {r[0] for r in rows})
+
     def set(self, model: str, image_path: str, prompt: str, response: str) -> None:
         image_hash = self._hash(image_path)
         with sqlite3.connect(self.db_path) as conn:
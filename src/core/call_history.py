@@ -0,0 +1,130 @@
+from __future__ import annotations
+"""
+Persistent per-call latency and usage history — SQLite-backed singleton.
+
+Every vision request recorded by vision.instrumentation is appended to the
+``calls`` table of CALL_HISTORY_PATH (default call_history.db): model,
+purpose ("clue" / "score"), latency, tokens and provider-reported cost.
+Rows are buffered and written in batches so the listener stays cheap on
+the event loop; buffered rows are also flushed at exit.
+
+model_stats() aggregates the history per model and purpose; the dry-run
+estimator (core.estimate) predicts wall time and spend from it.
+
+Access via get_call_history() to get the module-level singleton (creating
+it starts recording).
+"""
+
+import atexit
+import logging
+import os
+import sqlite3
+import time
+from dataclasses import astuple
+from datetime import datetime
+
+from vision import instrumentation
+from vision.instrumentation import CallRecord
+
+logger = logging.getLogger(__name__)
+
+CALL_HISTORY_PATH = os.getenv("CALL_HISTORY_PATH", "call_history.db")
+_FLUSH_ROWS = 50
+_FLUSH_SECONDS = 5.0
+_instance: "CallHistory | None" = None
+
+
+def get_call_history() -> "CallHistory":
+    global _instance
+    if _instance is None:
+        _instance = CallHistory()
+        instrumentation.add_listener(_instance.record)
+        atexit.register(_instance.flush)
+    return _instance
+
+
+class CallHistory:
+    def __init__(self, db_path: str = CALL_HISTORY_PATH):
+        self.db_path = os.path.abspath(db_path)
+        self._buffer: list[tuple] = []
+        self._last_flush = time.monotonic()
+        self._init_db()
+
+    def _init_db(self) -> None:
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS calls (
+                    provider          TEXT,
+                    model             TEXT,
+                    status            INTEGER,
+                    attempts          INTEGER,
+                    latency_s         REAL,
+                    ok                INTEGER,
+                    prompt_tokens     INTEGER,
+                    completion_tokens INTEGER,
+                    cost              REAL,
+                    purpose           TEXT,
+                    timestamp         TEXT
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS calls_model ON calls (model, purpose)")
+
+    def record(self, rec: CallRecord) -> None:
+        """instrumentation listener: buffer one call, writing the buffer out every few seconds or rows."""
+        self._buffer.append((*astuple(rec), datetime.now().isoformat(timespec="seconds")))
+        if len(self._buffer) >= _FLUSH_ROWS or time.monotonic() - self._last_flush >= _FLUSH_SECONDS:
+            self.flush()
+
+    def flush(self) -> None:
+        rows, self._buffer = self._buffer, []
+        self._last_flush = time.monotonic()
+        if not rows:
+            return
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany(
+                    "INSERT INTO calls (provider, model, status, attempts, latency_s, ok, prompt_tokens, "
+                    "completion_tokens, cost, purpose, timestamp) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+        except sqlite3.Error as exc:
+            logger.warning("Could not write %d call history rows to %s: %s", len(rows), self.db_path, exc)
+
+    def model_stats(self) -> dict[str, dict[str, dict]]:
+        """model -> purpose -> averages over successful calls.
+
+        Untagged calls count as purpose "other"; "*" pools every purpose.
+
+        Each entry: calls, error_rate, latency_s, prompt_tokens, completion_tokens,
+        and cost (None when the provider never reported one).
+        """
+        self.flush()
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute("""
+                SELECT model, COALESCE(purpose, 'other'), COUNT(*), SUM(ok),
+                       SUM(CASE WHEN ok THEN latency_s END), SUM(CASE WHEN ok THEN prompt_tokens END),
+                       SUM(CASE WHEN ok THEN completion_tokens END),
+                       SUM(CASE WHEN ok THEN cost END), COUNT(CASE WHEN ok THEN cost END)
+                FROM calls GROUP BY model, COALESCE(purpose, 'other')
+            """).fetchall()
+        totals: dict[str, dict[str, list]] = {}
+        for model, purpose, calls, ok, latency, prompt, completion, cost, costed in rows:
+            sums = [calls, ok or 0, latency or 0.0, prompt or 0, completion or 0, cost or 0.0, costed]
+            by_purpose = totals.setdefault(model, {})
+            by_purpose[purpose] = sums
+            by_purpose["*"] = [a + b for a, b in zip(by_purpose.get("*", [0] * 7), sums)]
+        return {
+            model: {purpose: _averages(*sums) for purpose, sums in by_purpose.items()}
+            for model, by_purpose in totals.items()
+        }
+
+
+def _averages(calls: int, ok: int, latency: float, prompt: int, completion: int, cost: float, costed: int) -> dict:
+    return {
+        "calls": calls,
+        "error_rate": round(1 - ok / calls, 4) if calls else 0.0,
+        "latency_s": latency / ok if ok else None,
+        "prompt_tokens": prompt / ok if ok else None,
+        "completion_tokens": completion / ok if ok else None,
+        "cost": cost / costed if costed else None,
+    }
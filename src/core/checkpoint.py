@@ -0,0 +1,76 @@
+from __future__ import annotations
+"""
+Per-round game checkpoints.
+
+After every completed round play_game writes the full game state to
+``{GAME_LOGS_DIR}/checkpoints/{game_id}.json``, so a game interrupted by a
+crash or server restart continues from its last completed round with
+core.game.resume_game(game_id) instead of repaying every call.  The
+checkpoint is removed once the game finishes and its log is saved.
+
+Layout:
+  {
+    "version": 1, "game_id": "...", "saved_at": "...",
+    "params": {...},              # play_game keyword arguments
+    "round": 3,                   # last completed round
+    "deck": ["path", ...],        # remaining deck, in deal order
+    "hands": {"player": ["path", ...]},
+    "scores": {"player": 7},
+    "rng_state": [...],           # the game RNG's getstate(), JSON-encoded
+    "speculation": {...},         # ClueSpeculator counters, if enabled
+    "log": {...}                  # game log so far (configuration + rounds)
+  }
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_VERSION = 1
+CHECKPOINT_DIR = os.path.join(os.getenv("GAME_LOGS_DIR", "game_logs"), "checkpoints")
+
+
+def checkpoint_path(game_id: str) -> str:
+    return os.path.join(CHECKPOINT_DIR, f"{game_id}.json")
+
+
+def save_checkpoint(game_id: str, state: dict) -> str:
+    """Atomically write ``state`` as the latest checkpoint of ``game_id``."""
+    os.makedirs(CHECKPOINT_DIR, exist_ok=True)
+    path = checkpoint_path(game_id)
+    tmp = path + ".part"
+    with open(tmp, "w") as f:
+        json.dump({"version": CHECKPOINT_VERSION, "game_id": game_id, "saved_at": datetime.now().isoformat(timespec="seconds"), **state}, f)
+    os.replace(tmp, path)
+    return path
+
+
+def load_checkpoint(game_id: str) -> dict | None:
+    path = checkpoint_path(game_id)
+    if not os.path.isfile(path):
+        return None
+    with open(path) as f:
+        state = json.load(f)
+    if state.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version {state.get('version')} in {path}")
+    return state
+
+
+def delete_checkpoint(game_id: str) -> None:
+    try:
+        os.remove(checkpoint_path(game_id))
+    except FileNotFoundError:
+        pass
+
+
+def encode_rng_state(state: tuple) -> list:
+    version, internal, gauss_next = state
+    return [version, list(internal), gauss_next]
+
+
+def decode_rng_state(data: list) -> tuple:
+    version, internal, gauss_next = data
+    return version, tuple(internal), gauss_next
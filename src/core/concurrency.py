@@ -0,0 +1,36 @@
+from __future__ import annotations
+"""
+Request concurrency budgets shared by every game in a tournament.
+
+A ConcurrencyBudget caps how many vision requests are in flight at once —
+globally and per provider label (the model prefix, e.g. "openai",
+"anthropic").  AIPlayer acquires a slot around each uncached call, so cache
+hits never wait.
+"""
+
+import asyncio
+import contextlib
+from typing import AsyncIterator
+
+
+class ConcurrencyBudget:
+    def __init__(self, max_requests: int | None = None, per_provider: dict[str, int] | None = None):
+        self.max_requests = max_requests
+        self.per_provider = dict(per_provider or {})
+        self._global = asyncio.Semaphore(max_requests) if max_requests else None
+        self._providers: dict[str, asyncio.Semaphore] = {
+            name: asyncio.Semaphore(limit) for name, limit in self.per_provider.items() if limit
+        }
+
+    @contextlib.asynccontextmanager
+    async def slot(self, provider: str) -> AsyncIterator[None]:
+        async with contextlib.AsyncExitStack() as stack:
+            if self._global is not None:
+                await stack.enter_async_context(self._global)
+            sem = self._providers.get(provider)
+            if sem is not None:
+                await stack.enter_async_context(sem)
+            yield
+
+    def to_dict(self) -> dict:
+        return {"max_requests": self.max_requests, "per_provider": self.per_provider}
@@ -0,0 +1,207 @@
+from __future__ import annotations
+"""
+Dry-run estimates of the requests, tokens, spend and wall time of a run.
+
+estimate_trials() looks at tournament trials without calling any model:
+
+  - requests per phase and player follow play_game's call pattern
+    (requests_per_round): one clue per round from the storyteller; each
+    other player scores its whole hand in the pick phase, then every table
+    card but its own in the vote phase.  Games can end early at
+    score_to_win, so the expected number of rounds comes from chance-level
+    simulations (core.baselines) — an upper bound assumes every round is
+    played.  Speculative clues add at most speculation_budget calls a game.
+  - clue requests are cached per (model, card, clue prompt), so the share
+    of the deck that already has a cached clue for a player is the share of
+    their clue requests the response cache will serve.  Score requests
+    depend on the clue and are never counted as hits.
+  - latency, tokens and cost per request come from the call history
+    (core.call_history), per model and purpose ("clue" / "score").  Direct
+    providers record the bare model name ("gpt-4o" for "openai/gpt-4o"),
+    which is looked up too.  Models without history get DEFAULT_LATENCY_S
+    and unknown tokens and cost.
+  - wall time is the largest of: the games' critical paths packed onto
+    max_concurrent_games slots, and the request-seconds each concurrency
+    cap (global, per provider) has to get through.  It uses mean latencies,
+    so treat it as an order of magnitude.
+"""
+
+import functools
+import logging
+
+from core.baselines import simulate_baseline
+from core.cache import get_cache
+from core.call_history import get_call_history
+from core.concurrency import ConcurrencyBudget
+from core.game import seat_names
+from core.manifest import get_manifests
+from core.prompts import get_prompt_style
+from core.rules import HAND_SIZE
+from core.tournament import Trial
+
+logger = logging.getLogger(__name__)
+
+PHASE_PURPOSE = {"clue": "clue", "pick": "score", "vote": "score"}
+DEFAULT_LATENCY_S = {"clue": 4.0, "score": 1.5}
+_ROUND_SIM_GAMES = 5000
+
+
+def requests_per_round(num_players: int, hand_size: int = HAND_SIZE) -> dict[str, int]:
+    """Vision requests in one uncached round of play_game, by phase."""
+    others = num_players - 1
+    return {"clue": 1, "pick": others * hand_size, "vote": others * others}
+
+
+@functools.lru_cache(maxsize=None)
+def expected_rounds(num_players: int, max_rounds: int, score_to_win: int) -> float:
+    """Mean rounds of a game between chance-level voters (real games can end a little sooner)."""
+    if num_players < 3:
+        return float(max_rounds)
+    return simulate_baseline(num_players, max_rounds, score_to_win, games=_ROUND_SIM_GAMES)["mean_rounds"]
+
+
+def _history(stats: dict, model: str) -> dict:
+    return stats.get(model) or stats.get(model.split("/", 1)[-1], {})
+
+
+def _stat(stats: dict, model: str, purpose: str, key: str):
+    by_purpose = _history(stats, model)
+    for entry in (by_purpose.get(purpose), by_purpose.get("*")):
+        if entry and entry.get(key) is not None:
+            return entry[key]
+    return None
+
+
+def _makespan(durations: list[float], slots: int) -> float:
+    """Finish time of ``durations`` run longest first on ``slots`` parallel slots."""
+    ends = [0.0] * max(1, slots)
+    for d in sorted(durations, reverse=True):
+        i = ends.index(min(ends))
+        ends[i] += d
+    return max(ends)
+
+
+def estimate_trials(
+    trials: list[Trial],
+    max_concurrent_games: int = 4,
+    concurrency: ConcurrencyBudget | None = None,
+    history: dict[str, dict[str, dict]] | None = None,
+) -> dict:
+    """Estimate requests, clue cache hits, tokens, spend and wall time for the trials not yet done.
+
+    ``history`` is CallHistory.model_stats() output (default: the recorded history).
+    """
+    trials = [t for t in trials if t.status != "done"]
+    stats = history if history is not None else get_call_history().model_stats()
+    cache = get_cache()
+    decks: dict[str, list[str] | None] = {}
+    warnings: list[str] = []
+    players: dict[tuple[str, str], dict] = {}   # (run, player name) -> totals
+    provider_seconds: dict[str, float] = {}
+    game_seconds: list[float] = []
+    requests_max = speculative_max = 0
+    total_rounds = 0.0
+
+    def deck(directory: str) -> list[str] | None:
+        if directory not in decks:
+            try:
+                decks[directory] = get_manifests().deck_paths(directory)
+            except Exception as exc:
+                decks[directory] = None
+                warnings.append(f"Can't list cards of '{directory}' ({exc}); no clue cache hits assumed")
+        return decks[directory]
+
+    for trial in trials:
+        params = trial.params
+        specs = params["players"]
+        n = len(specs)
+        max_rounds, score_to_win = params.get("max_rounds", 10), params.get("score_to_win", 30)
+        rounds = expected_rounds(n, max_rounds, score_to_win)
+        total_rounds += rounds
+        per_round = requests_per_round(n)
+        requests_max += max_rounds * sum(per_round.values())
+        if params.get("speculative_clues"):
+            budget = params.get("speculation_budget")
+            calls = params["speculative_clues"] * (max_rounds - 1)
+            speculative_max += calls if budget is None else min(budget, calls)
+        paths = deck(params["image_directory"]) if params.get("use_cache", True) else None
+
+        clue_seconds = score_seconds = 0.0
+        for spec, name in zip(specs, seat_names(specs)):
+            model = spec["model"]
+            provider = model.split("/")[0] if "/" in model else spec.get("provider", "unknown")
+            style = get_prompt_style(spec.get("prompt_style") or params.get("prompt_style", "creative"))
+            phases = {
+                "clue": rounds / n,
+                "pick": rounds * (n - 1) / n * HAND_SIZE,
+                "vote": rounds * (n - 1) / n * (n - 1),
+            }
+            hit_rate = cache.count_cached(model, style.clue_prompt, paths) / len(paths) if paths else 0.0
+            hits = phases["clue"] * hit_rate
+
+            entry = players.setdefault((trial.run, name), {
+                "run": trial.run, "player": name, "model": model, "games": 0,
+                "clue": 0.0, "pick": 0.0, "vote": 0.0, "clue_cache_hits": 0.0,
+                "prompt_tokens": 0.0, "completion_tokens": 0.0, "cost": 0.0,
+                "history_calls": sum(e["calls"] for p, e in _history(stats, model).items() if p != "*"),
+            })
+            entry["games"] += 1
+            entry["clue_cache_hits"] += hits
+            for phase, count in phases.items():
+                entry[phase] += count
+                purpose = PHASE_PURPOSE[phase]
+                sent = count - hits if phase == "clue" else count
+                latency = _stat(stats, model, purpose, "latency_s") or DEFAULT_LATENCY_S[purpose]
+                provider_seconds[provider] = provider_seconds.get(provider, 0.0) + sent * latency
+                for key in ("prompt_tokens", "completion_tokens", "cost"):
+                    per_call = _stat(stats, model, purpose, key)
+                    if per_call is None or entry[key] is None:
+                        entry[key] = None
+                    else:
+                        entry[key] += sent * per_call
+            clue_latency = _stat(stats, model, "clue", "latency_s") or DEFAULT_LATENCY_S["clue"]
+            clue_seconds += (1 - hit_rate) * clue_latency / n  # storytellers rotate
+            score_seconds = max(score_seconds, _stat(stats, model, "score", "latency_s") or DEFAULT_LATENCY_S["score"])
+        # Per round: the clue, then the pick and vote phases, each as slow as the slowest player
+        game_seconds.append(rounds * (clue_seconds + 2 * score_seconds))
+
+    concurrency = concurrency or ConcurrencyBudget()
+    bounds = {"games": _makespan(game_seconds, max_concurrent_games)}
+    if concurrency.max_requests:
+        bounds["global request limit"] = sum(provider_seconds.values()) / concurrency.max_requests
+    for provider, limit in concurrency.per_provider.items():
+        if limit and provider in provider_seconds:
+            bounds[f"{provider} request limit"] = provider_seconds[provider] / limit
+    bottleneck = max(bounds, key=bounds.get)
+
+    rows = list(players.values())
+    by_phase = {phase: round(sum(r[phase] for r in rows), 1) for phase in PHASE_PURPOSE}
+    hits = round(sum(r["clue_cache_hits"] for r in rows), 1)
+    tokens = {key: _total(rows, key) for key in ("prompt_tokens", "completion_tokens", "cost")}
+    for row in rows:
+        for key in ("clue", "pick", "vote", "clue_cache_hits", "prompt_tokens", "completion_tokens"):
+            if row[key] is not None:
+                row[key] = round(row[key], 1)
+        if row["cost"] is not None:
+            row["cost"] = round(row["cost"], 4)
+    unpriced = sorted({r["model"] for r in rows if r["cost"] is None})
+    return {
+        "trials": len(trials),
+        "expected_rounds": round(total_rounds / len(trials), 2) if trials else 0.0,
+        "requests": {**by_phase, "total": round(sum(by_phase.values()), 1)},
+        "requests_max": requests_max,
+        "speculative_max": speculative_max,
+        "clue_cache_hits": hits,
+        **tokens,
+        "unpriced_models": unpriced,   # no cost history: excluded from "cost"
+        "no_history_models": sorted({r["model"] for r in rows if not r["history_calls"]}),
+        "wall_time_s": round(bounds[bottleneck], 1),
+        "bottleneck": bottleneck,
+        "players": rows,
+        "warnings": warnings,
+    }
+
+
+def _total(rows: list[dict], key: str) -> float | None:
+    known = [r[key] for r in rows if r[key] is not None]
+    return round(sum(known), 1 if key.endswith("tokens") else 4) if known else None
@@ -9,6 +9,10 @@ Required env vars:
 
 Optional:
   FIREBASE_COLLECTION        — Firestore collection name (default: dixit_games)
+
+Games are stored in the compact schema of core.log_schema; get_game() and
+list_games() expand documents back to the v1 shape, whichever schema they
+were saved in.
 """
 
 import json
@@ -16,6 +20,8 @@ import logging
 import os
 from typing import Any
 
+from core.log_schema import expand_log
+
 logger = logging.getLogger(__name__)
 
 _db = None
@@ -103,7 +109,7 @@ def get_game(game_id: str) -> dict | None:
             return None
         d = snap.to_dict()
         d.pop("_created_at", None)
-        return d
+        return expand_log(d)
     except Exception as exc:
         logger.error("Firestore get failed for game %s: %s", game_id, exc)
         return None
@@ -144,7 +150,7 @@ def list_games() -> list[dict]:
         for doc in docs:
             d = doc.to_dict()
             d.pop("_created_at", None)
-            results.append(d)
+            results.append(expand_log(d))
         return results
     except Exception as exc:
         logger.error("Firestore list failed: %s", exc)
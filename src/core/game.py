@@ -10,27 +10,55 @@ Each player entry is a dict:
 
 The event_bus (if provided) receives real-time events during play,
 consumed by the WebSocket route for live streaming.
+
+State is checkpointed after every round (core.checkpoint); an interrupted
+game continues from its last completed round with resume_game(game_id).
 """
 
 import asyncio
 import logging
 import os
 import random
+import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING
 
+from core.budget import BudgetExceeded, SpendBudget, get_global_budget
 from core.cache import get_cache
+from core.call_history import get_call_history
+from core.checkpoint import decode_rng_state, delete_checkpoint, encode_rng_state, load_checkpoint, save_checkpoint
+from core.concurrency import ConcurrencyBudget
+from core.game_log import LOG_PREFIX, GameLogWriter, compress_file, log_codec
+from core.log_schema import compact_log
+from core.manifest import get_manifests
 from core.prompts import PromptStyle, get_prompt_style
-from core.scoring import compute_score_changes
+from core.rules import DixitState
 from vision.base import VisionAPI
 from vision.factory import create_vision_client
+from vision.instrumentation import call_purpose
 
 if TYPE_CHECKING:
     from api.events import EventBus
 
 logger = logging.getLogger(__name__)
 
+# Score assumed for a card when the model's answer is unusable or never arrives
+DEFAULT_SCORE = 5.0
+PHASES = ("clue", "pick", "vote")
+TIMEOUT_FILLS = ("default", "best")
+GAME_LOGS_DIR = os.getenv("GAME_LOGS_DIR", "game_logs")
+
+
+def seat_names(players: list[dict]) -> list[str]:
+    """Player names for play_game's ``players`` specs: the given "name", else "<model>_<seat>"."""
+    return [spec.get("name") or f"{spec['model'].split('/')[-1]}_{i+1}" for i, spec in enumerate(players)]
+
+
+def new_game_id() -> str:
+    """Timestamp-prefixed game id with a random suffix, unique even for games started in the same second."""
+    return f"{datetime.now():%Y%m%d_%H%M%S}_{uuid.uuid4().hex[:6]}"
+
 
 # ---------------------------------------------------------------------------
 # Data models
@@ -68,20 +96,56 @@ class Player:
 # ---------------------------------------------------------------------------
 
 class AIPlayer:
-    def __init__(self, player: Player, vision_api: VisionAPI, style: PromptStyle, use_cache: bool = True):
+    def __init__(
+        self,
+        player: Player,
+        vision_api: VisionAPI,
+        style: PromptStyle,
+        use_cache: bool = True,
+        concurrency: ConcurrencyBudget | None = None,
+        spend: SpendBudget | None = None,
+    ):
         self.player = player
         self.vision_api = vision_api
         self.style = style
         self.use_cache = use_cache
+        self.concurrency = concurrency
+        self.spend = spend
         self._cache = get_cache()
+        get_call_history()  # start recording per-call latency and usage
 
-    async def _call(self, image_path: str, prompt: str, max_tokens: int, temperature: float) -> str:
+    async def _request(self, image_path: str, prompt: str, max_tokens: int, temperature: float) -> str | None:
+        """One uncached request, checked against and charged to the spend budget (None once degraded)."""
+        if self.spend is None:
+            return await self.vision_api.analyze_image(image_path, prompt, max_tokens, temperature)
+        model = self.player.model
+        try:
+            self.spend.check(model)
+        except BudgetExceeded as exc:
+            if not exc.degrade:
+                raise
+            self.spend.degrade(model, exc)
+            return None
+        with self.spend.track(model):
+            return await self.vision_api.analyze_image(image_path, prompt, max_tokens, temperature)
+
+    async def _call(self, image_path: str, prompt: str, max_tokens: int, temperature: float, purpose: str) -> str:
         if self.use_cache:
             cached = self._cache.get(self.player.model, image_path, prompt)
             if cached is not None:
                 return cached
 
-        response = await self.vision_api.analyze_image(image_path, prompt, max_tokens, temperature)
+        token = call_purpose.set(purpose)
+        try:
+            if self.concurrency is not None:
+                async with self.concurrency.slot(self.player.provider_label):
+                    response = await self._request(image_path, prompt, max_tokens, temperature)
+            else:
+                response = await self._request(image_path, prompt, max_tokens, temperature)
+        finally:
+            call_purpose.reset(token)
+        if response is None:
+            return ""
         if not response:
             logger.warning("Empty response from %s for %s — skipping cache", self.player.model, image_path)
             return ""
@@ -92,26 +156,86 @@ class AIPlayer:
         return response
 
     async def generate_clue(self, card: Card) -> str:
-        return await self._call(card.image_path, self.style.clue_prompt, self.style.max_tokens, self.style.temperature)
+        return await self._call(
+            card.image_path, self.style.clue_prompt, self.style.max_tokens, self.style.temperature, "clue",
+        )
 
     async def score_card(self, card: Card, clue: str) -> float:
         if not clue:
-            return 5.0
+            return DEFAULT_SCORE
         prompt = self.style.vote_prompt.format(clue=clue)
-        raw = await self._call(card.image_path, prompt, 16, self.style.temperature)
+        raw = await self._call(card.image_path, prompt, 16, self.style.temperature, "score")
+        if not raw:
+            return DEFAULT_SCORE  # already logged: empty response or no budget left
         try:
             # Accept the first token that looks like a number (handles "7/10", "7.", "7,", etc.)
             first = raw.strip().split()[0].rstrip('.,/').split('/')[0]
             return float(first)
         except (ValueError, IndexError):
             logger.warning("Could not parse score from '%s' for %s, defaulting to 5", raw[:80], card.image_path)
-            return 5.0
-
-    async def select_best_card(self, cards: list[Card], clue: str) -> tuple[Card, dict[str, float]]:
-        scores_list = await asyncio.gather(*[self.score_card(c, clue) for c in cards])
-        scores = {c.image_path: s for c, s in zip(cards, scores_list)}
-        best = max(cards, key=lambda c: scores[c.image_path])
-        return best, scores
+            return DEFAULT_SCORE
+
+    def start_scoring(self, cards: list[Card], clue: str) -> dict[str, asyncio.Task]:
+        """Start scoring ``cards`` against ``clue`` in the background; returns card path → task."""
+        return {c.image_path: asyncio.ensure_future(self.score_card(c, clue)) for c in cards}
+
+    async def select_best_card(
+        self,
+        cards: list[Card],
+        clue: str,
+        deadline: float | None = None,
+        fill: str = "default",
+        known: dict[str, float] | None = None,
+        started: dict[str, asyncio.Task] | None = None,
+    ) -> tuple[Card, dict[str, float], list[str]]:
+        """Score every card against the clue and return (best card, scores, timed-out card paths).
+
+        ``deadline`` is an absolute event-loop time.  Cards still being scored
+        when it passes are cancelled and get DEFAULT_SCORE.  With
+        ``fill="best"`` the choice is restricted to the cards that did finish
+        (the best score so far), unless none did.  Scores in ``known`` (card
+        path → score for this same clue) are reused instead of re-requested,
+        and tasks in ``started`` (from start_scoring) are awaited instead of
+        starting new requests.
+        """
+        known = known or {}
+        started = started or {}
+        tasks = {
+            c.image_path: started.get(c.image_path) or asyncio.ensure_future(self.score_card(c, clue))
+            for c in cards if c.image_path not in known
+        }
+        done: set[asyncio.Future] = set()
+        pending: set[asyncio.Future] = set()
+        try:
+            if tasks:
+                timeout = None if deadline is None else max(deadline - asyncio.get_running_loop().time(), 0.0)
+                done, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+        finally:
+            # Propagate cancellation of this coroutine to in-flight requests
+            for task in tasks.values():
+                if not task.done():
+                    task.cancel()
+
+        # Observe every failure (e.g. BudgetExceeded from several cards), then raise the first
+        errors = [t.exception() for t in done if not t.cancelled() and t.exception() is not None]
+        if errors:
+            raise errors[0]
+        timed_out = [path for path, task in tasks.items() if task in pending]
+        scores = {}
+        for c in cards:
+            task = tasks.get(c.image_path)
+            if task is None:
+                scores[c.image_path] = known[c.image_path]
+            else:
+                scores[c.image_path] = DEFAULT_SCORE if task in pending else task.result()
+        candidates = cards
+        if fill == "best" and 0 < len(timed_out) < len(cards):
+            candidates = [c for c in cards if c.image_path not in timed_out]
+        best = max(candidates, key=lambda c: scores[c.image_path])
+        return best, scores, timed_out
 
 
 # ---------------------------------------------------------------------------
@@ -119,34 +243,27 @@ class AIPlayer:
 # ---------------------------------------------------------------------------
 
 class Deck:
-    def __init__(self, image_directory: str):
+    def __init__(self, image_directory: str, rng: random.Random | None = None):
         """Load cards from a local directory or a Firebase Storage collection name.
 
         If ``image_directory`` is a path that exists on disk, images are loaded
         from there.  Otherwise it is treated as a Firebase Storage collection name
-        and cards are loaded as public URLs.
+        and cards are loaded as public URLs.  Either way the card list comes
+        from the shared manifest cache (core.manifest), not a fresh scan.
+        Cards are sorted before being shuffled with ``rng`` (default: the
+        global random module), so a seeded rng always deals the same deck.
         """
-        self.cards: list[Card] = []
-        if os.path.isdir(image_directory):
-            for fn in os.listdir(image_directory):
-                if fn.lower().endswith((".jpg", ".jpeg", ".png")):
-                    self.cards.append(Card(os.path.join(image_directory, fn)))
-        else:
-            # Firebase Storage collection
-            from core.firebase_storage import get_collection_urls, is_available as storage_ok
-            if not storage_ok():
-                raise ValueError(
-                    f"Image directory '{image_directory}' does not exist locally "
-                    "and Firebase Storage is not configured."
-                )
-            urls = get_collection_urls(image_directory)
-            if not urls:
-                raise ValueError(f"Firebase collection '{image_directory}' is empty or not found.")
-            for _filename, url in urls:
-                self.cards.append(Card(url))
+        self.cards: list[Card] = [Card(p) for p in sorted(get_manifests().deck_paths(image_directory))]
         if not self.cards:
             raise ValueError(f"No card images found in '{image_directory}'.")
-        random.shuffle(self.cards)
+        (rng or random).shuffle(self.cards)
+
+    @classmethod
+    def from_paths(cls, paths: list[str]) -> "Deck":
+        """Rebuild a deck in a known order (e.g. from a checkpoint) without listing or shuffling."""
+        deck = cls.__new__(cls)
+        deck.cards = [Card(p) for p in paths]
+        return deck
 
     def deal(self, count: int) -> list[Card]:
         dealt, self.cards = self.cards[:count], self.cards[count:]
@@ -156,36 +273,113 @@ class Deck:
         return len(self.cards)
 
 
+# ---------------------------------------------------------------------------
+# Speculative clues
+# ---------------------------------------------------------------------------
+
+class ClueSpeculator:
+    """
+    In-memory slot of clues generated ahead of time for the next storyteller.
+
+    The next storyteller is known during the current round, and so are the
+    cards they keep in hand after picking.  While the vote runs, clues for up
+    to ``per_round`` of those cards are started in the background; next round
+    the chosen card's clue is taken from the slot and the rest are cancelled.
+    Every speculative call that isn't used counts as wasted, and speculation
+    never starts more calls than ``budget`` (max wasted calls per game, None =
+    unlimited) still allows.
+    """
+
+    def __init__(self, per_round: int, budget: int | None = None):
+        self.per_round = per_round
+        self.budget = budget
+        self.calls = 0
+        self.hits = 0
+        self.wasted = 0
+        self._slot: dict[str, asyncio.Task] = {}
+
+    def start(self, ai: AIPlayer, cards: list[Card]) -> None:
+        allowed = self.per_round if self.budget is None else min(self.per_round, self.budget - self.wasted)
+        for card in cards[:max(allowed, 0)]:
+            self._slot[card.image_path] = asyncio.ensure_future(ai.generate_clue(card))
+            self.calls += 1
+
+    def take(self, card: Card) -> asyncio.Task | None:
+        """Return the speculative clue task for ``card`` (if any) and discard the others."""
+        task = self._slot.pop(card.image_path, None)
+        if task is not None:
+            self.hits += 1
+        self.discard()
+        return task
+
+    def discard(self) -> None:
+        for task in self._slot.values():
+            task.cancel()
+        self.wasted += len(self._slot)
+        self._slot.clear()
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "hits": self.hits,
+            "wasted": self.wasted,
+            "hit_rate": round(self.hits / self.calls, 3) if self.calls else None,
+        }
+
+
 # ---------------------------------------------------------------------------
 # Logger
 # ---------------------------------------------------------------------------
 
 class GameLogger:
-    def __init__(self, game_id: str, output_dir: str = "game_logs"):
+    """Keeps the game log in memory and appends it to a JSONL file as it grows (see core.game_log)."""
+
+    def __init__(self, game_id: str, output_dir: str | None = None):
+        output_dir = output_dir or GAME_LOGS_DIR
         self.game_id = game_id
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
+        self.path = os.path.join(output_dir, f"{LOG_PREFIX}{game_id}.jsonl")
+        self._writer = GameLogWriter(self.path)
+        self._codec = log_codec()
         self._log: dict = {"game_id": game_id, "game_configuration": {}, "rounds": []}
+        self._stats: dict = {}
 
     def log_config(self, params: dict) -> None:
         self._log["game_configuration"] = params
+        self._writer.header(self.game_id, params)
 
     def log_round(self, round_data: dict) -> None:
         self._log["rounds"].append(round_data)
+        self._writer.round(round_data)
+
+    def log_stats(self, name: str, data: dict) -> None:
+        self._log[name] = data
+        self._stats[name] = data
+
+    def log_status(self, status: str, detail: dict) -> None:
+        """Record why the game stopped short ("budget_exhausted", "cancelled"); a resume starts the file over."""
+        self._writer.status(status, detail)
+
+    def restore(self, log: dict) -> None:
+        """Continue from a checkpointed log; the file is rewritten so no round appears twice."""
+        self._log = log
+        self._writer.rewrite(log)
 
     def save(self) -> str:
-        import json
         from core.firebase_store import save_game, is_available as firebase_available
 
         # Always save locally as backup / when Firebase is not configured
-        path = os.path.join(self.output_dir, f"dixit_game_log_{self.game_id}.json")
-        with open(path, "w") as f:
-            json.dump(self._log, f, indent=2)
+        rounds = self._log["rounds"]
+        final_scores = rounds[-1]["current_scores"] if rounds else {}
+        self._writer.trailer(final_scores, len(rounds), self._stats)
+        if self._codec:
+            self.path = compress_file(self.path, self._codec)
 
         if firebase_available():
-            save_game(self.game_id, self._log)
+            save_game(self.game_id, compact_log(self._log))
 
-        return path
+        return self.path
 
 
 # ---------------------------------------------------------------------------
@@ -201,6 +395,17 @@ async def play_game(
     use_cache: bool = True,
     game_id: str | None = None,
     event_bus: "EventBus | None" = None,
+    phase_timeouts: dict[str, float] | None = None,
+    round_timeout: float | None = None,
+    timeout_fill: str = "default",
+    concurrency: ConcurrencyBudget | None = None,
+    pipeline_votes: bool = True,
+    speculative_clues: int = 0,
+    speculation_budget: int | None = None,
+    seed: int | None = None,
+    budget: dict | None = None,
+    spend: SpendBudget | None = None,
+    _resume: dict | None = None,
 ) -> dict:
     """
     Run a full Dixit game asynchronously.
@@ -215,32 +420,120 @@ async def play_game(
         use_cache: Whether to use the SQLite response cache.
         game_id: Unique identifier for this game (used in log filenames and WS routing).
         event_bus: Optional EventBus for live WebSocket streaming.
+        phase_timeouts: Optional per-phase deadlines in seconds, keyed by
+                 "clue", "pick" and/or "vote".  A straggler's unfinished card
+                 scores are cancelled and filled in (see ``timeout_fill``); a
+                 late clue falls back to "mysterious".
+        round_timeout: Optional deadline in seconds for a whole round; caps
+                 every phase deadline inside that round.
+        timeout_fill: "default" — unfinished cards get DEFAULT_SCORE;
+                 "best" — the player picks the best card scored so far.
+        concurrency: Optional request budget shared with other games (see
+                 core.concurrency); used by the tournament scheduler.
+        pipeline_votes: Start each voter's scoring of a card as soon as that
+                 card is played (the storyteller's immediately), overlapping
+                 the vote phase with slower pickers.  Votes still resolve
+                 after all cards are in; scores and logs are identical to the
+                 sequential order (False).
+        speculative_clues: While a round votes, pre-generate clues for up to
+                 this many of the next storyteller's cards (0 = off).  The hit
+                 rate is written to the log under "speculation".
+        speculation_budget: Max speculative clue calls per game that may go
+                 unused; speculation stops once it would exceed this.
+        seed: Seed of the game's own RNG, which shuffles the deck, picks the
+                 storyteller cards and shuffles the table.  Recorded in the
+                 log; the same seed, cards and models replay the same calls,
+                 so a rerun is served from the response cache.  Default: drawn
+                 from the global random module.
+        budget: Optional spend limits for this game — requests, tokens,
+                 cost, per_model, prices, on_exhausted (see core.budget).
+                 With "stop" an exhausted budget ends the game after its last
+                 completed round, raising BudgetExceeded; the checkpoint is
+                 kept for resume_game.  The outcome is logged under "budget".
+        spend: Enclosing SpendBudget the game's spend also counts against
+                 (a tournament's); default: the global budget.
 
     Returns:
         Final game log as a dict.
     """
     if game_id is None:
-        game_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        game_id = new_game_id()
+    if seed is None:
+        seed = random.randrange(2**32)
+    rng = random.Random(seed)
+    phase_timeouts = dict(phase_timeouts or {})
+    unknown = set(phase_timeouts) - set(PHASES)
+    if unknown:
+        raise ValueError(f"Unknown phase(s) {sorted(unknown)} in phase_timeouts. Available: {list(PHASES)}")
+    if timeout_fill not in TIMEOUT_FILLS:
+        raise ValueError(f"Unknown timeout_fill '{timeout_fill}'. Available: {list(TIMEOUT_FILLS)}")
+
+    # Everything needed to restart this game from a checkpoint
+    params = {
+        "image_directory": image_directory,
+        "players": players,
+        "prompt_style": prompt_style,
+        "max_rounds": max_rounds,
+        "score_to_win": score_to_win,
+        "use_cache": use_cache,
+        "phase_timeouts": phase_timeouts,
+        "round_timeout": round_timeout,
+        "timeout_fill": timeout_fill,
+        "pipeline_votes": pipeline_votes,
+        "speculative_clues": speculative_clues,
+        "speculation_budget": speculation_budget,
+        "seed": seed,
+        "budget": budget,
+    }
+    game_spend = SpendBudget("game", budget, parent=spend or get_global_budget())
 
-    deck = Deck(image_directory)
+    deck = Deck(image_directory, rng) if _resume is None else Deck.from_paths(_resume["deck"])
     logger_obj = GameLogger(game_id)
 
     # Build players — each can have its own prompt style
     game_players: list[Player] = []
     ai_players: list[AIPlayer] = []
 
-    for i, spec in enumerate(players):
+    for spec, name in zip(players, seat_names(players)):
         model = spec["model"]
-        name = spec.get("name") or f"{model.split('/')[-1]}_{i+1}"
         provider_label = model.split("/")[0] if "/" in model else spec.get("provider", "unknown")
         player_style_name = spec.get("prompt_style") or prompt_style
         player_style = get_prompt_style(player_style_name)
         player = Player(name=name, model=model, provider_label=provider_label, prompt_style=player_style_name)
-        player.cards = deck.deal(6)
         game_players.append(player)
 
         vision_api = create_vision_client(model, spec.get("provider"))
-        ai_players.append(AIPlayer(player, vision_api, player_style, use_cache=use_cache))
+        ai_players.append(AIPlayer(
+            player, vision_api, player_style, use_cache=use_cache, concurrency=concurrency, spend=game_spend,
+        ))
+
+    # The rules run on card paths (core.rules); Card objects are looked up by path
+    names = [p.name for p in game_players]
+    if _resume is None:
+        state = DixitState.deal(
+            names, [c.image_path for c in deck.cards], max_rounds=max_rounds, score_to_win=score_to_win, rng=rng,
+        )
+    else:
+        state = DixitState(
+            names, {n: list(_resume["hands"][n]) for n in names}, [c.image_path for c in deck.cards],
+            scores=dict(_resume["scores"]), round=_resume["round"], max_rounds=max_rounds, score_to_win=score_to_win,
+            rng=rng,
+        )
+    cards = {c.image_path: c for c in deck.cards}
+    cards.update((path, Card(path)) for hand in state.hands.values() for path in hand if path not in cards)
+
+    def sync_players() -> None:
+        for player in game_players:
+            player.cards = [cards[path] for path in state.hands[player.name]]
+            player.score = state.scores[player.name]
+
+    sync_players()
+
+    all_paths = list(cards)
+    if all_paths and all_paths[0].startswith(("http://", "https://")):
+        # Remote collection: mirror the images locally (Gemini reads bytes from here; see core.mirror)
+        from core.mirror import get_mirror
+        await get_mirror().prefetch(all_paths)
 
     # Log config
     config = {
@@ -250,10 +543,21 @@ async def play_game(
         "max_rounds": max_rounds,
         "score_to_win": score_to_win,
         "use_cache": use_cache,
-        "deck_size": len(deck) + 6 * len(game_players),
+        "phase_timeouts": phase_timeouts,
+        "round_timeout": round_timeout,
+        "timeout_fill": timeout_fill,
+        "pipeline_votes": pipeline_votes,
+        "speculative_clues": speculative_clues,
+        "speculation_budget": speculation_budget,
+        "seed": seed,
+        "budget": budget,
+        "deck_size": len(cards),
         "players": [p.to_dict() for p in game_players],
     }
-    logger_obj.log_config(config)
+    if _resume is None:
+        logger_obj.log_config(config)
+    else:
+        logger_obj.restore(_resume["log"])
 
     async def emit(event: dict) -> None:
         if event_bus:
@@ -266,114 +570,230 @@ async def play_game(
         "prompt_style": prompt_style,
     })
 
+    loop = asyncio.get_running_loop()
+    speculator = ClueSpeculator(speculative_clues, speculation_budget) if speculative_clues > 0 else None
+
     # Game loop
-    round_num = 0
-    while round_num < max_rounds and all(p.score < score_to_win for p in game_players):
-        round_num += 1
-        logger.info("=== Round %d ===", round_num)
-        await emit({"type": "round_start", "round": round_num})
-
-        storyteller_idx = (round_num - 1) % len(game_players)
-        storyteller_player = game_players[storyteller_idx]
-        storyteller_ai = ai_players[storyteller_idx]
-
-        # Storyteller picks a card and generates a clue
-        storyteller_card = random.choice(storyteller_player.cards)
-        clue = await storyteller_ai.generate_clue(storyteller_card)
-        if not clue:
-            clue = "mysterious"
-            logger.warning("%s returned empty clue — using fallback '%s'", storyteller_player.name, clue)
-        logger.info("%s (storyteller) clue: %s", storyteller_player.name, clue)
-        await emit({
-            "type": "clue_generated",
-            "round": round_num,
-            "storyteller": storyteller_player.name,
-            "clue": clue,
-            "storyteller_card": storyteller_card.image_path,
-        })
-
-        # Non-storytellers pick their best card concurrently
-        non_storyteller_pairs = [
-            (game_players[i], ai_players[i])
-            for i in range(len(game_players))
-            if i != storyteller_idx
-        ]
-
-        async def _pick_card(player: Player, ai: AIPlayer) -> tuple[str, Card, dict[str, float]]:
-            card, scores = await ai.select_best_card(player.cards, clue)
-            return player.name, card, scores
-
-        pick_results = await asyncio.gather(*[_pick_card(p, a) for p, a in non_storyteller_pairs])
-
-        played_cards: dict[str, str] = {storyteller_player.name: storyteller_card.image_path}
-        played_card_objects: dict[str, Card] = {storyteller_player.name: storyteller_card}
-        round_log_played: dict[str, dict] = {}
-
-        for pname, card, scores in pick_results:
-            played_cards[pname] = card.image_path
-            played_card_objects[pname] = card
-            round_log_played[pname] = {"selected_card": card.image_path, "card_scores": scores}
-            await emit({"type": "card_selected", "round": round_num, "player": pname, "card": card.image_path})
-
-        # Shuffle all played cards for the voting phase
-        all_played = list(played_card_objects.values())
-        random.shuffle(all_played)
-
-        # All non-storytellers vote concurrently
-        async def _vote(player: Player, ai: AIPlayer) -> tuple[str, Card, dict[str, float]]:
-            card, scores = await ai.select_best_card(all_played, clue)
-            return player.name, card, scores
-
-        vote_results = await asyncio.gather(*[_vote(p, a) for p, a in non_storyteller_pairs])
-
-        votes: dict[str, str] = {}  # voter_name -> card_path
-        round_log_votes: dict[str, dict] = {}
-        for vname, card, scores in vote_results:
-            votes[vname] = card.image_path
-            round_log_votes[vname] = {"selected_card": card.image_path, "card_scores": scores}
-            await emit({"type": "vote_cast", "round": round_num, "player": vname, "voted_card": card.image_path})
-
-        # Score
-        result = compute_score_changes(
-            storyteller_name=storyteller_player.name,
-            all_player_names=[p.name for p in game_players],
-            votes=votes,
-            played_cards=played_cards,
-            storyteller_card_path=storyteller_card.image_path,
-        )
-        for player in game_players:
-            player.score += result.score_changes.get(player.name, 0)
-
-        current_scores = {p.name: p.score for p in game_players}
-        logger.info("Scores after round %d: %s", round_num, current_scores)
-        await emit({
-            "type": "round_scored",
-            "round": round_num,
-            "storyteller_votes": result.storyteller_votes,
-            "score_changes": result.score_changes,
-            "current_scores": current_scores,
-        })
-
-        # Deal replacement cards (fix: players always have cards)
-        for player in game_players:
-            # Remove the card that was played this round
-            played_path = played_cards.get(player.name)
-            player.cards = [c for c in player.cards if c.image_path != played_path]
-            # Deal one replacement if deck has cards
-            replacement = deck.deal(1)
-            player.cards.extend(replacement)
-
-        logger_obj.log_round({
-            "round": round_num,
-            "storyteller": storyteller_player.name,
-            "clue": clue,
-            "storyteller_card": storyteller_card.image_path,
-            "played_cards": round_log_played,
-            "votes": round_log_votes,
-            "storyteller_votes": result.storyteller_votes,
-            "score_changes": result.score_changes,
-            "current_scores": current_scores,
-        })
+    if _resume is not None:
+        rng.setstate(decode_rng_state(_resume["rng_state"]))
+        game_spend.restore(_resume.get("spend"))
+        if speculator and _resume.get("speculation"):
+            counters = _resume["speculation"]
+            speculator.calls, speculator.hits, speculator.wasted = counters["calls"], counters["hits"], counters["wasted"]
+        logger.info("Resuming game %s after round %d", game_id, state.round)
+        await emit({"type": "game_resumed", "round": state.round, "current_scores": dict(state.scores)})
+
+    # Background requests (pipelined vote scoring, speculative clues) must not
+    # outlive the game: cancelling play_game cancels them too.
+    vote_tasks: dict[str, dict[str, asyncio.Task]] = {}
+    try:
+        while not state.finished:
+            rnd = state.start_round()
+            round_num = rnd.number
+            logger.info("=== Round %d ===", round_num)
+            await emit({"type": "round_start", "round": round_num})
+            round_deadline = None if round_timeout is None else loop.time() + round_timeout
+            round_timeouts: dict[str, dict[str, list[str]]] = {}
+
+            def phase_deadline(phase: str) -> float | None:
+                limit = phase_timeouts.get(phase)
+                deadline = None if limit is None else loop.time() + limit
+                if round_deadline is not None:
+                    deadline = round_deadline if deadline is None else min(deadline, round_deadline)
+                return deadline
+
+            async def record_timeout(phase: str, player_name: str, cards: list[str]) -> None:
+                round_timeouts.setdefault(phase, {})[player_name] = cards
+                logger.warning("Round %d %s deadline passed for %s (%d unfinished)", round_num, phase, player_name, len(cards))
+                await emit({
+                    "type": "deadline_exceeded",
+                    "round": round_num,
+                    "phase": phase,
+                    "player": player_name,
+                    "timed_out_cards": cards,
+                    "timeout_fill": timeout_fill,
+                })
+
+            storyteller_idx = names.index(rnd.storyteller)
+            storyteller_player = game_players[storyteller_idx]
+            storyteller_ai = ai_players[storyteller_idx]
+
+            # Storyteller picks a card and generates a clue
+            storyteller_card = rng.choice(storyteller_player.cards)
+            clue_deadline = phase_deadline("clue")
+            speculated = speculator.take(storyteller_card) if speculator else None
+            try:
+                clue = await asyncio.wait_for(
+                    speculated or storyteller_ai.generate_clue(storyteller_card),
+                    None if clue_deadline is None else max(clue_deadline - loop.time(), 0.0),
+                )
+            except TimeoutError:
+                clue = ""
+                await record_timeout("clue", storyteller_player.name, [storyteller_card.image_path])
+            if not clue:
+                clue = "mysterious"
+                logger.warning("%s returned empty clue — using fallback '%s'", storyteller_player.name, clue)
+            logger.info("%s (storyteller) clue: %s", storyteller_player.name, clue)
+            rnd.tell(storyteller_card.image_path, clue)
+            await emit({
+                "type": "clue_generated",
+                "round": round_num,
+                "storyteller": storyteller_player.name,
+                "clue": clue,
+                "storyteller_card": storyteller_card.image_path,
+            })
+
+            # Non-storytellers pick their best card concurrently
+            non_storyteller_pairs = [
+                (game_players[i], ai_players[i])
+                for i in range(len(game_players))
+                if i != storyteller_idx
+            ]
+            round_started = loop.time()
+
+            # Vote scoring of a card doesn't depend on the other cards, so with
+            # pipeline_votes each voter starts on a card as soon as it is played.
+            vote_tasks = {p.name: {} for p, _ in non_storyteller_pairs}
+
+            def start_vote_scoring(card: Card, owner: str) -> None:
+                if not pipeline_votes:
+                    return
+                for voter, voter_ai in non_storyteller_pairs:
+                    if voter.name != owner:
+                        vote_tasks[voter.name].update(voter_ai.start_scoring([card], clue))
+
+            start_vote_scoring(storyteller_card, storyteller_player.name)
+
+            pick_deadline = phase_deadline("pick")
+            # (player, card) -> score against this round's clue, shared by the pick and vote phases
+            score_matrix: dict[tuple[str, str], float] = {}
+
+            async def _pick_card(player: Player, ai: AIPlayer) -> tuple[str, Card, dict[str, float]]:
+                card, scores, timed_out = await ai.select_best_card(player.cards, clue, pick_deadline, timeout_fill)
+                if timed_out:
+                    await record_timeout("pick", player.name, timed_out)
+                for path, score in scores.items():
+                    if path not in timed_out:
+                        score_matrix[(player.name, path)] = score
+                start_vote_scoring(card, player.name)
+                return player.name, card, scores
+
+            pick_results = await asyncio.gather(*[_pick_card(p, a) for p, a in non_storyteller_pairs])
+            picks_done = loop.time()
+
+            # The next storyteller's remaining hand is now known — speculate on it during the vote
+            next_idx = round_num % len(game_players)
+            if speculator and round_num < max_rounds and next_idx != storyteller_idx:
+                next_player = game_players[next_idx]
+                played = next(card for pname, card, _ in pick_results if pname == next_player.name)
+                speculator.start(ai_players[next_idx], [c for c in next_player.cards if c.image_path != played.image_path])
+
+            round_log_played: dict[str, dict] = {}
+            for pname, card, scores in pick_results:
+                rnd.play(pname, card.image_path)
+                round_log_played[pname] = {"selected_card": card.image_path, "card_scores": scores}
+            for pname, card, _ in pick_results:
+                await emit({"type": "card_selected", "round": round_num, "player": pname, "card": card.image_path})
+
+            # The played cards, shuffled for the voting phase
+            all_played = [cards[path] for path in rnd.table]
+
+            # All non-storytellers vote concurrently
+            vote_deadline = phase_deadline("vote")
+
+            scores_reused = 0
+
+            async def _vote(player: Player, ai: AIPlayer) -> tuple[str, Card, dict[str, float]]:
+                nonlocal scores_reused
+                known = {
+                    c.image_path: score_matrix[(player.name, c.image_path)]
+                    for c in all_played if (player.name, c.image_path) in score_matrix
+                }
+                scores_reused += len(known)
+                card, scores, timed_out = await ai.select_best_card(
+                    all_played, clue, vote_deadline, timeout_fill, known=known, started=vote_tasks[player.name],
+                )
+                if timed_out:
+                    await record_timeout("vote", player.name, timed_out)
+                return player.name, card, scores
+
+            vote_results = await asyncio.gather(*[_vote(p, a) for p, a in non_storyteller_pairs])
+            logger.info(
+                "Round %d timing: pick %.2fs, vote after picks %.2fs",
+                round_num, picks_done - round_started, loop.time() - picks_done,
+            )
+            if scores_reused:
+                logger.info("Round %d: reused %d pick-phase scores in the vote phase", round_num, scores_reused)
+
+            round_log_votes: dict[str, dict] = {}
+            for vname, card, scores in vote_results:
+                rnd.vote(vname, card.image_path)
+                round_log_votes[vname] = {"selected_card": card.image_path, "card_scores": scores}
+                await emit({"type": "vote_cast", "round": round_num, "player": vname, "voted_card": card.image_path})
+
+            # Score, discard the played cards and deal replacements
+            result = rnd.score()
+            sync_players()
+
+            current_scores = dict(state.scores)
+            logger.info("Scores after round %d: %s", round_num, current_scores)
+            await emit({
+                "type": "round_scored",
+                "round": round_num,
+                "storyteller_votes": result.storyteller_votes,
+                "score_changes": result.score_changes,
+                "current_scores": current_scores,
+            })
+
+            round_entry = {
+                "round": round_num,
+                "storyteller": storyteller_player.name,
+                "clue": clue,
+                "storyteller_card": storyteller_card.image_path,
+                "played_cards": round_log_played,
+                "votes": round_log_votes,
+                "storyteller_votes": result.storyteller_votes,
+                "score_changes": result.score_changes,
+                "current_scores": current_scores,
+                "scores_reused": scores_reused,
+            }
+            if round_timeouts:
+                round_entry["timeouts"] = round_timeouts
+            logger_obj.log_round(round_entry)
+            save_checkpoint(game_id, {
+                "params": params,
+                "round": round_num,
+                "deck": list(state.deck),
+                "hands": {name: list(hand) for name, hand in state.hands.items()},
+                "scores": dict(state.scores),
+                "rng_state": encode_rng_state(rng.getstate()),
+                "speculation": speculator.stats() if speculator else None,
+                "spend": game_spend.status(),
+                "log": logger_obj._log,
+            })
+    except BudgetExceeded as exc:
+        completed = len(logger_obj._log["rounds"])
+        logger.warning("Game %s stopped after round %d: %s", game_id, completed, exc)
+        logger_obj.log_status("budget_exhausted", {"reason": str(exc), "rounds": completed, "budget": game_spend.status()})
+        await emit({"type": "budget_exhausted", "scope": exc.scope, "reason": str(exc), "round": completed})
+        raise
+    except asyncio.CancelledError:
+        # Cancelled (DELETE /api/games/{id}) or interrupted; the checkpoint is kept and a resume rewrites the log
+        completed = len(logger_obj._log["rounds"])
+        logger.info("Game %s cancelled after round %d", game_id, completed)
+        logger_obj.log_status("cancelled", {"rounds": completed})
+        raise
+    finally:
+        for tasks in vote_tasks.values():
+            for task in tasks.values():
+                task.cancel()
+        if speculator:
+            speculator.discard()
+
+    if speculator:
+        logger.info("Speculative clues: %s", speculator.stats())
+        logger_obj.log_stats("speculation", speculator.stats())
+    logger_obj.log_stats("budget", game_spend.status())
 
     winner = max(game_players, key=lambda p: p.score)
     logger.info("Game over! Winner: %s (%d pts)", winner.name, winner.score)
@@ -385,5 +805,27 @@ async def play_game(
     })
 
     path = logger_obj.save()
+    delete_checkpoint(game_id)
     logger.info("Log saved: %s", path)
     return logger_obj._log
+
+
+async def resume_game(
+    game_id: str,
+    event_bus: "EventBus | None" = None,
+    concurrency: ConcurrencyBudget | None = None,
+    spend: SpendBudget | None = None,
+) -> dict:
+    """
+    Continue an interrupted game from its last checkpointed round.
+
+    Deck order, hands, scores, the RNG state and the rounds already logged are
+    restored, so completed rounds are not replayed.  Raises FileNotFoundError
+    when ``game_id`` has no checkpoint (unknown or already finished).
+    """
+    state = load_checkpoint(game_id)
+    if state is None:
+        raise FileNotFoundError(f"No checkpoint for game '{game_id}'")
+    return await play_game(
+        **state["params"], game_id=game_id, event_bus=event_bus, concurrency=concurrency, spend=spend, _resume=state,
+    )
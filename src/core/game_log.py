@@ -0,0 +1,280 @@
+from __future__ import annotations
+"""
+Game log files — append-only JSONL writer and streaming readers.
+
+A game is written to ``{GAME_LOGS_DIR}/dixit_game_log_{game_id}.jsonl`` as
+it is played, one JSON object per line, each flushed as soon as it is known:
+
+  {"type": "header",  "version": 2, "game_id": "...", "game_configuration": {...}}
+  {"type": "round",   "new_cards": ["path", ...], "data": {...round entry...}}   # one per round
+  {"type": "trailer", "finished_at": "...", "rounds": 7, "final_scores": {...}, "stats": {...}}
+  {"type": "status",  "status": "cancelled", "detail": {...}}   # stopped short: "cancelled" / "budget_exhausted"
+
+Version 2 round entries use the compact schema of core.log_schema; each
+round line appends the paths it introduces to the game's card table
+(``new_cards``), so ids resolve without rewriting the header.  Version 1
+lines hold plain round entries.
+
+When a game finishes its log can be compressed (GAME_LOG_COMPRESSION =
+gzip | zstd | none, default none) into ``.jsonl.gz`` / ``.jsonl.zst``; zstd
+needs the optional ``zstandard`` package and falls back to gzip without it.
+Running games always stay plain JSONL so they can be tailed.
+
+A log without a trailer belongs to a game still in progress (or one that was
+interrupted).  Older logs — a single ``dixit_game_log_{id}.json`` document,
+plain or compact — are read transparently, compressed or not, so every reader here returns the
+familiar v1 dict ``{"game_id", "game_configuration", "rounds", ...}`` plus a
+``status`` of "finished", "in_progress" or the status a game stopped short
+with (plus its ``status_detail``).
+"""
+
+import glob
+import gzip
+import io
+import json
+import logging
+import os
+from datetime import datetime
+from typing import IO, Iterator
+
+from core.log_schema import SCHEMA_VERSION, CardTable, compact_round, expand_log, expand_round
+
+logger = logging.getLogger(__name__)
+
+LOG_VERSION = SCHEMA_VERSION
+LOG_PREFIX = "dixit_game_log_"
+CODECS = {"gzip": ".gz", "zstd": ".zst"}
+# Most specific first; find_log() prefers a plain (possibly still running) log
+LOG_SUFFIXES = (".jsonl", ".jsonl.gz", ".jsonl.zst", ".json", ".json.gz", ".json.zst")
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+def log_codec(name: str | None = None) -> str | None:
+    """Resolve a codec name (default: GAME_LOG_COMPRESSION) to "gzip", "zstd" or None."""
+    name = (name if name is not None else os.getenv("GAME_LOG_COMPRESSION", "none")).lower()
+    if name in ("", "none", "off"):
+        return None
+    if name not in CODECS:
+        raise ValueError(f"Unknown game log compression '{name}'. Available: none, {', '.join(CODECS)}")
+    if name == "zstd" and _zstd() is None:
+        logger.warning("zstandard is not installed — compressing game logs with gzip instead")
+        return "gzip"
+    return name
+
+
+def _open_text(path: str) -> IO[str]:
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8")
+    if path.endswith(".zst"):
+        zstd = _zstd()
+        if zstd is None:
+            raise RuntimeError(f"Reading {path} requires the 'zstandard' package")
+        return io.TextIOWrapper(zstd.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True), encoding="utf-8")
+    return open(path, encoding="utf-8")
+
+
+def _strip_codec(path: str) -> str:
+    for ext in CODECS.values():
+        if path.endswith(ext):
+            return path[: -len(ext)]
+    return path
+
+
+def _is_jsonl(path: str) -> bool:
+    return _strip_codec(path).endswith(".jsonl")
+
+
+def compress_file(path: str, codec: str | None, level: int | None = None) -> str:
+    """Re-encode a log with ``codec`` (None = plain) and remove the original; returns the new path."""
+    target = _strip_codec(path) + (CODECS[codec] if codec else "")
+    if target == path:
+        return path
+    tmp = target + ".part"
+    with _open_text(path) as src:
+        data = src.read().encode("utf-8")
+    if codec == "gzip":
+        with gzip.open(tmp, "wb", compresslevel=9 if level is None else level) as f:
+            f.write(data)
+    elif codec == "zstd":
+        with open(tmp, "wb") as f:
+            f.write(_zstd().ZstdCompressor(level=3 if level is None else level).compress(data))
+    else:
+        with open(tmp, "wb") as f:
+            f.write(data)
+    os.replace(tmp, target)
+    os.remove(path)
+    return target
+
+
+# ---------------------------------------------------------------------------
+# Writer
+# ---------------------------------------------------------------------------
+
+class GameLogWriter:
+    """Appends header / round / trailer lines to a JSONL game log, flushing each one."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._table = CardTable()
+
+    def _append(self, record: dict, mode: str = "a") -> None:
+        with open(self.path, mode) as f:
+            f.write(json.dumps(record) + "\n")
+            f.flush()
+
+    def header(self, game_id: str, config: dict) -> None:
+        self._table = CardTable()
+        self._append({"type": "header", "version": LOG_VERSION, "game_id": game_id, "game_configuration": config}, mode="w")
+
+    def round(self, round_data: dict) -> None:
+        known = len(self._table)
+        data = compact_round(round_data, self._table)
+        self._append({"type": "round", "new_cards": self._table.paths[known:], "data": data})
+
+    def trailer(self, final_scores: dict, rounds: int, stats: dict | None = None) -> None:
+        self._append({
+            "type": "trailer",
+            "finished_at": datetime.now().isoformat(timespec="seconds"),
+            "rounds": rounds,
+            "final_scores": final_scores,
+            "stats": stats or {},
+        })
+
+    def status(self, status: str, detail: dict) -> None:
+        self._append({"type": "status", "status": status, "detail": detail})
+
+    def rewrite(self, log: dict) -> None:
+        """Start the file over from an in-memory log (header + rounds), e.g. when resuming."""
+        self.header(log["game_id"], log.get("game_configuration", {}))
+        for round_data in log.get("rounds", []):
+            self.round(round_data)
+
+
+# ---------------------------------------------------------------------------
+# Readers
+# ---------------------------------------------------------------------------
+
+def iter_records(path: str) -> Iterator[dict]:
+    """Yield the records of a JSONL log one line at a time; a torn last line is ignored."""
+    with _open_text(path) as f:
+        for line in f:
+            if not line.endswith("\n"):
+                break  # partially written line of a running game
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def _from_records(records: Iterator[dict], rounds_after: int | None = 0) -> dict:
+    """Fold JSONL records into a log dict; rounds numbered <= rounds_after are skipped (None = keep none)."""
+    log: dict = {"game_id": "", "game_configuration": {}, "rounds": [], "status": "in_progress"}
+    rounds_total = 0
+    version = 1
+    paths: list[str] = []
+    last = None
+    for rec in records:
+        kind = rec.get("type")
+        if kind == "header":
+            version = rec.get("version", 1)
+            log["game_id"] = rec.get("game_id", "")
+            log["game_configuration"] = rec.get("game_configuration", {})
+        elif kind == "round":
+            rounds_total += 1
+            data = rec["data"]
+            if version >= SCHEMA_VERSION:
+                paths.extend(rec.get("new_cards", []))
+            if rounds_after is not None and data.get("round", rounds_total) > rounds_after:
+                log["rounds"].append(expand_round(data, paths) if version >= SCHEMA_VERSION else data)
+            last = data
+        elif kind == "trailer":
+            log["status"] = "finished"
+            log.update(rec.get("stats", {}))
+        elif kind == "status":
+            log["status"] = rec["status"]
+            log["status_detail"] = rec.get("detail", {})
+    if last is not None:
+        log["last_round"] = expand_round(last, paths) if version >= SCHEMA_VERSION else last
+    log["rounds_total"] = rounds_total
+    return log
+
+
+def load_log(path: str) -> dict:
+    """Load a whole game log (JSONL or legacy JSON) as a dict."""
+    if _is_jsonl(path):
+        log = _from_records(iter_records(path))
+        log.pop("last_round", None)
+        log.pop("rounds_total", None)
+        return log
+    with _open_text(path) as f:
+        log = expand_log(json.load(f))
+    log.setdefault("status", "finished")
+    return log
+
+
+def read_summary(path: str) -> dict:
+    """Header fields plus the last round only — enough for list views without holding every round."""
+    if _is_jsonl(path):
+        log = _from_records(iter_records(path), rounds_after=None)
+        last = log.pop("last_round", None)
+        log["rounds"] = [last] if last else []
+        return log
+    log = load_log(path)
+    log["rounds_total"] = len(log.get("rounds", []))
+    return log
+
+
+def tail_log(path: str, after_round: int = 0) -> dict:
+    """Rounds numbered after ``after_round`` plus the game's status, for polling a running game."""
+    if _is_jsonl(path):
+        log = _from_records(iter_records(path), rounds_after=after_round)
+        log.pop("last_round", None)
+        return log
+    log = load_log(path)
+    rounds = log.get("rounds", [])
+    log["rounds_total"] = len(rounds)
+    log["rounds"] = [r for r in rounds if r.get("round", 0) > after_round]
+    return log
+
+
+def game_id_from_path(path: str) -> str:
+    name = os.path.basename(path)[len(LOG_PREFIX):]
+    for suffix in LOG_SUFFIXES:
+        if name.endswith(suffix):
+            return name[: -len(suffix)]
+    return name
+
+
+def log_paths(logs_dir: str) -> list[str]:
+    """Every game log file in ``logs_dir`` (JSONL and legacy JSON, compressed or not)."""
+    paths = []
+    for suffix in LOG_SUFFIXES:
+        paths.extend(glob.glob(os.path.join(logs_dir, f"{LOG_PREFIX}*{suffix}")))
+    return paths
+
+
+def find_log(logs_dir: str, game_id: str) -> str | None:
+    for suffix in LOG_SUFFIXES:
+        path = os.path.join(logs_dir, f"{LOG_PREFIX}{game_id}{suffix}")
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def iter_logs(logs_dir: str, finished_only: bool = False) -> Iterator[dict]:
+    """Yield each game log in ``logs_dir`` one at a time; unreadable files are logged and skipped."""
+    for path in log_paths(logs_dir):
+        try:
+            log = load_log(path)
+        except Exception as exc:
+            logger.warning("Skipping %s: %s", path, exc)
+            continue
+        if finished_only and log.get("status") != "finished":
+            continue
+        yield log
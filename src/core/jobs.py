@@ -0,0 +1,258 @@
+from __future__ import annotations
+"""
+Persistent job queue for API-started games.
+
+Games are enqueued as rows of a SQLite table (JOBS_DB_PATH, default
+game_jobs.db) and dispatched from there instead of being started directly:
+
+  - at most MAX_CONCURRENT_GAMES (default 4) games run at once; waiting jobs
+    start highest ``priority`` first, then oldest first;
+  - a job is keyed by its game id, and new_game_id() adds a random suffix to
+    the timestamp, so games started in the same second never collide;
+  - jobs survive a restart: start() requeues jobs that were still running —
+    as a resume when the game left a checkpoint — and dispatches them with
+    the ones that were waiting;
+  - cancel(game_id) drops a waiting job, or cancels a running game together
+    with all of its in-flight vision requests (in-process, or in its worker
+    process when GAME_WORKERS > 0).
+
+Job statuses: queued → running → done | failed | cancelled | stopped.
+A game stopped by its spend budget (core.budget) ends "stopped" and keeps
+its checkpoint.  While the global budget is exhausted, queued jobs wait —
+in-process games only: with GAME_WORKERS > 0 spend is charged inside the
+workers, each against its own global budget, so the queue never sees it.
+
+Access via get_job_queue() to get the module-level singleton.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from core.budget import BudgetExceeded, get_global_budget
+from core.checkpoint import load_checkpoint
+from core.game import new_game_id, play_game, resume_game
+from core.workers import get_pool, worker_count
+
+if TYPE_CHECKING:
+    from api.events import EventBus
+
+logger = logging.getLogger(__name__)
+
+JOB_STATUSES = ("queued", "running", "done", "failed", "cancelled", "stopped")
+JOBS_DB_PATH = os.getenv("JOBS_DB_PATH", "game_jobs.db")
+MAX_CONCURRENT_GAMES = int(os.getenv("MAX_CONCURRENT_GAMES", 4))
+_instance: "JobQueue | None" = None
+
+
+def get_job_queue() -> "JobQueue":
+    global _instance
+    if _instance is None:
+        _instance = JobQueue()
+    return _instance
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec="milliseconds")
+
+
+class JobQueue:
+    def __init__(self, db_path: str = JOBS_DB_PATH, max_concurrent: int = MAX_CONCURRENT_GAMES):
+        self.db_path = db_path
+        self.max_concurrent = max(1, max_concurrent)
+        self._bus: "EventBus | None" = None
+        self._started = False
+        self._stopping = False
+        self._tasks: dict[str, asyncio.Task] = {}  # game_id -> running job
+        self._cancelling: set[str] = set()
+        self._init_db()
+
+    def _init_db(self) -> None:
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    game_id     TEXT PRIMARY KEY,
+                    kind        TEXT NOT NULL,      -- play | resume
+                    params      TEXT NOT NULL,      -- play_game keyword arguments (JSON)
+                    priority    INTEGER NOT NULL DEFAULT 0,
+                    status      TEXT NOT NULL,
+                    error       TEXT,
+                    result      TEXT,               -- {"game_id", "rounds", "final_scores"} (JSON)
+                    created_at  TEXT NOT NULL,
+                    started_at  TEXT,
+                    finished_at TEXT
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS jobs_queued ON jobs (status, priority DESC, created_at)")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> dict:
+        job = dict(row)
+        job["params"] = json.loads(job["params"])
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+    def _set(self, game_id: str, **fields) -> None:
+        cols = ", ".join(f"{k}=?" for k in fields)
+        with self._connect() as conn:
+            conn.execute(f"UPDATE jobs SET {cols} WHERE game_id=?", (*fields.values(), game_id))
+
+    # ------------------------------------------------------------------
+    # Queue
+    # ------------------------------------------------------------------
+
+    def enqueue(self, params: dict, priority: int = 0, kind: str = "play") -> dict:
+        """Queue a game (play_game keyword arguments) or, with kind="resume", a resume of params["game_id"].
+
+        Returns the job.  Raises ValueError if that game id already has a job
+        that is queued or running, or — for a new game — any job at all.
+        """
+        params = dict(params)
+        game_id = params.setdefault("game_id", new_game_id())
+        existing = self.get(game_id)
+        if existing is not None and (kind == "play" or existing["status"] in ("queued", "running")):
+            raise ValueError(f"Game '{game_id}' already has a {existing['status']} job")
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO jobs (game_id, kind, params, priority, status, created_at) "
+                "VALUES (?, ?, ?, ?, 'queued', ?)",
+                (game_id, kind, json.dumps(params), priority, _now()),
+            )
+        logger.info("Queued %s job for game %s (priority %d)", kind, game_id, priority)
+        self._dispatch()
+        return self.get(game_id)
+
+    def get(self, game_id: str) -> dict | None:
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE game_id=?", (game_id,)).fetchone()
+        return self._to_dict(row) if row else None
+
+    def list(self, status: str | None = None, limit: int = 100) -> list[dict]:
+        """Jobs, newest first (optionally only those with ``status``)."""
+        query, args = "SELECT * FROM jobs", []
+        if status is not None:
+            query += " WHERE status=?"
+            args.append(status)
+        query += " ORDER BY created_at DESC LIMIT ?"
+        with self._connect() as conn:
+            rows = conn.execute(query, (*args, limit)).fetchall()
+        return [self._to_dict(r) for r in rows]
+
+    async def cancel(self, game_id: str) -> dict | None:
+        """Cancel a queued or running job; returns the job (None if unknown)."""
+        job = self.get(game_id)
+        if job is None or job["status"] not in ("queued", "running"):
+            return job
+        task = self._tasks.get(game_id)
+        if task is None:
+            # Queued, or left "running" by a process that is gone
+            self._set(game_id, status="cancelled", finished_at=_now())
+        else:
+            self._cancelling.add(game_id)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        logger.info("Cancelled game %s", game_id)
+        return self.get(game_id)
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+
+    def start(self, event_bus: "EventBus | None" = None) -> None:
+        """Recover jobs interrupted by a restart and begin dispatching (call from the serving event loop)."""
+        if self._started:
+            return
+        self._bus = event_bus
+        self._started = True
+        self._stopping = False
+        with self._connect() as conn:
+            stale = conn.execute("SELECT game_id FROM jobs WHERE status='running'").fetchall()
+        for (game_id,) in stale:
+            try:
+                kind = "resume" if load_checkpoint(game_id) is not None else "play"
+            except ValueError:
+                kind = "play"
+            self._set(game_id, status="queued", kind=kind, started_at=None)
+            logger.info("Requeued interrupted game %s (%s)", game_id, kind)
+        self._dispatch()
+
+    def stop(self) -> None:
+        """Stop dispatching; running jobs stay "running" so the next start() resumes them."""
+        self._stopping = True
+        self._started = False
+
+    def _dispatch(self) -> None:
+        if not self._started or self._stopping:
+            return
+        exhausted = get_global_budget().exhausted()
+        if exhausted:
+            logger.warning("Global spend budget exhausted (%s); not starting queued games", "; ".join(exhausted))
+            return
+        while len(self._tasks) < self.max_concurrent:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT * FROM jobs WHERE status='queued' ORDER BY priority DESC, created_at, rowid LIMIT 1"
+                ).fetchone()
+                if row is None:
+                    return
+                claimed = conn.execute(
+                    "UPDATE jobs SET status='running', started_at=? WHERE game_id=? AND status='queued'",
+                    (_now(), row["game_id"]),
+                ).rowcount
+            if claimed:
+                job = self._to_dict(row)
+                self._tasks[job["game_id"]] = asyncio.get_running_loop().create_task(self._run(job))
+
+    async def _execute(self, job: dict) -> dict:
+        params, game_id = job["params"], job["game_id"]
+        if worker_count():
+            pool = get_pool()
+            pool.start(self._bus)
+            fut = pool.submit(params if job["kind"] == "play" else {"game_id": game_id}, kind=job["kind"])
+            try:
+                return await fut
+            except asyncio.CancelledError:
+                pool.cancel(game_id)
+                raise
+        if job["kind"] == "resume":
+            log = await resume_game(game_id, event_bus=self._bus)
+        else:
+            log = await play_game(**params, event_bus=self._bus)
+        rounds = log.get("rounds", [])
+        return {"game_id": game_id, "rounds": len(rounds), "final_scores": rounds[-1]["current_scores"] if rounds else {}}
+
+    async def _publish(self, game_id: str, event: dict) -> None:
+        if self._bus is not None:
+            await self._bus.publish(game_id, event)
+
+    async def _run(self, job: dict) -> None:
+        game_id = job["game_id"]
+        try:
+            result = await self._execute(job)
+            self._set(game_id, status="done", result=json.dumps(result), finished_at=_now())
+        except asyncio.CancelledError:
+            if game_id not in self._cancelling:
+                raise  # shutting down: stays "running" and is resumed on restart
+            self._set(game_id, status="cancelled", finished_at=_now())
+            await self._publish(game_id, {"type": "game_cancelled"})
+        except BudgetExceeded as exc:
+            self._set(game_id, status="stopped", error=str(exc), finished_at=_now())
+        except Exception as exc:
+            if self._stopping:
+                return
+            logger.exception("Game %s failed: %s", game_id, exc)
+            self._set(game_id, status="failed", error=str(exc), finished_at=_now())
+            await self._publish(game_id, {"type": "error", "message": str(exc)})
+        finally:
+            self._cancelling.discard(game_id)
+            self._tasks.pop(game_id, None)
+            self._dispatch()
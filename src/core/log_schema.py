@@ -0,0 +1,127 @@
+from __future__ import annotations
+"""
+Compact game-log schema (version 2).
+
+Version 1 rounds repeat full card paths — often long Firebase Storage URLs —
+as dict keys in every player's ``card_scores``.  Version 2 stores each card
+path once in a per-game card table and refers to it by integer id, with
+score vectors as arrays aligned to a list of card ids:
+
+  v1: "played_cards": {"p1": {"selected_card": "<path>", "card_scores": {"<path>": 7.0, ...}}}
+      "votes":        {"p1": {"selected_card": "<path>", "card_scores": {"<path>": 3.0, ...}}}
+
+  v2: "storyteller_card": 4,
+      "played_cards": {"p1": {"selected_card": 9, "cards": [9, 2, ...], "scores": [7.0, 1.0, ...]}},
+      "vote_cards":   [4, 9, 13],                     # shuffled voting order, shared by all voters
+      "votes":        {"p1": {"selected_card": 4, "scores": [3.0, 9.0, 2.0]}},
+      "timeouts":     {"pick": {"p1": [2, 5]}}
+
+A full v2 document (Firestore, converted .json files) carries
+``"schema_version": 2`` and ``"card_table": [path, ...]``; JSONL logs ship
+the table incrementally (see core.game_log).  Every reader expands v2 back
+to the v1 shape with expand_log()/expand_round(), so code that consumes
+logs only ever sees v1.
+"""
+
+SCHEMA_VERSION = 2
+
+
+class CardTable:
+    """Bidirectional card path <-> integer id mapping for one game."""
+
+    def __init__(self, paths: list[str] | None = None):
+        self.paths: list[str] = []
+        self._ids: dict[str, int] = {}
+        for path in paths or []:
+            self.id(path)
+
+    def id(self, path: str) -> int:
+        card_id = self._ids.get(path)
+        if card_id is None:
+            card_id = self._ids[path] = len(self.paths)
+            self.paths.append(path)
+        return card_id
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+
+def compact_round(round_data: dict, table: CardTable) -> dict:
+    """Return a v2 copy of a v1 round entry, registering its cards in ``table``."""
+    out = dict(round_data)
+    out["storyteller_card"] = table.id(round_data["storyteller_card"])
+
+    out["played_cards"] = {
+        name: {
+            "selected_card": table.id(pick["selected_card"]),
+            "cards": [table.id(p) for p in pick["card_scores"]],
+            "scores": list(pick["card_scores"].values()),
+        }
+        for name, pick in round_data.get("played_cards", {}).items()
+    }
+
+    votes = round_data.get("votes", {})
+    vote_cards = next((list(v["card_scores"]) for v in votes.values()), [])
+    out["vote_cards"] = [table.id(p) for p in vote_cards]
+    out["votes"] = {}
+    for name, vote in votes.items():
+        entry = {"selected_card": table.id(vote["selected_card"]), "scores": list(vote["card_scores"].values())}
+        if list(vote["card_scores"]) != vote_cards:
+            entry["cards"] = [table.id(p) for p in vote["card_scores"]]
+        out["votes"][name] = entry
+
+    if "timeouts" in round_data:
+        out["timeouts"] = {
+            phase: {name: [table.id(p) for p in paths] for name, paths in players.items()}
+            for phase, players in round_data["timeouts"].items()
+        }
+    return out
+
+
+def expand_round(round_data: dict, paths: list[str]) -> dict:
+    """Return the v1 form of a v2 round entry, resolving ids against the card table ``paths``."""
+    out = dict(round_data)
+    out["storyteller_card"] = paths[round_data["storyteller_card"]]
+
+    out["played_cards"] = {
+        name: {
+            "selected_card": paths[pick["selected_card"]],
+            "card_scores": {paths[c]: s for c, s in zip(pick["cards"], pick["scores"])},
+        }
+        for name, pick in round_data.get("played_cards", {}).items()
+    }
+
+    vote_cards = out.pop("vote_cards", [])
+    out["votes"] = {
+        name: {
+            "selected_card": paths[vote["selected_card"]],
+            "card_scores": {paths[c]: s for c, s in zip(vote.get("cards", vote_cards), vote["scores"])},
+        }
+        for name, vote in round_data.get("votes", {}).items()
+    }
+
+    if "timeouts" in round_data:
+        out["timeouts"] = {
+            phase: {name: [paths[c] for c in ids] for name, ids in players.items()}
+            for phase, players in round_data["timeouts"].items()
+        }
+    return out
+
+
+def compact_log(log: dict) -> dict:
+    """Return a v2 copy of a whole log document (no-op for logs already in v2)."""
+    if log.get("schema_version") == SCHEMA_VERSION:
+        return log
+    table = CardTable()
+    rounds = [compact_round(r, table) for r in log.get("rounds", [])]
+    return {**log, "schema_version": SCHEMA_VERSION, "card_table": table.paths, "rounds": rounds}
+
+
+def expand_log(log: dict) -> dict:
+    """Return the v1 form of a log document; v1 logs are returned unchanged."""
+    if log.get("schema_version") != SCHEMA_VERSION:
+        return log
+    paths = log.get("card_table", [])
+    out = {k: v for k, v in log.items() if k not in ("schema_version", "card_table")}
+    out["rounds"] = [expand_round(r, paths) for r in log.get("rounds", [])]
+    return out
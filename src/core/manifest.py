@@ -0,0 +1,215 @@
+from __future__ import annotations
+"""
+Collection manifest cache shared by the game engine and the collections routes.
+
+A manifest lists a collection's cards — filename, location (local path or
+public URL), size and sha256 — so starting a game or listing collections
+doesn't rescan directories or re-read Firestore every time:
+
+  - local collections (directories) are rebuilt only when the directory's
+    mtime changes, i.e. when files are added, removed or renamed; unchanged
+    files keep their hashes across rebuilds;
+  - Firebase collections are re-read from Firestore at most every
+    COLLECTION_MANIFEST_TTL seconds (default 300), and immediately after an
+    upload or delete through the API (invalidate()).
+
+sha256() answers content-hash lookups for local card files with a stat()
+instead of a full read, which the response cache uses for its keys.
+
+Access via get_manifests() to get the module-level singleton.
+"""
+
+import hashlib
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+_DATA_DIR = os.getenv("DATA_DIR", "data")
+_TTL = float(os.getenv("COLLECTION_MANIFEST_TTL", 300))
+_instance: "ManifestCache | None" = None
+
+
+def get_manifests() -> "ManifestCache":
+    global _instance
+    if _instance is None:
+        _instance = ManifestCache()
+    return _instance
+
+
+@dataclass
+class CardEntry:
+    filename: str
+    location: str               # local file path or public URL
+    size: int | None = None
+    sha256: str | None = None
+    mtime_ns: int | None = None  # local files: when sha256 was computed
+
+
+@dataclass
+class Manifest:
+    name: str
+    source: str                 # "local" | "firebase"
+    cards: list[CardEntry]
+    display_name: str = ""
+    meta: dict = field(default_factory=dict)  # extra Firestore metadata (created_at, …)
+    version: float = 0.0        # directory mtime (local) or fetch time (firebase)
+
+    def to_collection(self) -> dict:
+        """The /api/collections representation."""
+        if self.source == "local":
+            cards = [{"filename": c.filename, "url": f"/api/images/{self.name}/{c.filename}"} for c in self.cards]
+        else:
+            cards = [{"filename": c.filename, "url": c.location} for c in self.cards]
+        return {
+            **self.meta,
+            "name": self.name,
+            "display_name": self.display_name or self.name,
+            "source": self.source,
+            "image_count": len(self.cards),
+            "cards": cards,
+        }
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ManifestCache:
+    def __init__(self, data_dir: str = _DATA_DIR, ttl: float = _TTL):
+        self.data_dir = data_dir
+        self.ttl = ttl
+        self._local: dict[str, Manifest] = {}             # abspath(dir) -> manifest
+        self._remote: dict[str, tuple[float, Manifest | None]] = {}
+        self._remote_list: tuple[float, list[Manifest]] | None = None
+        self._data_dir_state: tuple[float, list[str]] | None = None
+        self._files: dict[str, CardEntry] = {}           # abspath(file) -> entry
+
+    # ------------------------------------------------------------------
+    # Local directories
+    # ------------------------------------------------------------------
+
+    def local(self, directory: str) -> Manifest:
+        """Manifest of a local image directory, rebuilt only when its mtime changes."""
+        key = os.path.abspath(directory)
+        mtime = os.stat(key).st_mtime
+        cached = self._local.get(key)
+        if cached is not None and cached.version == mtime:
+            return cached
+        previous = {c.filename: c for c in cached.cards} if cached else {}
+        cards = []
+        for entry in sorted(os.scandir(key), key=lambda e: e.name):
+            if not entry.is_file() or not entry.name.lower().endswith(IMAGE_EXTENSIONS):
+                continue
+            st = entry.stat()
+            card = previous.get(entry.name)
+            if card is None or card.size != st.st_size or card.mtime_ns != st.st_mtime_ns:
+                card = CardEntry(entry.name, entry.path, st.st_size, _sha256(entry.path), st.st_mtime_ns)
+            cards.append(card)
+            self._files[os.path.abspath(entry.path)] = card
+        manifest = Manifest(os.path.basename(key), "local", cards, version=mtime)
+        self._local[key] = manifest
+        logger.debug("Built manifest for %s (%d cards)", directory, len(cards))
+        return manifest
+
+    def local_collections(self) -> list[Manifest]:
+        """Manifests of every image directory under DATA_DIR (empty ones omitted)."""
+        try:
+            mtime = os.stat(self.data_dir).st_mtime
+        except OSError as exc:
+            logger.warning("Could not scan local collections: %s", exc)
+            return []
+        if self._data_dir_state is None or self._data_dir_state[0] != mtime:
+            dirs = sorted(e.path for e in os.scandir(self.data_dir) if e.is_dir())
+            self._data_dir_state = (mtime, dirs)
+        manifests = []
+        for path in self._data_dir_state[1]:
+            try:
+                manifest = self.local(path)
+            except OSError:
+                continue
+            if manifest.cards:
+                manifests.append(manifest)
+        return manifests
+
+    def sha256(self, path: str) -> str | None:
+        """Content hash of a local card file known to a manifest, if it hasn't changed since hashing."""
+        card = self._files.get(os.path.abspath(path))
+        if card is None:
+            return None
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return card.sha256 if (st.st_size, st.st_mtime_ns) == (card.size, card.mtime_ns) else None
+
+    # ------------------------------------------------------------------
+    # Firebase collections
+    # ------------------------------------------------------------------
+
+    def _from_firestore(self, meta: dict) -> Manifest:
+        from core.mirror import get_mirror
+
+        mirror = get_mirror()
+        cards = [CardEntry(c["filename"], c["url"], sha256=mirror.sha256(c["url"])) for c in meta.get("cards", [])]
+        extra = {k: v for k, v in meta.items() if k not in ("name", "display_name", "image_count", "cards")}
+        return Manifest(meta.get("name", ""), "firebase", cards, meta.get("display_name", ""), extra, time.time())
+
+    def remote(self, name: str) -> Manifest | None:
+        """Manifest of a Firebase collection (None if missing), re-read at most every ``ttl`` seconds."""
+        from core.firebase_storage import get_collection
+
+        cached = self._remote.get(name)
+        if cached is not None and time.time() - cached[0] < self.ttl:
+            return cached[1]
+        meta = get_collection(name)
+        manifest = self._from_firestore(meta) if meta else None
+        self._remote[name] = (time.time(), manifest)
+        return manifest
+
+    def remote_collections(self) -> list[Manifest]:
+        """Manifests of every Firebase collection, re-listed at most every ``ttl`` seconds."""
+        from core.firebase_storage import list_collections
+
+        if self._remote_list is None or time.time() - self._remote_list[0] >= self.ttl:
+            manifests = [self._from_firestore(meta) for meta in list_collections()]
+            now = time.time()
+            self._remote_list = (now, manifests)
+            for m in manifests:
+                self._remote[m.name] = (now, m)
+        return self._remote_list[1]
+
+    def invalidate(self, name: str | None = None) -> None:
+        """Drop cached Firebase manifests (one collection, or all); local ones self-invalidate by mtime."""
+        if name is None:
+            self._remote.clear()
+        else:
+            self._remote.pop(name, None)
+        self._remote_list = None
+
+    # ------------------------------------------------------------------
+    # Engine entry point
+    # ------------------------------------------------------------------
+
+    def deck_paths(self, image_directory: str) -> list[str]:
+        """Card paths for a deck: files of a local directory, else URLs of a Firebase collection."""
+        if os.path.isdir(image_directory):
+            return [os.path.join(image_directory, c.filename) for c in self.local(image_directory).cards]
+
+        from core.firebase_storage import is_available as storage_ok
+        if not storage_ok():
+            raise ValueError(
+                f"Image directory '{image_directory}' does not exist locally "
+                "and Firebase Storage is not configured."
+            )
+        manifest = self.remote(image_directory)
+        if manifest is None or not manifest.cards:
+            raise ValueError(f"Firebase collection '{image_directory}' is empty or not found.")
+        return [c.location for c in manifest.cards]
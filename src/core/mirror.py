@@ -0,0 +1,167 @@
+from __future__ import annotations
+"""
+Disk-backed mirror of remote card images (Firebase Storage public URLs).
+
+When a game starts on a remote collection, its images are prefetched with
+bounded concurrency into CARD_MIRROR_DIR (default ``.card_mirror``).  Entries
+already on disk are revalidated with If-None-Match / If-Modified-Since, so an
+unchanged collection costs one 304 per card at most once per
+CARD_MIRROR_MAX_AGE seconds (default 3600).
+
+Gemini, which needs image bytes, reads them from the mirror first via
+read_bytes(); so would an OpenAI-compatible client built with
+url_images=False, though the bundled ones (OpenRouter, Groq, xAI) and the
+direct OpenAI and Claude clients all pass URLs through.  The collection
+manifest takes each card's sha256 from the mirror.  The public URL stays
+the card's identity everywhere else — in game logs, events and the response
+cache key.
+
+Layout:
+  {root}/index.json        url -> {file, etag, last_modified, size, sha256, checked_at}
+  {root}/{sha1(url)}{ext}  image bytes
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+_MIRROR_DIR = os.getenv("CARD_MIRROR_DIR", ".card_mirror")
+_MAX_AGE = float(os.getenv("CARD_MIRROR_MAX_AGE", 3600))
+_instance: "CardMirror | None" = None
+
+
+def get_mirror(root: str = _MIRROR_DIR) -> "CardMirror":
+    global _instance
+    if _instance is None:
+        _instance = CardMirror(root)
+    return _instance
+
+
+def _is_url(image_path: str) -> bool:
+    return image_path.startswith(("http://", "https://"))
+
+
+class CardMirror:
+    def __init__(self, root: str = _MIRROR_DIR, max_age: float = _MAX_AGE):
+        self.root = root
+        self.max_age = max_age
+        self._index_path = os.path.join(root, "index.json")
+        self._index: dict[str, dict] = {}
+        if os.path.isfile(self._index_path):
+            try:
+                with open(self._index_path) as f:
+                    self._index = json.load(f)
+            except Exception as exc:
+                logger.warning("Could not read mirror index %s: %s — starting empty", self._index_path, exc)
+
+    def _file_for(self, url: str) -> str:
+        ext = os.path.splitext(url.split("?")[0])[1].lower() or ".img"
+        return hashlib.sha1(url.encode("utf-8")).hexdigest() + ext
+
+    def local_path(self, image_path: str) -> str | None:
+        """Return the mirrored file for a URL, or None if it isn't mirrored."""
+        if not _is_url(image_path):
+            return None
+        entry = self._index.get(image_path)
+        if entry is None:
+            return None
+        path = os.path.join(self.root, entry["file"])
+        return path if os.path.isfile(path) else None
+
+    def read_bytes(self, image_path: str) -> bytes | None:
+        path = self.local_path(image_path)
+        if path is None:
+            return None
+        with open(path, "rb") as f:
+            return f.read()
+
+    def sha256(self, image_path: str) -> str | None:
+        entry = self._index.get(image_path)
+        return entry.get("sha256") if entry and self.local_path(image_path) else None
+
+    async def _fetch(self, client: httpx.AsyncClient, url: str) -> str:
+        entry = self._index.get(url)
+        have_file = self.local_path(url) is not None
+        if have_file and time.time() - entry.get("checked_at", 0) < self.max_age:
+            return "fresh"
+
+        headers = {}
+        if have_file:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        resp = await client.get(url, headers=headers, follow_redirects=True)
+        if resp.status_code == 304 and have_file:
+            entry["checked_at"] = time.time()
+            return "revalidated"
+        resp.raise_for_status()
+
+        content = resp.content
+        filename = self._file_for(url)
+        await asyncio.to_thread(_write_atomic, os.path.join(self.root, filename), content)
+        self._index[url] = {
+            "file": filename,
+            "etag": resp.headers.get("etag"),
+            "last_modified": resp.headers.get("last-modified"),
+            "size": len(content),
+            "sha256": hashlib.sha256(content).hexdigest(),
+            "checked_at": time.time(),
+        }
+        return "downloaded"
+
+    async def prefetch(
+        self, urls: list[str], concurrency: int = 8, transport: httpx.AsyncBaseTransport | None = None,
+    ) -> dict[str, int]:
+        """Mirror every URL in ``urls``; returns counts per outcome. Failures are logged, not raised.
+
+        File writes run in a thread so a large collection doesn't stall the event loop.
+        """
+        urls = [u for u in urls if _is_url(u)]
+        counts = {"fresh": 0, "revalidated": 0, "downloaded": 0, "failed": 0}
+        if not urls:
+            return counts
+        os.makedirs(self.root, exist_ok=True)
+        sem = asyncio.Semaphore(concurrency)
+
+        async with httpx.AsyncClient(timeout=30.0, transport=transport) as client:
+            async def _one(url: str) -> None:
+                async with sem:
+                    try:
+                        counts[await self._fetch(client, url)] += 1
+                    except Exception as exc:
+                        counts["failed"] += 1
+                        logger.warning("Mirror fetch failed for %s: %s", url, exc)
+
+            await asyncio.gather(*[_one(u) for u in urls])
+
+        try:
+            await asyncio.to_thread(_write_atomic, self._index_path, json.dumps(self._index).encode("utf-8"))
+        except OSError as exc:
+            # The files are in place; the next prefetch just revalidates them again
+            logger.warning("Could not save mirror index %s: %s", self._index_path, exc)
+        logger.info("Card mirror: %s", counts)
+        return counts
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    # A unique temp file, so games prefetching the same collection at once never share one
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp)
+        raise
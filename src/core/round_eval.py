@@ -0,0 +1,158 @@
+from __future__ import annotations
+"""
+Offline round-level evaluation: screen models on rounds already in game logs.
+
+Every logged round has a clue, the cards on the table and the ground-truth
+storyteller card, so a model can be rated without playing full games:
+
+  - task "vote": the model scores each table card against the logged clue
+    and votes; it is right when it picks the storyteller's card.  The
+    original voters' accuracy on the same rounds is reported alongside.
+  - task "clue": the model writes a clue for the logged storyteller card and
+    ``judges`` (other models) vote on the logged table with it.  Reported:
+    the share of judge votes that find the card, and how often the clue
+    would have scored for the storyteller (found by some judges, not all).
+
+Rounds run concurrently under one ConcurrencyBudget, and calls go through
+AIPlayer, so the response cache makes re-runs and shared judges cheap.
+Table order is shuffled per round with a fixed seed (the storyteller card
+is never systematically first).
+"""
+
+import asyncio
+import logging
+import os
+import random
+from dataclasses import dataclass
+
+from core.concurrency import ConcurrencyBudget
+from core.game import AIPlayer, Card, Player
+from core.game_log import iter_logs
+from core.prompts import get_prompt_style
+from vision.factory import create_vision_client
+
+logger = logging.getLogger(__name__)
+
+TASKS = ("vote", "clue")
+
+
+@dataclass
+class LoggedRound:
+    game_id: str
+    round: int
+    clue: str
+    storyteller_card: str
+    table: list[str]          # storyteller card and every played card, shuffled
+    logged_votes: list[str]   # cards the original voters chose
+
+
+def logged_rounds(logs_dir: str, limit: int | None = None, seed: int = 0) -> list[LoggedRound]:
+    """Complete rounds of finished games under ``logs_dir`` (a seeded random sample of ``limit``)."""
+    rounds = []
+    for log in iter_logs(logs_dir, finished_only=True):
+        game_id = log.get("game_id", "")
+        for r in log.get("rounds", []):
+            clue, card = r.get("clue"), r.get("storyteller_card")
+            played = [p.get("selected_card") for p in r.get("played_cards", {}).values()]
+            if not clue or not card or not played or None in played:
+                continue
+            table = [card] + played
+            random.Random(f"{game_id}:{r.get('round')}").shuffle(table)
+            votes = [v.get("selected_card") for v in r.get("votes", {}).values()]
+            rounds.append(LoggedRound(game_id, r.get("round", 0), clue, card, table, votes))
+    missing = [r for r in rounds if any(not p.startswith(("http://", "https://")) and not os.path.isfile(p) for p in r.table)]
+    if missing:
+        logger.warning("Skipping %d rounds whose card files are not available locally", len(missing))
+        rounds = [r for r in rounds if r not in missing]
+    if limit is not None and len(rounds) > limit:
+        rounds = random.Random(seed).sample(rounds, limit)
+    return rounds
+
+
+def _ai_player(model: str, prompt_style: str, use_cache: bool, concurrency: ConcurrencyBudget | None) -> AIPlayer:
+    provider_label = model.split("/")[0] if "/" in model else "unknown"
+    player = Player(name=model, model=model, provider_label=provider_label, prompt_style=prompt_style)
+    return AIPlayer(player, create_vision_client(model), get_prompt_style(prompt_style),
+                    use_cache=use_cache, concurrency=concurrency)
+
+
+async def _vote_round(ai: AIPlayer, r: LoggedRound) -> dict:
+    best, scores, _ = await ai.select_best_card([Card(p) for p in r.table], r.clue)
+    ranked = sorted(r.table, key=lambda p: -scores[p])
+    return {"correct": best.image_path == r.storyteller_card, "rank": ranked.index(r.storyteller_card) + 1}
+
+
+async def _clue_round(ai: AIPlayer, judges: list[AIPlayer], r: LoggedRound) -> dict:
+    clue = await ai.generate_clue(Card(r.storyteller_card)) or "mysterious"
+    table = [Card(p) for p in r.table]
+    picks = await asyncio.gather(*[j.select_best_card(table, clue) for j in judges])
+    found = sum(best.image_path == r.storyteller_card for best, _, _ in picks)
+    return {"clue": clue, "found": found, "judges": len(judges)}
+
+
+def _vote_report(model: str, rounds: list[LoggedRound], results: list) -> dict:
+    ok = [res for res in results if not isinstance(res, BaseException)]
+    logged = [v for r in rounds for v in r.logged_votes]
+    return {
+        "model": model,
+        "task": "vote",
+        "rounds": len(ok),
+        "errors": len(results) - len(ok),
+        "accuracy": round(sum(res["correct"] for res in ok) / len(ok), 3) if ok else None,
+        "mean_reciprocal_rank": round(sum(1 / res["rank"] for res in ok) / len(ok), 3) if ok else None,
+        "chance": round(sum(1 / len(r.table) for r in rounds) / len(rounds), 3) if rounds else None,
+        "logged_voter_accuracy": round(
+            sum(v == r.storyteller_card for r in rounds for v in r.logged_votes) / len(logged), 3
+        ) if logged else None,
+    }
+
+
+def _clue_report(model: str, results: list) -> dict:
+    ok = [res for res in results if not isinstance(res, BaseException)]
+    votes = sum(res["judges"] for res in ok)
+    return {
+        "model": model,
+        "task": "clue",
+        "rounds": len(ok),
+        "errors": len(results) - len(ok),
+        "judge_accuracy": round(sum(res["found"] for res in ok) / votes, 3) if votes else None,
+        "storyteller_success_rate": round(
+            sum(0 < res["found"] < res["judges"] for res in ok) / len(ok), 3
+        ) if ok else None,
+        "examples": [res["clue"] for res in ok[:5]],
+    }
+
+
+async def evaluate_models(
+    models: list[str],
+    rounds: list[LoggedRound],
+    task: str = "vote",
+    judges: list[str] | None = None,
+    prompt_style: str = "creative",
+    concurrency: ConcurrencyBudget | None = None,
+    use_cache: bool = True,
+) -> list[dict]:
+    """Run ``task`` for every model over ``rounds``; returns one report per model.
+
+    A round whose calls fail counts under "errors" instead of aborting the run.
+    """
+    if task not in TASKS:
+        raise ValueError(f"Unknown task '{task}'. Available: {list(TASKS)}")
+    if task == "clue" and not judges:
+        raise ValueError("The clue task needs at least one judge model")
+    judge_ais = [_ai_player(j, prompt_style, use_cache, concurrency) for j in judges or []]
+
+    async def _run(model: str) -> dict:
+        ai = _ai_player(model, prompt_style, use_cache, concurrency)
+        if task == "vote":
+            results = await asyncio.gather(*[_vote_round(ai, r) for r in rounds], return_exceptions=True)
+            report = _vote_report(model, rounds, results)
+        else:
+            results = await asyncio.gather(*[_clue_round(ai, judge_ais, r) for r in rounds], return_exceptions=True)
+            report = _clue_report(model, results)
+        for res in results:
+            if isinstance(res, BaseException):
+                logger.warning("%s: round failed: %s", model, res)
+        return report
+
+    return list(await asyncio.gather(*[_run(m) for m in models]))
@@ -0,0 +1,188 @@
+from __future__ import annotations
+"""
+Pure, synchronous Dixit rules: a round state machine with no I/O.
+
+DixitState holds everything the rules decide on — seats, hands, draw pile,
+scores and the round number — with cards as opaque ids (card paths in
+play_game, plain ints in core.simulate).  A caller drives each round through
+its phases, supplying the decisions however it makes them:
+
+    state = DixitState.deal(["ann", "bob", "cat"], deck_ids, max_rounds=10)
+    while not state.finished:
+        rnd = state.start_round()              # phase "clue"
+        rnd.tell(card, clue)                   # -> "pick"
+        for name in rnd.others:
+            rnd.play(name, card)               # -> "vote" once all have played
+        for name in rnd.others:
+            rnd.vote(name, card)
+        result = rnd.score()                   # -> "scored"; hands refilled
+
+core.game.play_game drives it with vision-model calls, core.simulate with
+scripted agents.  Scoring is delegated to core.scoring.compute_score_changes.
+Moves out of phase or with cards the player doesn't hold raise ValueError.
+"""
+
+import random
+
+from core.scoring import RoundResult, compute_score_changes
+
+HAND_SIZE = 6
+
+
+class DixitState:
+    __slots__ = ("players", "hands", "deck", "scores", "round", "max_rounds", "score_to_win", "rng")
+
+    def __init__(
+        self,
+        players: list[str],
+        hands: dict[str, list],
+        deck: list,
+        scores: dict[str, int] | None = None,
+        round: int = 0,
+        max_rounds: int = 10,
+        score_to_win: int = 30,
+        rng=random,
+    ):
+        """
+        Args:
+            players: Player names in seat order (storytellers rotate through it).
+            hands: Player name -> card ids in hand.
+            deck: Draw pile; replacement cards are dealt from the front.
+            scores: Player name -> score (default all 0).
+            round: Rounds already completed.
+            rng: random.Random (or the random module) used to shuffle the table.
+        """
+        self.players = players
+        self.hands = hands
+        self.deck = deck
+        self.scores = scores if scores is not None else {p: 0 for p in players}
+        self.round = round
+        self.max_rounds = max_rounds
+        self.score_to_win = score_to_win
+        self.rng = rng
+
+    @classmethod
+    def deal(cls, players: list[str], deck: list, hand_size: int = HAND_SIZE, **kwargs) -> "DixitState":
+        """New game: deal ``hand_size`` cards to each player in seat order from the front of ``deck``."""
+        hands = {}
+        pos = 0
+        for name in players:
+            hands[name] = deck[pos:pos + hand_size]
+            pos += hand_size
+        return cls(players, hands, deck[pos:], **kwargs)
+
+    @property
+    def finished(self) -> bool:
+        """Over at max_rounds, at score_to_win, or once the draw pile and hands run out."""
+        if self.round >= self.max_rounds:
+            return True
+        for hand in self.hands.values():
+            if not hand:
+                return True  # refills go in seat order, so any player can run out first
+        target = self.score_to_win
+        for score in self.scores.values():
+            if score >= target:
+                return True
+        return False
+
+    def start_round(self) -> "DixitRound":
+        if self.finished:
+            raise ValueError("The game is over")
+        self.round += 1
+        return DixitRound(self, self.round)
+
+
+class DixitRound:
+    """One round; phases go "clue" -> "pick" -> "vote" -> "scored"."""
+
+    __slots__ = ("state", "number", "storyteller", "others", "phase", "clue", "storyteller_card",
+                 "played", "table", "votes", "result")
+
+    def __init__(self, state: DixitState, number: int):
+        self.state = state
+        self.number = number
+        players = state.players
+        self.storyteller = players[(number - 1) % len(players)]
+        self.others = [p for p in players if p != self.storyteller]  # pickers and voters, in seat order
+        self.phase = "clue"
+        self.clue = None
+        self.storyteller_card = None
+        self.played: dict[str, object] = {}   # player -> card, storyteller first
+        self.table: list = []                 # played cards, shuffled, once everyone has played
+        self.votes: dict[str, object] = {}    # voter -> card
+        self.result: RoundResult | None = None
+
+    def _wrong_phase(self, phase: str) -> ValueError:
+        return ValueError(f"Round {self.number} is in phase '{self.phase}', not '{phase}'")
+
+    def tell(self, card, clue) -> None:
+        """The storyteller commits to a card from their hand and gives a clue."""
+        if self.phase != "clue":
+            raise self._wrong_phase("clue")
+        if card not in self.state.hands[self.storyteller]:
+            raise ValueError(f"Storyteller {self.storyteller} doesn't hold card {card!r}")
+        self.storyteller_card = card
+        self.clue = clue
+        self.played[self.storyteller] = card
+        self.phase = "pick"
+
+    def play(self, player: str, card) -> None:
+        """A non-storyteller plays a card from their hand; the table is dealt once all have played."""
+        if self.phase != "pick":
+            raise self._wrong_phase("pick")
+        hand = self.state.hands.get(player)
+        played = self.played
+        if hand is None or player == self.storyteller:
+            raise ValueError(f"{player} can't play a card this round")
+        if player in played:
+            raise ValueError(f"{player} already played this round")
+        if card not in hand:
+            raise ValueError(f"{player} doesn't hold card {card!r}")
+        played[player] = card
+        if len(played) == len(self.state.players):
+            # Storyteller first, then seat order, regardless of the order cards arrived in
+            table = [played[self.storyteller]]
+            table += [played[p] for p in self.others]
+            self.state.rng.shuffle(table)
+            self.table = table
+            self.phase = "vote"
+
+    def vote(self, player: str, card) -> None:
+        if self.phase != "vote":
+            raise self._wrong_phase("vote")
+        if player == self.storyteller or player not in self.state.hands:
+            raise ValueError(f"{player} can't vote this round")
+        if player in self.votes:
+            raise ValueError(f"{player} already voted this round")
+        if card not in self.table:
+            raise ValueError(f"Card {card!r} is not on the table")
+        self.votes[player] = card
+
+    def score(self) -> RoundResult:
+        """Score the round, discard the played cards and deal one replacement to each player."""
+        if self.phase != "vote":
+            raise self._wrong_phase("vote")
+        if len(self.votes) != len(self.others):
+            missing = [p for p in self.others if p not in self.votes]
+            raise ValueError(f"Round {self.number} is still waiting for votes from {missing}")
+        state = self.state
+        played = self.played
+        result = compute_score_changes(
+            storyteller_name=self.storyteller,
+            all_player_names=state.players,
+            votes=self.votes,
+            played_cards=played,
+            storyteller_card_path=self.storyteller_card,
+        )
+        scores = state.scores
+        for name, delta in result.score_changes.items():
+            scores[name] += delta
+        hands, deck = state.hands, state.deck
+        for name in state.players:
+            hand = hands[name]
+            hand.remove(played[name])
+            if deck:
+                hand.append(deck.pop(0))
+        self.result = result
+        self.phase = "scored"
+        return result
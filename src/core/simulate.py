@@ -0,0 +1,241 @@
+from __future__ import annotations
+"""
+Headless Dixit simulation with scripted agents — no models, I/O or asyncio.
+
+Games run on the core.rules state machine with integer card ids, so rule
+variants and scheduling questions can be tested over hundreds of thousands
+of games.  Cards carry no meaning here: a storyteller's "clue" is its card
+id, and an agent's skill is how often it acts on that knowledge.
+
+Agents implement three decisions (see RandomAgent):
+
+    tell(hand, rng) -> (card, clue)
+    play(hand, clue, rng) -> card
+    vote(table, clue, own_card, rng) -> card
+
+Built in, by spec string (make_agent):
+
+    random          uniform choices; never votes for its own card
+    oracle:<p>      votes for the storyteller's card with probability p
+                    (default 1.0), otherwise like random
+
+simulate() plays on play_fast, a validation-free copy of the rules loop over
+seat indices and lists (scripted agents are trusted to play legal cards);
+with validate=True it drives core.rules instead.  Both consume the RNG
+identically, so they return the same results for the same seed.
+
+Usage:
+    from core.simulate import make_agent, simulate
+    simulate([make_agent("oracle:0.7"), make_agent("random"), make_agent("random")], 100_000, seed=0)
+"""
+
+import random
+import time
+from dataclasses import dataclass, field
+
+from core.rules import HAND_SIZE, DixitState
+
+DECK_SIZE = 84
+
+
+class RandomAgent:
+    name = "random"
+
+    # rng.random() indexing rather than rng.choice(): several times cheaper, and choices are most of the work
+    def tell(self, hand: list, rng: random.Random) -> tuple:
+        card = hand[int(rng.random() * len(hand))]
+        return card, card
+
+    def play(self, hand: list, clue, rng: random.Random):
+        return hand[int(rng.random() * len(hand))]
+
+    def vote(self, table: list, clue, own_card, rng: random.Random):
+        while True:
+            card = table[int(rng.random() * len(table))]
+            if card != own_card:
+                return card
+
+
+class OracleAgent(RandomAgent):
+    """Finds the storyteller's card with probability ``accuracy``."""
+
+    def __init__(self, accuracy: float = 1.0):
+        self.accuracy = accuracy
+        self.name = f"oracle:{accuracy:g}"
+
+    def vote(self, table: list, clue, own_card, rng: random.Random):
+        if rng.random() < self.accuracy:
+            return clue
+        return super().vote(table, clue, own_card, rng)
+
+
+AGENTS = {"random": RandomAgent, "oracle": OracleAgent}
+
+
+def make_agent(spec: str) -> RandomAgent:
+    """Build an agent from "kind" or "kind:arg" (e.g. "random", "oracle:0.6")."""
+    kind, _, arg = spec.partition(":")
+    if kind not in AGENTS:
+        raise ValueError(f"Unknown agent '{kind}'. Available: {list(AGENTS)}")
+    return AGENTS[kind](float(arg)) if arg else AGENTS[kind]()
+
+
+def play_headless(
+    agents: list[RandomAgent],
+    rng: random.Random,
+    max_rounds: int = 10,
+    score_to_win: int = 30,
+    deck_size: int = DECK_SIZE,
+    hand_size: int = HAND_SIZE,
+) -> DixitState:
+    """Play one game between ``agents`` (seat order) and return its final state."""
+    players = [str(i) for i in range(len(agents))]
+    seats = dict(zip(players, agents))
+    # Card ids carry no meaning, so an unshuffled deck deals just as randomly
+    deck = list(range(deck_size))
+    state = DixitState.deal(players, deck, hand_size, max_rounds=max_rounds, score_to_win=score_to_win, rng=rng)
+    hands = state.hands
+    while not state.finished:
+        rnd = state.start_round()
+        card, clue = seats[rnd.storyteller].tell(hands[rnd.storyteller], rng)
+        rnd.tell(card, clue)
+        for name in rnd.others:
+            rnd.play(name, seats[name].play(hands[name], clue, rng))
+        table = rnd.table
+        for name in rnd.others:
+            rnd.vote(name, seats[name].vote(table, clue, rnd.played[name], rng))
+        rnd.score()
+    return state
+
+
+def play_fast(
+    agents: list[RandomAgent],
+    rng: random.Random,
+    max_rounds: int = 10,
+    score_to_win: int = 30,
+    deck_size: int = DECK_SIZE,
+    hand_size: int = HAND_SIZE,
+) -> tuple[list[int], int]:
+    """play_headless without move validation; returns (scores by seat, rounds played)."""
+    n = len(agents)
+    deck = list(range(deck_size))
+    hands = [deck[i * hand_size:(i + 1) * hand_size] for i in range(n)]
+    pile, top = deck[n * hand_size:], 0
+    others_of = [[j for j in range(n) if j != i] for i in range(n)]
+    tells = [a.tell for a in agents]
+    plays = [a.play for a in agents]
+    votes_of = [a.vote for a in agents]
+    scores = [0] * n
+    shuffle = rng.shuffle
+    rounds = 0
+    while rounds < max_rounds and max(scores) < score_to_win:
+        if not all(hands):
+            break  # the draw pile ran out and a hand is empty
+        st = rounds % n
+        rounds += 1
+        others = others_of[st]
+        card, clue = tells[st](hands[st], rng)
+        played = [card] * n
+        # Same table order as DixitRound.play: storyteller first, then seat order, shuffled
+        table = [card]
+        for j in others:
+            c = plays[j](hands[j], clue, rng)
+            played[j] = c
+            table.append(c)
+        shuffle(table)
+        found = 0
+        voted = []
+        for j in others:
+            v = votes_of[j](table, clue, played[j], rng)
+            voted.append(v)
+            if v == card:
+                found += 1
+
+        if found == 0 or found == len(others):
+            for j in others:
+                scores[j] += 2
+        else:
+            scores[st] += 3
+            for j, v in zip(others, voted):
+                if v == card:
+                    scores[j] += 3
+        for j, v in zip(others, voted):
+            if v != card:
+                o = played.index(v)  # card ids are unique; a non-storyteller's card
+                if o != j:
+                    scores[o] += 1
+
+        for i in range(n):
+            hand = hands[i]
+            hand.remove(played[i])
+            if top < len(pile):
+                hand.append(pile[top])
+                top += 1
+    return scores, rounds
+
+
+@dataclass
+class SimulationSummary:
+    agents: list[str]
+    games: int = 0
+    rounds: int = 0
+    wins: list[float] = field(default_factory=list)       # per agent; ties share the win
+    total_score: list[int] = field(default_factory=list)  # per agent
+    seconds: float = 0.0
+
+    def merge(self, other: "SimulationSummary") -> None:
+        """Add another run's results (same agents), e.g. from a worker process."""
+        self.games += other.games
+        self.rounds += other.rounds
+        self.wins = [a + b for a, b in zip(self.wins, other.wins)]
+        self.total_score = [a + b for a, b in zip(self.total_score, other.total_score)]
+        self.seconds += other.seconds
+
+    def to_dict(self) -> dict:
+        return {
+            "games": self.games,
+            "mean_rounds": round(self.rounds / self.games, 3) if self.games else None,
+            "games_per_second": round(self.games / self.seconds) if self.seconds else None,
+            "agents": [
+                {
+                    "agent": name,
+                    "win_rate": round(self.wins[i] / self.games, 4) if self.games else None,
+                    "mean_score": round(self.total_score[i] / self.games, 3) if self.games else None,
+                }
+                for i, name in enumerate(self.agents)
+            ],
+        }
+
+
+def simulate(
+    agents: list[RandomAgent], num_games: int, seed: int | None = None, validate: bool = False, **game_kwargs,
+) -> SimulationSummary:
+    """Play ``num_games`` headless games.
+
+    Seats rotate every game so no agent keeps the first-storyteller advantage;
+    results are reported per agent (in the order given).  ``game_kwargs`` go
+    to play_fast, or with ``validate`` to play_headless (max_rounds,
+    score_to_win, deck_size, hand_size).
+    """
+    rng = random.Random(seed)
+    n = len(agents)
+    summary = SimulationSummary([a.name for a in agents], wins=[0.0] * n, total_score=[0] * n)
+    start = time.perf_counter()
+    for g in range(num_games):
+        order = [(g + i) % n for i in range(n)]  # seat -> agent index
+        seated = [agents[i] for i in order]
+        if validate:
+            state = play_headless(seated, rng, **game_kwargs)
+            scores, rounds = [state.scores[str(seat)] for seat in range(n)], state.round
+        else:
+            scores, rounds = play_fast(seated, rng, **game_kwargs)
+        best = max(scores)
+        winners = [order[seat] for seat, s in enumerate(scores) if s == best]
+        for seat, agent in enumerate(order):
+            summary.total_score[agent] += scores[seat]
+        for agent in winners:
+            summary.wins[agent] += 1 / len(winners)
+        summary.rounds += rounds
+    summary.games = num_games
+    summary.seconds = time.perf_counter() - start
+    return summary
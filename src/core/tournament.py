@@ -0,0 +1,410 @@
+from __future__ import annotations
+"""
+Concurrent tournament scheduler.
+
+Runs many play_game coroutines at once instead of one after another:
+
+  - at most ``max_concurrent_games`` games run at the same time;
+  - vision requests across all games share a ConcurrencyBudget (global and
+    per-provider in-flight limits);
+  - progress is written to a JSON state file after every trial transition, so
+    a crashed or interrupted run resumes with Tournament.resume(state_path)
+    and skips the trials already completed; games that were mid-flight
+    continue from their last checkpointed round;
+  - requests, tokens and cost can be capped for the whole tournament
+    (``budget``, see core.budget) on top of any per-game ``budget`` in the
+    trials.  A game whose budget runs out stops after its last completed
+    round (trial status "stopped"); once the tournament or global budget
+    runs out no new games start and the tournament ends "budget_exhausted".
+    Spend so far is saved with the state, so a resume continues counting;
+  - cancel_game(game_id) stops one running game of an API tournament (trial
+    status "cancelled", not rerun on resume); ``game_slots`` lets several
+    tournaments share one cap on the games they run at once.
+
+Trials come from a run-configuration dict (trials_from_config — the schema of
+scripts/run_from_config.py), from random lineups (random_trials) or, added
+batch by batch, from core.matchmaking's active sampling.  The
+scripts and the /api/tournaments routes are thin front-ends to this module.
+
+State file layout:
+  {
+    "tournament_id": "...", "status": "running" | "completed" | "failed" | "budget_exhausted",
+    "created_at": "...", "updated_at": "...",
+    "settings": {"max_concurrent_games": 4, "concurrency": {...}, "stop_on_error": false,
+                 "budget": {...},         # tournament spend limits, if any
+                 "matchmaking": {...}},   # only for core.matchmaking runs
+    "budget": {"status", "limits", "spent", "models", ...},   # SpendBudget.status()
+    "trials": [{"key", "run", "index", "params", "status", "game_id",
+                "final_scores", "rounds", "error", "started_at", "finished_at"}, ...]
+  }
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import random
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from core.budget import BudgetExceeded, SpendBudget, get_global_budget
+from core.checkpoint import load_checkpoint
+from core.concurrency import ConcurrencyBudget
+from core.game import play_game, resume_game
+
+if TYPE_CHECKING:
+    from api.events import EventBus
+
+logger = logging.getLogger(__name__)
+
+TOURNAMENTS_DIR = os.path.join(os.getenv("GAME_LOGS_DIR", "game_logs"), "tournaments")
+
+# Run-config keys forwarded to play_game (``cards`` is renamed to image_directory)
+_GAME_KEYS = (
+    "players", "prompt_style", "max_rounds", "score_to_win", "use_cache",
+    "phase_timeouts", "round_timeout", "timeout_fill", "speculative_clues", "speculation_budget", "budget",
+)
+
+
+@dataclass
+class Trial:
+    key: str                    # stable id within the tournament, e.g. "gpt4o-vs-claude#02"
+    run: str
+    index: int
+    params: dict                # play_game keyword arguments (without game_id / event_bus)
+    status: str = "pending"     # pending | running | done | failed | stopped (spend budget ran out) | cancelled
+    game_id: str | None = None
+    final_scores: dict = field(default_factory=dict)
+    rounds: int = 0
+    error: str | None = None
+    started_at: str | None = None
+    finished_at: str | None = None
+
+
+def _game_params(run: dict) -> dict:
+    params = {k: run[k] for k in _GAME_KEYS if k in run}
+    params["image_directory"] = run.get("cards", run.get("image_directory"))
+    return params
+
+
+def trials_from_config(cfg: dict) -> list[Trial]:
+    """Expand a run-configuration dict ({"defaults": …, "runs": […]}) into trials.
+
+    A "budget" in defaults or a run caps each of its games; the top-level
+    "budget" is the tournament's (pass it to Tournament).
+    """
+    defaults = cfg.get("defaults", {})
+    trials = []
+    for run in cfg["runs"]:
+        merged = {**defaults, **run}
+        name = merged.get("name", "unnamed")
+        for t in range(merged.get("trials", 1)):
+            params = _game_params(merged)
+            if merged.get("seed") is not None:
+                params["seed"] = merged["seed"] + t  # trials differ, reruns repeat
+            trials.append(Trial(key=f"{name}#{t:02d}", run=name, index=t, params=params))
+    return trials
+
+
+def random_trials(
+    cards: str,
+    num_games: int,
+    players_per_game: int,
+    models: list[str],
+    prompt_styles: list[str] | None = None,
+    seed: int | None = None,
+    **game_kwargs,
+) -> list[Trial]:
+    """Sample ``num_games`` random lineups up front, so a resumed run replays the same plan.
+
+    With a ``seed`` the lineups are reproducible and game i is seeded with seed + i.
+    """
+    if players_per_game > len(models):
+        raise ValueError(f"players_per_game ({players_per_game}) > number of models ({len(models)})")
+    rng = random.Random(seed)
+    styles = prompt_styles or ["creative"]
+    trials = []
+    for i in range(num_games):
+        params = {
+            "image_directory": cards,
+            "players": [{"model": m} for m in rng.sample(models, players_per_game)],
+            "prompt_style": rng.choice(styles),
+            **game_kwargs,
+        }
+        if seed is not None:
+            params["seed"] = seed + i
+        trials.append(Trial(key=f"random#{i:03d}", run="random", index=i, params=params))
+    return trials
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+class Tournament:
+    def __init__(
+        self,
+        trials: list[Trial],
+        tournament_id: str | None = None,
+        state_path: str | None = None,
+        max_concurrent_games: int = 4,
+        concurrency: ConcurrencyBudget | None = None,
+        stop_on_error: bool = False,
+        matchmaking: dict | None = None,
+        budget: dict | None = None,
+        game_slots: asyncio.Semaphore | None = None,
+    ):
+        self.tournament_id = tournament_id or datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        self.state_path = state_path or os.path.join(TOURNAMENTS_DIR, f"{self.tournament_id}.json")
+        self.trials = trials
+        self.max_concurrent_games = max_concurrent_games
+        self.concurrency = concurrency or ConcurrencyBudget()
+        self.stop_on_error = stop_on_error
+        self.matchmaking = matchmaking  # ActiveMatchmaker settings (core.matchmaking), persisted for resume
+        self.budget = budget
+        self.spend = SpendBudget("tournament", budget, parent=get_global_budget())
+        self.game_slots = game_slots  # shared with other tournaments, on top of max_concurrent_games
+        self.status = "pending"
+        self.created_at = _now()
+        self._games: dict[str, asyncio.Task] = {}  # game_id -> running game
+        self._cancelling: set[str] = set()
+
+    @classmethod
+    def resume(cls, state_path: str, **overrides) -> "Tournament":
+        """Reload a tournament from its state file; completed trials will be skipped."""
+        with open(state_path) as f:
+            state = json.load(f)
+        settings = state.get("settings", {})
+        conc = settings.get("concurrency", {})
+        kwargs = {
+            "max_concurrent_games": settings.get("max_concurrent_games", 4),
+            "concurrency": ConcurrencyBudget(conc.get("max_requests"), conc.get("per_provider")),
+            "stop_on_error": settings.get("stop_on_error", False),
+            "matchmaking": settings.get("matchmaking"),
+            "budget": settings.get("budget"),
+            **overrides,
+        }
+        trials = [Trial(**t) for t in state["trials"]]
+        tour = cls(trials, tournament_id=state["tournament_id"], state_path=state_path, **kwargs)
+        tour.created_at = state.get("created_at", tour.created_at)
+        tour.spend.restore(state.get("budget"))
+        return tour
+
+    def set_budget(self, budget: dict | None) -> None:
+        """Change the tournament's spend limits (e.g. raise them before resuming); spend so far is kept."""
+        spent = self.spend.status()
+        self.budget = budget
+        self.spend = SpendBudget("tournament", budget, parent=get_global_budget())
+        self.spend.restore(spent)
+
+    # ------------------------------------------------------------------
+    # State / progress
+    # ------------------------------------------------------------------
+
+    def progress(self) -> dict:
+        counts = {s: 0 for s in ("pending", "running", "done", "failed", "stopped", "cancelled")}
+        for t in self.trials:
+            counts[t.status] += 1
+        return {"total": len(self.trials), **counts}
+
+    def to_dict(self) -> dict:
+        settings = {
+            "max_concurrent_games": self.max_concurrent_games,
+            "concurrency": self.concurrency.to_dict(),
+            "stop_on_error": self.stop_on_error,
+        }
+        if self.budget is not None:
+            settings["budget"] = self.budget
+        if self.matchmaking is not None:
+            settings["matchmaking"] = self.matchmaking
+        return {
+            "tournament_id": self.tournament_id,
+            "status": self.status,
+            "created_at": self.created_at,
+            "updated_at": _now(),
+            "progress": self.progress(),
+            "settings": settings,
+            "budget": self.spend.status(),
+            "trials": [asdict(t) for t in self.trials],
+        }
+
+    def save_state(self) -> None:
+        os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+        tmp = self.state_path + ".part"
+        with open(tmp, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        os.replace(tmp, self.state_path)
+
+    def summary(self) -> list[dict]:
+        out = []
+        for t in self.trials:
+            entry = {"run": t.run, "trial": t.index, "game_id": t.game_id}
+            if t.status == "failed":
+                entry["error"] = t.error
+            else:
+                entry["final_scores"] = t.final_scores
+            if t.status == "stopped":
+                entry["stopped"] = t.error
+            out.append(entry)
+        return out
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    async def run(self, event_bus: "EventBus | None" = None, trials: list[Trial] | None = None) -> list[dict]:
+        """Run every trial not yet done or cancelled (or only those of ``trials``); returns the summary of all trials."""
+        pending = [t for t in (self.trials if trials is None else trials) if t.status not in ("done", "cancelled")]
+        skipped = len(self.trials) - len(pending)
+        if skipped:
+            logger.info("Tournament %s: resuming, %d/%d trials already done", self.tournament_id, skipped, len(self.trials))
+        self.status = "running"
+        self.save_state()
+
+        games = asyncio.Semaphore(self.max_concurrent_games)
+        abort = asyncio.Event()
+        out_of_budget = False
+
+        async def emit(event: dict) -> None:
+            if event_bus:
+                await event_bus.publish(f"tournament_{self.tournament_id}", event)
+
+        async def _run_trial(trial: Trial) -> None:
+            nonlocal out_of_budget
+            async with games, self.game_slots or contextlib.nullcontext():
+                if abort.is_set():
+                    return
+                exhausted = self.spend.exhausted() or get_global_budget().exhausted()
+                if exhausted:
+                    logger.warning("[%s] spend budget exhausted (%s); not starting %s",
+                                   self.tournament_id, "; ".join(exhausted), trial.key)
+                    out_of_budget = True
+                    abort.set()
+                    return
+                trial.status = "running"
+                trial.game_id = f"{self.tournament_id}_{trial.key.replace('#', '_')}"
+                trial.started_at = _now()
+                trial.error = None
+                self.save_state()
+                logger.info("[%s] starting %s (game %s)", self.tournament_id, trial.key, trial.game_id)
+                try:
+                    if load_checkpoint(trial.game_id) is not None:
+                        # Interrupted mid-game last time: continue from its last completed round
+                        game = resume_game(
+                            trial.game_id, event_bus=event_bus, concurrency=self.concurrency, spend=self.spend,
+                        )
+                    else:
+                        game = play_game(
+                            **trial.params,
+                            game_id=trial.game_id,
+                            event_bus=event_bus,
+                            concurrency=self.concurrency,
+                            spend=self.spend,
+                        )
+                    # A task of its own, so cancel_game() stops this game without stopping the tournament
+                    self._games[trial.game_id] = asyncio.ensure_future(game)
+                    log = await self._games[trial.game_id]
+                    rounds = log.get("rounds", [])
+                    trial.final_scores = rounds[-1]["current_scores"] if rounds else {}
+                    trial.rounds = len(rounds)
+                    trial.status = "done"
+                except asyncio.CancelledError:
+                    if trial.game_id not in self._cancelling:
+                        raise  # the whole tournament is being cancelled
+                    trial.status = "cancelled"
+                except BudgetExceeded as exc:
+                    # The game stopped cleanly; its checkpoint lets a resume continue it
+                    checkpoint = load_checkpoint(trial.game_id)
+                    trial.final_scores = checkpoint["scores"] if checkpoint else {}
+                    trial.rounds = checkpoint["round"] if checkpoint else 0
+                    trial.status = "stopped"
+                    trial.error = str(exc)
+                    if exc.scope != "game":
+                        out_of_budget = True
+                        abort.set()
+                except Exception as exc:
+                    logger.exception("[%s] trial %s FAILED: %s", self.tournament_id, trial.key, exc)
+                    trial.status = "failed"
+                    trial.error = str(exc)
+                    if self.stop_on_error:
+                        abort.set()
+                finally:
+                    self._games.pop(trial.game_id, None)
+                    self._cancelling.discard(trial.game_id)
+                trial.finished_at = _now()
+                self.save_state()
+                await emit({"type": "trial_finished", "trial": trial.key, "status": trial.status, "progress": self.progress()})
+
+        try:
+            await asyncio.gather(*[_run_trial(t) for t in pending])
+        finally:
+            # Trials interrupted mid-game go back to pending so a resume reruns them
+            for t in self.trials:
+                if t.status == "running":
+                    t.status = "pending"
+            failed = any(t.status == "failed" for t in self.trials)
+            unfinished = any(t.status == "pending" for t in self.trials)
+            if out_of_budget:
+                self.status = "budget_exhausted"
+            else:
+                self.status = "failed" if failed or unfinished else "completed"
+            self.save_state()
+        budget = self.spend.status()
+        logger.info("Tournament %s %s; spend %s", self.tournament_id, self.status, budget["spent"])
+        await emit({"type": "tournament_finished", "status": self.status, "progress": self.progress(), "budget": budget})
+        return self.summary()
+
+    async def cancel_game(self, game_id: str) -> Trial | None:
+        """Cancel this tournament's game ``game_id`` if it is running; returns its trial (None if not ours)."""
+        trial = next((t for t in self.trials if t.game_id == game_id), None)
+        task = self._games.get(game_id)
+        if trial is None or task is None or task.done():
+            return trial
+        self._cancelling.add(game_id)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        trial.status = "cancelled"  # the trial's runner records it too, once it wakes up
+        logger.info("[%s] cancelled game %s", self.tournament_id, game_id)
+        return trial
+
+
+# Tournaments started through the API in this process, by id
+_active: dict[str, Tournament] = {}
+
+
+def register(tour: Tournament) -> None:
+    _active[tour.tournament_id] = tour
+
+
+async def cancel_game(game_id: str) -> dict | None:
+    """Cancel a running game of an active tournament; returns its trial (None if no active tournament has it)."""
+    for tour in list(_active.values()):
+        trial = await tour.cancel_game(game_id)
+        if trial is not None:
+            return {"tournament_id": tour.tournament_id, **asdict(trial)}
+    return None
+
+
+def get_status(tournament_id: str) -> dict | None:
+    """Live status for an active tournament, else the last saved state file."""
+    tour = _active.get(tournament_id)
+    if tour is not None:
+        return tour.to_dict()
+    path = os.path.join(TOURNAMENTS_DIR, f"{tournament_id}.json")
+    if os.path.isfile(path):
+        with open(path) as f:
+            return json.load(f)
+    return None
+
+
+def parse_provider_limits(items: list[str] | None) -> dict[str, int]:
+    """Parse CLI ``provider=N`` pairs (e.g. ["openai=8", "anthropic=4"])."""
+    limits = {}
+    for item in items or []:
+        name, _, value = item.partition("=")
+        if not value:
+            raise ValueError(f"Expected provider=N, got '{item}'")
+        limits[name.strip()] = int(value)
+    return limits
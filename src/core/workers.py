@@ -0,0 +1,298 @@
+from __future__ import annotations
+"""
+Run games in worker processes, isolated from the API event loop.
+
+Base64 encoding, hashing, sync SQLite and Firestore writes inside a game all
+block whichever event loop runs it.  With GAME_WORKERS > 0 the API hands
+games to a GameProcessPool instead of running them as background
+coroutines:
+
+  - each of ``workers`` processes runs its own event loop and plays up to
+    ``games_per_worker`` games at once (GAME_WORKER_GAMES, default 4);
+  - vision requests inside one worker share a ConcurrencyBudget of
+    ``max_requests_per_worker`` in-flight calls (GAME_WORKER_MAX_REQUESTS,
+    default unlimited);
+  - game events travel back over a multiprocessing queue and are republished
+    on the parent's EventBus, so WebSocket viewers see no difference;
+  - logs, checkpoints and Firestore documents are written by the worker
+    exactly as an in-process game writes them;
+  - cancel(game_id) sends the id of that game's job to every worker's
+    control queue (the pool can't know which worker will dequeue a queued
+    job); the one playing it cancels it with its in-flight requests.  Once
+    the job is resolved the others are told to forget the id, so a later
+    resume of the same game (a new job) is unaffected;
+  - a game stopped by its spend budget re-raises BudgetExceeded in the
+    parent.  Spend is charged inside the workers, so each worker process has
+    its own global budget (SPEND_BUDGET_*; see core.budget).
+
+Processes are started with the "spawn" method, so workers never inherit the
+parent's event loop or open connections.
+"""
+
+import asyncio
+import logging
+import multiprocessing as mp
+import os
+import threading
+import uuid
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from api.events import EventBus
+
+logger = logging.getLogger(__name__)
+
+_instance: "GameProcessPool | None" = None
+
+
+def worker_count() -> int:
+    return int(os.getenv("GAME_WORKERS", 0))
+
+
+def get_pool() -> "GameProcessPool":
+    global _instance
+    if _instance is None:
+        _instance = GameProcessPool(
+            workers=worker_count() or 1,
+            games_per_worker=int(os.getenv("GAME_WORKER_GAMES", 4)),
+            max_requests_per_worker=int(os.getenv("GAME_WORKER_MAX_REQUESTS", 0)) or None,
+        )
+    return _instance
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+class _QueueBus:
+    """EventBus stand-in inside a worker: forwards every event to the parent process."""
+
+    def __init__(self, events: mp.Queue):
+        self._events = events
+
+    async def publish(self, game_id: str, event: dict) -> None:
+        self._events.put(("event", game_id, event))
+
+
+async def _run_job(kind: str, kwargs: dict, events: mp.Queue, concurrency) -> dict:
+    from core.game import play_game, resume_game
+
+    bus = _QueueBus(events)
+    if kind == "resume":
+        log = await resume_game(kwargs["game_id"], event_bus=bus, concurrency=concurrency)
+    else:
+        log = await play_game(**kwargs, event_bus=bus, concurrency=concurrency)
+    rounds = log.get("rounds", [])
+    return {"game_id": log.get("game_id"), "rounds": len(rounds), "final_scores": rounds[-1]["current_scores"] if rounds else {}}
+
+
+def _watch_controls(control: mp.Queue, loop: asyncio.AbstractEventLoop, handle) -> None:
+    while True:
+        msg = control.get()
+        if msg is None:
+            return
+        loop.call_soon_threadsafe(handle, *msg)
+
+
+async def _serve(
+    jobs: mp.Queue, events: mp.Queue, control: mp.Queue, games_per_worker: int, max_requests: int | None,
+) -> None:
+    from core.budget import BudgetExceeded
+    from core.concurrency import ConcurrencyBudget
+
+    loop = asyncio.get_running_loop()
+    slots = asyncio.Semaphore(games_per_worker)
+    concurrency = ConcurrencyBudget(max_requests)
+    running: set[asyncio.Task] = set()
+    games: dict[str, asyncio.Task] = {}  # job_id -> task, for cancellation
+    cancelled: set[str] = set()           # job ids cancelled before this worker dequeued them (or elsewhere)
+
+    def _control(kind: str, job_id: str) -> None:
+        if kind == "forget":
+            cancelled.discard(job_id)
+            return
+        task = games.get(job_id)
+        if task is not None:
+            task.cancel()
+        else:
+            cancelled.add(job_id)
+
+    threading.Thread(target=_watch_controls, args=(control, loop, _control), daemon=True).start()
+
+    async def _one(job_id: str, kind: str, kwargs: dict) -> None:
+        try:
+            result = await _run_job(kind, kwargs, events, concurrency)
+            events.put(("done", job_id, result, None))
+        except asyncio.CancelledError:
+            logger.info("Worker game %s cancelled", kwargs.get("game_id"))
+            events.put(("cancelled", job_id))
+        except BudgetExceeded as exc:
+            logger.warning("Worker game %s stopped: %s", kwargs.get("game_id"), exc)
+            events.put(("done", job_id, None, exc))  # pickled whole, re-raised as is by the parent
+        except Exception as exc:
+            logger.exception("Worker game %s failed: %s", kwargs.get("game_id"), exc)
+            events.put(("done", job_id, None, str(exc)))
+        finally:
+            games.pop(job_id, None)
+            slots.release()
+
+    while True:
+        await slots.acquire()
+        job = await loop.run_in_executor(None, jobs.get)
+        if job is None:
+            slots.release()
+            break
+        if job[0] in cancelled:
+            cancelled.discard(job[0])
+            events.put(("cancelled", job[0]))
+            slots.release()
+            continue
+        task = asyncio.create_task(_one(*job))
+        games[job[0]] = task
+        running.add(task)
+        task.add_done_callback(running.discard)
+    if running:
+        await asyncio.gather(*running)
+
+
+def _worker_main(
+    jobs: mp.Queue, events: mp.Queue, control: mp.Queue, games_per_worker: int, max_requests: int | None,
+) -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s [worker %(process)d] %(name)s: %(message)s")
+    asyncio.run(_serve(jobs, events, control, games_per_worker, max_requests))
+
+
+# ---------------------------------------------------------------------------
+# Parent side
+# ---------------------------------------------------------------------------
+
+class GameProcessPool:
+    def __init__(self, workers: int = 2, games_per_worker: int = 4, max_requests_per_worker: int | None = None):
+        self.workers = workers
+        self.games_per_worker = games_per_worker
+        self.max_requests_per_worker = max_requests_per_worker
+        self._ctx = mp.get_context("spawn")
+        self._jobs: mp.Queue | None = None
+        self._events: mp.Queue | None = None
+        self._procs: list = []
+        self._controls: list[mp.Queue] = []
+        self._pump: threading.Thread | None = None
+        self._pending: dict[str, asyncio.Future] = {}
+        self._job_ids: dict[str, str] = {}     # game_id -> job_id of its unresolved job
+        self._cancelled_jobs: set[str] = set()  # cancel sent to the workers, not yet resolved
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._bus: "EventBus | None" = None
+
+    @property
+    def started(self) -> bool:
+        return bool(self._procs)
+
+    def start(self, event_bus: "EventBus | None" = None) -> None:
+        """Spawn the workers; events are republished on ``event_bus`` from the calling event loop."""
+        if self.started:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._bus = event_bus
+        self._jobs = self._ctx.Queue()
+        self._events = self._ctx.Queue()
+        for _ in range(self.workers):
+            control = self._ctx.Queue()
+            proc = self._ctx.Process(
+                target=_worker_main,
+                args=(self._jobs, self._events, control, self.games_per_worker, self.max_requests_per_worker),
+                daemon=True,
+            )
+            proc.start()
+            self._procs.append(proc)
+            self._controls.append(control)
+        self._pump = threading.Thread(target=self._pump_events, name="game-event-pump", daemon=True)
+        self._pump.start()
+        logger.info(
+            "Game process pool: %d workers × %d games (max %s requests per worker)",
+            self.workers, self.games_per_worker, self.max_requests_per_worker or "∞",
+        )
+
+    def _pump_events(self) -> None:
+        while True:
+            msg = self._events.get()
+            if msg is None:
+                return
+            if msg[0] == "event" and self._bus is not None:
+                _, game_id, event = msg
+                asyncio.run_coroutine_threadsafe(self._bus.publish(game_id, event), self._loop)
+            elif msg[0] == "done":
+                # Scheduled like the events, so a game's last events are published before its future resolves
+                _, job_id, result, error = msg
+                asyncio.run_coroutine_threadsafe(self._resolve(job_id, result, error), self._loop)
+            elif msg[0] == "cancelled":
+                asyncio.run_coroutine_threadsafe(self._resolve(msg[1], None, None, cancelled=True), self._loop)
+
+    async def _resolve(
+        self, job_id: str, result: dict | None, error: str | Exception | None, cancelled: bool = False,
+    ) -> None:
+        fut = self._pending.pop(job_id, None)
+        for game_id in [g for g, j in self._job_ids.items() if j == job_id]:
+            del self._job_ids[game_id]
+        if job_id in self._cancelled_jobs:
+            # Workers that never ran the job still hold its id; let them drop it
+            self._cancelled_jobs.discard(job_id)
+            for control in self._controls:
+                control.put(("forget", job_id))
+        if fut is None or fut.done():
+            return
+        if cancelled:
+            fut.cancel()
+        elif isinstance(error, Exception):
+            fut.set_exception(error)
+        elif error is not None:
+            fut.set_exception(RuntimeError(error))
+        else:
+            fut.set_result(result)
+
+    def submit(self, kwargs: dict, kind: str = "play") -> asyncio.Future:
+        """Queue a game (play_game keyword arguments, incl. game_id) or, with kind="resume", a resume.
+
+        Returns a future resolving to {"game_id", "rounds", "final_scores"};
+        it is cancelled if the game is cancelled with cancel().
+        """
+        if not self.started:
+            raise RuntimeError("GameProcessPool.start() must be called first")
+        job_id = uuid.uuid4().hex
+        fut = self._loop.create_future()
+        self._pending[job_id] = fut
+        if kwargs.get("game_id"):
+            self._job_ids[kwargs["game_id"]] = job_id
+        self._jobs.put((job_id, kind, kwargs))
+        return fut
+
+    def cancel(self, game_id: str) -> None:
+        """Cancel a game running (or about to run) in a worker, with its in-flight requests."""
+        job_id = self._job_ids.get(game_id)
+        if job_id is None:
+            return  # not submitted, or already resolved
+        self._cancelled_jobs.add(job_id)
+        for control in self._controls:
+            control.put(("cancel", job_id))
+
+    def shutdown(self, timeout: float = 10.0) -> None:
+        """Let workers finish their running games, then stop them."""
+        if not self.started:
+            return
+        for _ in self._procs:
+            self._jobs.put(None)
+        for control in self._controls:
+            control.put(None)
+        for proc in self._procs:
+            proc.join(timeout)
+            if proc.is_alive():
+                proc.terminate()
+        self._events.put(None)
+        self._pump.join(timeout)
+        self._procs = []
+        self._controls = []
+        for fut in self._pending.values():
+            if not fut.done():
+                fut.set_exception(RuntimeError("Game process pool shut down"))
+        self._pending.clear()
+        self._job_ids.clear()
+        self._cancelled_jobs.clear()
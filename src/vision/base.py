@@ -1,5 +1,10 @@
 from __future__ import annotations
+import asyncio
+import os
+import weakref
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
 
 
 class VisionAPI(ABC):
@@ -8,3 +13,37 @@ class VisionAPI(ABC):
     @abstractmethod
     async def analyze_image(self, image_path: str, prompt: str, max_tokens: int = 60, temperature: float = 1.0) -> str:
         pass
+
+
+# ---------------------------------------------------------------------------
+# Shared, process-wide SDK resources
+# ---------------------------------------------------------------------------
+
+# Async SDK clients own an httpx connection pool bound to the event loop that
+# first used it, so they are cached per running loop rather than globally.
+# In practice there is one loop per process (uvicorn, asyncio.run in scripts).
+_loop_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, Any]]" = weakref.WeakKeyDictionary()
+
+_executors: dict[str, ThreadPoolExecutor] = {}
+
+
+def shared_client(key: str, factory: Callable[[], Any]) -> Any:
+    """Return the client registered under ``key`` for the running event loop, creating it once."""
+    loop = asyncio.get_running_loop()
+    clients = _loop_clients.setdefault(loop, {})
+    if key not in clients:
+        clients[key] = factory()
+    return clients[key]
+
+
+def provider_executor(provider: str, default_workers: int = 8) -> ThreadPoolExecutor:
+    """Return the dedicated thread pool for a provider whose SDK is sync-only.
+
+    Each provider gets its own pool so a slow provider cannot starve the
+    others through asyncio's shared default executor.  Pool size is read from
+    ``<PROVIDER>_MAX_WORKERS`` (e.g. ``GEMINI_MAX_WORKERS=16``).
+    """
+    if provider not in _executors:
+        workers = int(os.getenv(f"{provider.upper()}_MAX_WORKERS", default_workers))
+        _executors[provider] = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"vision-{provider}")
+    return _executors[provider]
@@ -0,0 +1,193 @@
+from __future__ import annotations
+"""
+Record / replay cassettes for vision HTTP traffic.
+
+Lets engine changes be benchmarked against real model behaviour without
+paying for the calls again.  Enabled for every OpenAI-compatible provider
+(OpenRouter, Groq, xAI) by wrapping the pooled client's transport:
+
+  VISION_CASSETTE=cassettes/run1.jsonl.gz
+  VISION_CASSETTE_MODE=record        # call the real API and append every exchange
+                      replay         # serve recorded responses, no network
+                      replay_timed   # replay, sleeping for each original latency
+  VISION_CASSETTE_ON_MISS=error      # (default) raise CassetteMiss
+                          passthrough # forward unrecorded requests to the network
+
+Each exchange is one gzip-compressed JSON line keyed by a fingerprint of
+method + URL + canonical JSON body (headers, and therefore API keys, are
+never part of the key or the file).  Retried requests record every attempt;
+replay serves them in order and repeats the last one once exhausted, so a
+recorded 429 → 200 sequence replays identically.
+"""
+
+import asyncio
+import atexit
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import defaultdict
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+MODES = ("record", "replay", "replay_timed")
+_KEPT_HEADERS = ("content-type", "retry-after")
+# aread() returns the decoded body; these headers describe the wire bytes and must not be passed on
+_WIRE_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+
+class CassetteMiss(Exception):
+    """Raised in replay mode when a request has no recorded response."""
+
+
+def fingerprint(request: httpx.Request) -> str:
+    body = request.content
+    try:
+        body = json.dumps(json.loads(body), sort_keys=True, separators=(",", ":")).encode("utf-8")
+    except (ValueError, UnicodeDecodeError):
+        pass
+    h = hashlib.sha256()
+    h.update(request.method.encode("ascii"))
+    h.update(b" ")
+    h.update(str(request.url).encode("utf-8"))
+    h.update(b"\n")
+    h.update(body)
+    return h.hexdigest()
+
+
+class Cassette:
+    def __init__(self, path: str, mode: str, on_miss: str = "error"):
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode '{mode}'. Available: {list(MODES)}")
+        self.path = path
+        self.mode = mode
+        self.on_miss = on_miss
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+        self._entries: dict[str, list[dict]] = defaultdict(list)
+        self._served: dict[str, int] = defaultdict(int)
+        self._out = None
+        if mode != "record" or os.path.exists(path):
+            self._load()
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            logger.warning("Cassette %s does not exist — every request will miss", self.path)
+            return
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    self._entries[entry["fingerprint"]].append(entry)
+        logger.info("Loaded cassette %s (%d fingerprints)", self.path, len(self._entries))
+
+    def lookup(self, fp: str) -> dict | None:
+        entries = self._entries.get(fp)
+        if not entries:
+            return None
+        idx = min(self._served[fp], len(entries) - 1)
+        self._served[fp] += 1
+        return entries[idx]
+
+    def append(self, fp: str, request: httpx.Request, response: httpx.Response, elapsed_s: float) -> None:
+        entry = {
+            "fingerprint": fp,
+            "method": request.method,
+            "url": str(request.url),
+            "status": response.status_code,
+            "headers": {k: v for k, v in response.headers.items() if k.lower() in _KEPT_HEADERS},
+            "body_b64": base64.b64encode(response.content).decode("ascii"),
+            "elapsed_s": round(elapsed_s, 4),
+        }
+        self._entries[fp].append(entry)
+        if self._out is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            # Append mode writes a new gzip member; readers handle multi-member files
+            self._out = gzip.open(self.path, "at", encoding="utf-8")
+            atexit.register(self.close)
+        self._out.write(json.dumps(entry) + "\n")
+        self._out.flush()
+        self.recorded += 1
+
+    def close(self) -> None:
+        if self._out is not None:
+            self._out.close()
+            self._out = None
+        if self.mode != "record" and self.misses:
+            logger.warning("Cassette %s: %d hits, %d MISSES", self.path, self.hits, self.misses)
+
+    def stats(self) -> dict:
+        return {"path": self.path, "mode": self.mode, "hits": self.hits, "misses": self.misses, "recorded": self.recorded}
+
+
+class CassetteTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that records to, or replays from, a Cassette."""
+
+    def __init__(self, cassette: Cassette, inner: httpx.AsyncBaseTransport):
+        self.cassette = cassette
+        self.inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        cassette = self.cassette
+        fp = fingerprint(request)
+
+        if cassette.mode == "record":
+            start = time.monotonic()
+            response = await self.inner.handle_async_request(request)
+            content = await response.aread()
+            await response.aclose()
+            elapsed = time.monotonic() - start
+            headers = [(k, v) for k, v in response.headers.items() if k.lower() not in _WIRE_HEADERS]
+            response = httpx.Response(response.status_code, headers=headers, content=content, request=request)
+            cassette.append(fp, request, response, elapsed)
+            return response
+
+        entry = cassette.lookup(fp)
+        if entry is None:
+            cassette.misses += 1
+            logger.error("Cassette miss %s %s (fingerprint %s)", request.method, request.url, fp[:16])
+            if cassette.on_miss == "passthrough":
+                return await self.inner.handle_async_request(request)
+            raise CassetteMiss(f"No recorded response for {request.method} {request.url} (fingerprint {fp[:16]})")
+
+        cassette.hits += 1
+        if cassette.mode == "replay_timed" and entry["elapsed_s"]:
+            await asyncio.sleep(entry["elapsed_s"])
+        return httpx.Response(
+            entry["status"],
+            headers=entry["headers"],
+            content=base64.b64decode(entry["body_b64"]),
+            request=request,
+        )
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+_cassette: Cassette | None = None
+
+
+def get_cassette() -> Cassette | None:
+    """Return the process-wide cassette configured by VISION_CASSETTE, or None."""
+    global _cassette
+    path = os.getenv("VISION_CASSETTE")
+    if not path:
+        return None
+    if _cassette is None or _cassette.path != path:
+        _cassette = Cassette(
+            path,
+            os.getenv("VISION_CASSETTE_MODE", "replay"),
+            os.getenv("VISION_CASSETTE_ON_MISS", "error"),
+        )
+    return _cassette
+
+
+def wrap_transport(inner: httpx.AsyncBaseTransport) -> httpx.AsyncBaseTransport:
+    cassette = get_cassette()
+    return CassetteTransport(cassette, inner) if cassette else inner
@@ -3,7 +3,7 @@ from __future__ import annotations
 Vision client factory.
 
 Resolution order:
-1. If model name is in OPENROUTER_VISION_MODELS → OpenRouterVision (async httpx, single API key)
+1. If model name is in OPENROUTER_VISION_MODELS → OpenRouterVision (pooled async httpx, single API key)
 2. Otherwise fall back to a direct provider client based on the provider prefix.
 
 Direct fallback model name convention (when NOT using OpenRouter):
@@ -12,6 +12,11 @@ Direct fallback model name convention (when NOT using OpenRouter):
   google/<model>     → GeminiVision
   groq/<model>       → GroqVision
   x-ai/<model>       → XAIVision
+  mock/<name>        → MockVision (offline, deterministic; always, even with OPENROUTER_API_KEY)
+
+OpenRouterVision, GroqVision and XAIVision are configurations of the shared
+OpenAICompatibleVision client (vision.openai_compat), so they all get pooled
+connections, the same retry/backoff policy and per-call instrumentation.
 
 For legacy bare model names (e.g. "gpt-4o", "claude-3-5-sonnet-20241022"),
 pass provider= explicitly or use the full OpenRouter-style name.
@@ -28,11 +33,16 @@ def create_vision_client(model: str, provider: str | None = None) -> VisionAPI:
     Args:
         model: Model identifier. Prefer OpenRouter-style names like "openai/gpt-4o".
                Bare names like "gpt-4o" are also accepted for direct provider fallback.
-        provider: Explicit provider override ("anthropic", "openai", "google", "groq", "xai").
+        provider: Explicit provider override ("anthropic", "openai", "google", "groq", "xai", "mock").
                   Only needed when model is a bare name not in OpenRouter's model set.
     """
     import os
 
+    # Offline mock models never leave the process
+    if model.startswith("mock/") or provider == "mock":
+        from vision.providers.mock import MockVision
+        return MockVision(model)
+
     # Primary rule: any "provider/model" name + OPENROUTER_API_KEY → OpenRouter.
     # This covers every model in the dropdown without needing a hardcoded allowlist.
     if "/" in model and os.getenv("OPENROUTER_API_KEY"):
@@ -0,0 +1,119 @@
+from __future__ import annotations
+"""
+Per-call instrumentation for vision requests.
+
+Every request that goes through the shared HTTP path produces one CallRecord,
+and so does every request of the direct SDK providers (Claude, OpenAI,
+Gemini) through recorded_call() — their SDKs retry internally, so those
+records always count one attempt.
+
+Records are aggregated in-process (see snapshot()) and fanned out to any
+registered listeners — e.g. budget tracking or persistent latency history.
+
+Listeners run synchronously on the event loop and must be cheap; exceptions
+raised by a listener are logged and otherwise ignored.
+
+Callers can tag the requests they make with call_purpose (e.g. "clue" or
+"score" — set by core.game.AIPlayer); the tag is copied into each record.
+"""
+
+import contextlib
+import logging
+import time
+from collections import defaultdict
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CallRecord:
+    provider: str
+    model: str
+    status: int | None          # final HTTP status, None if no response was received
+    attempts: int
+    latency_s: float            # wall time including retries and backoff
+    ok: bool
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost: float | None = None   # provider-reported cost (OpenRouter), if any
+    purpose: str | None = None  # call_purpose at the time of the request
+
+
+call_purpose: ContextVar[str | None] = ContextVar("call_purpose", default=None)
+
+Listener = Callable[[CallRecord], None]
+
+_listeners: list[Listener] = []
+_stats: dict[tuple[str, str], dict] = defaultdict(lambda: {
+    "calls": 0,
+    "errors": 0,
+    "retries": 0,
+    "latency_s": 0.0,
+    "prompt_tokens": 0,
+    "completion_tokens": 0,
+    "cost": 0.0,
+})
+
+
+def add_listener(fn: Listener) -> None:
+    _listeners.append(fn)
+
+
+def remove_listener(fn: Listener) -> None:
+    if fn in _listeners:
+        _listeners.remove(fn)
+
+
+def record(rec: CallRecord) -> None:
+    s = _stats[(rec.provider, rec.model)]
+    s["calls"] += 1
+    s["errors"] += 0 if rec.ok else 1
+    s["retries"] += max(rec.attempts - 1, 0)
+    s["latency_s"] += rec.latency_s
+    s["prompt_tokens"] += rec.prompt_tokens
+    s["completion_tokens"] += rec.completion_tokens
+    s["cost"] += rec.cost or 0.0
+    for fn in list(_listeners):
+        try:
+            fn(rec)
+        except Exception as exc:
+            logger.warning("Instrumentation listener %r failed: %s", fn, exc)
+
+
+@contextlib.contextmanager
+def recorded_call(provider: str, model: str) -> Iterator[CallRecord]:
+    """Time one SDK request and record it when the block exits.
+
+    The caller marks success on the yielded record (``ok``, ``status``,
+    tokens); an exception leaves ``ok`` False and takes the status from the
+    SDK error when it has one.
+    """
+    rec = CallRecord(provider=provider, model=model, status=None, attempts=1, latency_s=0.0, ok=False,
+                     purpose=call_purpose.get())
+    start = time.monotonic()
+    try:
+        yield rec
+    except BaseException as exc:
+        status = getattr(exc, "status_code", None) or getattr(exc, "code", None)
+        rec.status = int(status) if isinstance(status, int) else None
+        raise
+    finally:
+        rec.latency_s = time.monotonic() - start
+        record(rec)
+
+
+def snapshot() -> list[dict]:
+    """Return aggregated per-(provider, model) counters since process start."""
+    out = []
+    for (provider, model), s in sorted(_stats.items()):
+        calls = s["calls"]
+        out.append({
+            "provider": provider,
+            "model": model,
+            **s,
+            "avg_latency_s": round(s["latency_s"] / calls, 3) if calls else 0.0,
+        })
+    return out
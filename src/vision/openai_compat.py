@@ -0,0 +1,232 @@
+from __future__ import annotations
+"""
+Unified async client for OpenAI-compatible chat-completions endpoints.
+
+OpenRouter, Groq and xAI all speak the same wire format, so they share one
+implementation here:
+
+- one pooled httpx.AsyncClient per provider (per event loop), reused across
+  players and games instead of a new connection per call;
+- URL images passed through as-is, local files sent as base64 data URIs
+  (a client built with url_images=False inlines URL images too, reading the
+  local card mirror first — see core.mirror; none of the bundled providers
+  needs this);
+- the same retry policy everywhere: exponential backoff on 429 / 5xx and
+  network errors, honouring Retry-After;
+- optional per-provider concurrency cap via ``<PROVIDER>_MAX_CONCURRENCY``;
+- one CallRecord per request sent to vision.instrumentation;
+- optional record / replay of all traffic (see vision.cassette).
+"""
+
+import asyncio
+import base64
+import contextlib
+import logging
+import os
+import time
+
+import httpx
+
+from vision.base import VisionAPI, shared_client
+from vision.cassette import wrap_transport
+from vision.instrumentation import CallRecord, call_purpose, record
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 60.0
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_RETRY_AFTER = 60.0
+
+
+def encode_image(image_path: str) -> str:
+    with open(image_path, "rb") as f:
+        return base64.b64encode(f.read()).decode("utf-8")
+
+
+def image_media_type(image_path: str) -> str:
+    ext = image_path.lower().split("?")[0].rsplit(".", 1)[-1]
+    return {"jpg": "image/jpeg", "jpeg": "image/jpeg", "png": "image/png", "webp": "image/webp"}.get(ext, "image/jpeg")
+
+
+def _env_int(name: str) -> int | None:
+    value = os.getenv(name)
+    return int(value) if value else None
+
+
+def get_http_client(provider: str) -> httpx.AsyncClient:
+    """Return the pooled AsyncClient for ``provider`` (one per process / event loop)."""
+    def _make() -> httpx.AsyncClient:
+        max_conn = _env_int(f"{provider.upper()}_MAX_CONNECTIONS") or 100
+        transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(max_connections=max_conn, max_keepalive_connections=max_conn),
+        )
+        return httpx.AsyncClient(timeout=DEFAULT_TIMEOUT, transport=wrap_transport(transport))
+    return shared_client(f"http:{provider}", _make)
+
+
+def _concurrency_slot(provider: str):
+    limit = _env_int(f"{provider.upper()}_MAX_CONCURRENCY")
+    if not limit:
+        return contextlib.nullcontext()
+    return shared_client(f"sem:{provider}", lambda: asyncio.Semaphore(limit))
+
+
+def _retry_after(resp: httpx.Response, default: float) -> float:
+    value = resp.headers.get("retry-after")
+    try:
+        return min(max(float(value), default), MAX_RETRY_AFTER) if value else default
+    except ValueError:
+        return default
+
+
+async def post_chat_completion(
+    client: httpx.AsyncClient,
+    url: str,
+    payload: dict,
+    headers: dict,
+    provider: str,
+    retries: int = 3,
+) -> str:
+    """POST a chat completion with backoff on 429 / 5xx; return the message text or "" on failure."""
+    model = payload.get("model", "")
+    delay = 1.0
+    start = time.monotonic()
+    status: int | None = None
+    attempt = 0
+
+    def _done(ok: bool, usage: dict | None = None) -> None:
+        usage = usage or {}
+        record(CallRecord(
+            provider=provider,
+            model=model,
+            status=status,
+            attempts=attempt,
+            latency_s=time.monotonic() - start,
+            ok=ok,
+            prompt_tokens=usage.get("prompt_tokens") or 0,
+            completion_tokens=usage.get("completion_tokens") or 0,
+            cost=usage.get("cost"),
+            purpose=call_purpose.get(),
+        ))
+
+    async with _concurrency_slot(provider):
+        while attempt < retries:
+            attempt += 1
+            try:
+                resp = await client.post(url, json=payload, headers=headers)
+            except httpx.RequestError as exc:
+                status = None
+                logger.warning("%s network error on attempt %d/%d: %s", provider, attempt, retries, exc)
+                if attempt < retries:
+                    await asyncio.sleep(delay)
+                    delay *= 2
+                continue
+
+            status = resp.status_code
+            if status == 200:
+                data = resp.json()
+                if "error" in data:
+                    logger.warning("%s 200 with error for model %s: %s", provider, model, str(data["error"])[:200])
+                    _done(False, data.get("usage"))
+                    return ""
+                content = data["choices"][0]["message"]["content"]
+                _done(bool(content), data.get("usage"))
+                return content or ""
+            if status in RETRY_STATUSES:
+                wait = _retry_after(resp, delay)
+                logger.warning(
+                    "%s %s on attempt %d/%d, retrying in %.1fs",
+                    provider, status, attempt, retries, wait,
+                )
+                if attempt < retries:
+                    await asyncio.sleep(wait)
+                    delay *= 2
+                continue
+            # 4xx client errors — log body for diagnosis, don't retry
+            logger.error("%s %s for model %s — %s", provider, status, model, resp.text[:500])
+            _done(False)
+            return ""
+
+    logger.error("%s request failed after %d attempts for model %s", provider, retries, model)
+    _done(False)
+    return ""
+
+
+class OpenAICompatibleVision(VisionAPI):
+    """Vision client for any OpenAI-compatible ``/chat/completions`` endpoint."""
+
+    vision_api_name = "OpenAICompatibleVision"
+
+    def __init__(
+        self,
+        model: str,
+        *,
+        provider: str,
+        base_url: str,
+        api_key: str | None,
+        extra_headers: dict[str, str] | None = None,
+        url_images: bool = True,
+        retries: int = 3,
+    ):
+        self.model = model
+        self.provider = provider
+        self.endpoint = base_url.rstrip("/").removesuffix("/chat/completions") + "/chat/completions"
+        self._api_key = api_key
+        self._extra_headers = extra_headers or {}
+        self.url_images = url_images
+        self.retries = retries
+
+    def _http_client(self) -> httpx.AsyncClient:
+        return get_http_client(self.provider)
+
+    async def _image_url(self, image_path: str) -> str:
+        if image_path.startswith(("http://", "https://")):
+            if self.url_images:
+                return image_path
+            from core.mirror import get_mirror
+            data = get_mirror().read_bytes(image_path)
+            if data is None:
+                resp = await self._http_client().get(image_path, follow_redirects=True)
+                resp.raise_for_status()
+                data = resp.content
+            image_b64 = base64.b64encode(data).decode("utf-8")
+        else:
+            image_b64 = encode_image(image_path)
+        return f"data:{image_media_type(image_path)};base64,{image_b64}"
+
+    async def analyze_image(
+        self,
+        image_path: str,
+        prompt: str,
+        max_tokens: int = 60,
+        temperature: float = 1.0,
+    ) -> str:
+        payload = {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": prompt},
+                        {
+                            "type": "image_url",
+                            "image_url": {"url": await self._image_url(image_path)},
+                        },
+                    ],
+                }
+            ],
+        }
+        headers = {
+            "Authorization": f"Bearer {self._api_key}",
+            "Content-Type": "application/json",
+            **self._extra_headers,
+        }
+        return await post_chat_completion(
+            self._http_client(), self.endpoint, payload, headers,
+            provider=self.provider, retries=self.retries,
+        )
+
+    def to_dict(self) -> dict:
+        return {"model": self.model, "vision_api": self.vision_api_name}
@@ -1,21 +1,24 @@
 """Anthropic Claude direct provider (fallback)."""
 
-import asyncio
 import base64
 import os
 
 import anthropic
 from dotenv import load_dotenv
 
-from vision.base import VisionAPI
+from vision.base import VisionAPI, shared_client
+from vision.instrumentation import recorded_call
 
 load_dotenv()
 
 
+def _get_client() -> anthropic.AsyncAnthropic:
+    return shared_client("anthropic", lambda: anthropic.AsyncAnthropic(api_key=os.getenv("ANTHROPIC_API_KEY")))
+
+
 class ClaudeVision(VisionAPI):
     def __init__(self, model: str):
         self.model = model.removeprefix("anthropic/")
-        self._client = anthropic.Client(api_key=os.getenv("ANTHROPIC_API_KEY"))
 
     async def analyze_image(self, image_path: str, prompt: str, max_tokens: int = 60, temperature: float = 1.0) -> str:
         if image_path.startswith(("http://", "https://")):
@@ -25,10 +28,8 @@ class ClaudeVision(VisionAPI):
                 image_b64 = base64.b64encode(f.read()).decode("utf-8")
             image_source = {"type": "base64", "media_type": "image/jpeg", "data": image_b64}
 
-        loop = asyncio.get_event_loop()
-        message = await loop.run_in_executor(
-            None,
-            lambda: self._client.messages.create(
+        with recorded_call("anthropic", self.model) as rec:
+            message = await _get_client().messages.create(
                 model=self.model,
                 max_tokens=max_tokens,
                 temperature=temperature,
@@ -41,8 +42,10 @@ class ClaudeVision(VisionAPI):
                         ],
                     }
                 ],
-            ),
-        )
+            )
+            rec.ok, rec.status = True, 200
+            rec.prompt_tokens = message.usage.input_tokens
+            rec.completion_tokens = message.usage.output_tokens
         return message.content[0].text
 
     def to_dict(self) -> dict:
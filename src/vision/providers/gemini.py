@@ -1,15 +1,151 @@
-"""Google Gemini direct provider (fallback — uses file upload API)."""
+"""Google Gemini direct provider (fallback).
+
+The google-generativeai SDK is sync-only, so calls run on a dedicated
+thread pool (``GEMINI_MAX_WORKERS``) instead of asyncio's default executor.
+
+Images are sent inline when they are small (``GEMINI_INLINE_MAX_BYTES``,
+default 1 MB) — that skips the upload round trip entirely.  Larger images go
+through the File API once; the resulting handle is cached by content hash
+(in memory and in SQLite) until shortly before its server-side expiry, so
+the same card is reused across prompts, players and games.  If the server
+has dropped a cached file early (NotFound / PermissionDenied), it is
+re-uploaded once; any other error (quota, safety, timeout) propagates.
+"""
 
 import asyncio
+import hashlib
+import io
+import logging
 import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
 
 import google.generativeai as genai
+import httpx
 from dotenv import load_dotenv
+from google.api_core import exceptions as google_exceptions
 
-from vision.base import VisionAPI
+from vision.base import VisionAPI, provider_executor
+from vision.instrumentation import recorded_call
 
 load_dotenv()
 genai.configure(api_key=os.environ.get("GEMINI_API_KEY", ""))
+logger = logging.getLogger(__name__)
+
+INLINE_MAX_BYTES = int(os.getenv("GEMINI_INLINE_MAX_BYTES", 1_000_000))
+_FILE_CACHE_DB = os.getenv("GEMINI_FILE_CACHE_DB", "image_analysis_cache.db")
+# Uploaded files live 48h on Google's side; stop reusing them a bit earlier.
+_EXPIRY_MARGIN = timedelta(minutes=30)
+
+# One GenerativeModel per model name for the whole process; generation
+# parameters are passed per call so the instance can be shared by all players.
+_models: dict[str, genai.GenerativeModel] = {}
+
+
+def _get_model(model_name: str) -> genai.GenerativeModel:
+    if model_name not in _models:
+        _models[model_name] = genai.GenerativeModel(model_name=model_name)
+    return _models[model_name]
+
+
+def _image_media_type(image_path: str) -> str:
+    ext = image_path.lower().split("?")[0].rsplit(".", 1)[-1]
+    return {"jpg": "image/jpeg", "jpeg": "image/jpeg", "png": "image/png", "webp": "image/webp"}.get(ext, "image/jpeg")
+
+
+def _read_image(image_path: str) -> bytes:
+    """Return image bytes for a local path or URL (mirrored copy first, else downloaded in memory)."""
+    if image_path.startswith(("http://", "https://")):
+        from core.mirror import get_mirror
+        data = get_mirror().read_bytes(image_path)
+        if data is not None:
+            return data
+        resp = httpx.get(image_path, timeout=30.0, follow_redirects=True)
+        resp.raise_for_status()
+        return resp.content
+    with open(image_path, "rb") as f:
+        return f.read()
+
+
+class GeminiFileCache:
+    """Content-hash → uploaded File API handle, with server-side expiry."""
+
+    def __init__(self, db_path: str = _FILE_CACHE_DB):
+        self.db_path = db_path
+        self._mem: dict[str, tuple[str, str, datetime]] = {}  # hash -> (uri, mime_type, expires_at)
+        self._lock = threading.Lock()
+        self._hash_locks: dict[str, threading.Lock] = {}
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS gemini_files (
+                    content_hash TEXT PRIMARY KEY,
+                    file_uri     TEXT,
+                    mime_type    TEXT,
+                    expires_at   TEXT
+                )
+            """)
+            conn.commit()
+
+    def _lookup(self, content_hash: str) -> tuple[str, str] | None:
+        entry = self._mem.get(content_hash)
+        if entry is None:
+            with sqlite3.connect(self.db_path) as conn:
+                row = conn.execute(
+                    "SELECT file_uri, mime_type, expires_at FROM gemini_files WHERE content_hash=?",
+                    (content_hash,),
+                ).fetchone()
+            if row is None:
+                return None
+            entry = (row[0], row[1], datetime.fromisoformat(row[2]))
+            self._mem[content_hash] = entry
+        uri, mime_type, expires_at = entry
+        if expires_at - _EXPIRY_MARGIN <= datetime.now(timezone.utc):
+            self.invalidate(content_hash)
+            return None
+        return uri, mime_type
+
+    def _store(self, content_hash: str, uri: str, mime_type: str, expires_at: datetime) -> None:
+        self._mem[content_hash] = (uri, mime_type, expires_at)
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO gemini_files (content_hash, file_uri, mime_type, expires_at) VALUES (?, ?, ?, ?)",
+                (content_hash, uri, mime_type, expires_at.isoformat()),
+            )
+            conn.commit()
+
+    def invalidate(self, content_hash: str) -> None:
+        self._mem.pop(content_hash, None)
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("DELETE FROM gemini_files WHERE content_hash=?", (content_hash,))
+            conn.commit()
+
+    def get_or_upload(self, content_hash: str, data: bytes, mime_type: str) -> dict:
+        """Return a ``file_data`` content part for ``data``, uploading it only on a miss."""
+        with self._lock:
+            hash_lock = self._hash_locks.setdefault(content_hash, threading.Lock())
+        # Serialise per hash so concurrent players don't upload the same card twice
+        with hash_lock:
+            cached = self._lookup(content_hash)
+            if cached is None:
+                uploaded = genai.upload_file(io.BytesIO(data), mime_type=mime_type)
+                expires_at = uploaded.expiration_time or datetime.now(timezone.utc) + timedelta(hours=48)
+                if expires_at.tzinfo is None:
+                    expires_at = expires_at.replace(tzinfo=timezone.utc)
+                self._store(content_hash, uploaded.uri, mime_type, expires_at)
+                logger.debug("Uploaded %d bytes to Gemini File API (%s)", len(data), content_hash[:12])
+                cached = (uploaded.uri, mime_type)
+        return {"file_data": {"file_uri": cached[0], "mime_type": cached[1]}}
+
+
+_file_cache: GeminiFileCache | None = None
+
+
+def get_file_cache() -> GeminiFileCache:
+    global _file_cache
+    if _file_cache is None:
+        _file_cache = GeminiFileCache()
+    return _file_cache
 
 
 class GeminiVision(VisionAPI):
@@ -17,12 +153,9 @@ class GeminiVision(VisionAPI):
         self.model = model.removeprefix("google/")
 
     async def analyze_image(self, image_path: str, prompt: str, max_tokens: int = 60, temperature: float = 1.0) -> str:
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
 
         def _call():
-            import tempfile
-            import urllib.request
-
             generation_config = {
                 "temperature": temperature,
                 "top_p": 0.95,
@@ -30,22 +163,36 @@ class GeminiVision(VisionAPI):
                 "max_output_tokens": max_tokens,
                 "response_mime_type": "text/plain",
             }
-            model = genai.GenerativeModel(model_name=self.model, generation_config=generation_config)
-
-            if image_path.startswith(("http://", "https://")):
-                suffix = "." + image_path.rsplit(".", 1)[-1].split("?")[0]
-                with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as f:
-                    urllib.request.urlretrieve(image_path, f.name)
-                    local_path = f.name
-            else:
-                local_path = image_path
-
-            file_uri = genai.upload_file(local_path)
-            chat = model.start_chat(history=[{"role": "user", "parts": [file_uri]}])
-            response = chat.send_message(prompt)
-            return response.text
-
-        return await loop.run_in_executor(None, _call)
+            model = _get_model(self.model)
+            data = _read_image(image_path)
+            mime_type = _image_media_type(image_path)
+
+            if len(data) <= INLINE_MAX_BYTES:
+                part = {"inline_data": {"mime_type": mime_type, "data": data}}
+                return model.generate_content([part, prompt], generation_config=generation_config)
+
+            cache = get_file_cache()
+            content_hash = hashlib.sha256(data).hexdigest()
+            part = cache.get_or_upload(content_hash, data, mime_type)
+            try:
+                return model.generate_content([part, prompt], generation_config=generation_config)
+            except (google_exceptions.NotFound, google_exceptions.PermissionDenied) as exc:
+                # The server may have dropped the file early — re-upload once
+                logger.warning("Gemini call with cached file failed (%s); re-uploading", exc)
+                cache.invalidate(content_hash)
+                part = cache.get_or_upload(content_hash, data, mime_type)
+                return model.generate_content([part, prompt], generation_config=generation_config)
+
+        # Recorded on the event loop: listeners (budgets, call history) read context the executor thread lacks
+        with recorded_call("google", self.model) as rec:
+            response = await loop.run_in_executor(provider_executor("gemini"), _call)
+            text = response.text
+            rec.ok, rec.status = bool(text), 200
+            usage = getattr(response, "usage_metadata", None)
+            if usage is not None:
+                rec.prompt_tokens = usage.prompt_token_count or 0
+                rec.completion_tokens = usage.candidates_token_count or 0
+        return text
 
     def to_dict(self) -> dict:
         return {"model": self.model, "vision_api": "GeminiVision"}
@@ -0,0 +1,182 @@
+"""Deterministic offline mock provider (``mock/<name>``) for load tests and benchmarks.
+
+MockVision is a configuration of the shared OpenAI-compatible client whose
+httpx transport answers locally, so games exercise the real retry, backoff,
+concurrency-cap and instrumentation path without any network or spend.
+
+Responses are a pure function of ``(seed, model, image, prompt)``:
+  - clue prompts get 2–4 words, mostly drawn from a fixed per-image word set;
+  - vote prompts ("0–10") get a score that grows with the overlap between the
+    clue and the card's word set, so storytellers are found more often than
+    chance and games behave plausibly.
+
+Latency, 429 / 5xx rates and empty responses come from a config, read from
+``MOCK_VISION_CONFIG`` (a path to a JSON file or an inline JSON object)::
+
+    {
+      "seed": 0,
+      "latency": {"dist": "lognormal", "median_s": 0.8, "sigma": 0.5},
+      "rate_429": 0.02,
+      "rate_5xx": 0.01,
+      "empty_rate": 0.01,
+      "time_scale": 1.0,
+      "models": {"mock/slow": {"latency": {"dist": "fixed", "value_s": 5.0}}}
+    }
+
+Latency distributions: fixed (value_s), uniform (low_s, high_s),
+lognormal (median_s, sigma), exponential (mean_s).  ``time_scale`` multiplies
+every simulated delay; set it to 0 to benchmark engine throughput alone.
+Failures are drawn per attempt, so retried requests can succeed.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import os
+import random
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field, fields
+
+import httpx
+
+from vision.base import shared_client
+from vision.openai_compat import OpenAICompatibleVision
+
+_VOCABULARY = (
+    "moon", "tide", "lantern", "whisper", "labyrinth", "feather", "ember", "mirror",
+    "orchard", "clockwork", "shadow", "voyage", "thread", "crown", "well", "storm",
+    "dream", "key", "garden", "tower", "snail", "comet", "mask", "river",
+    "cage", "lullaby", "balloon", "owl", "staircase", "ink", "harvest", "silence",
+    "ladder", "compass", "veil", "anchor", "nest", "frost", "candle", "echo",
+    "island", "paper", "serpent", "bridge", "dawn", "puzzle", "chimney", "wave",
+)
+_WORDS_PER_CARD = 4
+_VOTE_MARKERS = ("0–10", "0-10")
+
+
+@dataclass
+class MockConfig:
+    seed: int = 0
+    latency: dict = field(default_factory=lambda: {"dist": "fixed", "value_s": 0.0})
+    rate_429: float = 0.0
+    rate_5xx: float = 0.0
+    empty_rate: float = 0.0
+    time_scale: float = 1.0
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "MockConfig":
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+    def sample_latency(self, rng: random.Random) -> float:
+        spec = self.latency
+        dist = spec.get("dist", "fixed")
+        if dist == "fixed":
+            value = spec.get("value_s", 0.0)
+        elif dist == "uniform":
+            value = rng.uniform(spec.get("low_s", 0.0), spec.get("high_s", 1.0))
+        elif dist == "lognormal":
+            value = rng.lognormvariate(math.log(spec.get("median_s", 0.5)), spec.get("sigma", 0.5))
+        elif dist == "exponential":
+            value = rng.expovariate(1.0 / spec.get("mean_s", 0.5))
+        else:
+            raise ValueError(f"Unknown mock latency distribution '{dist}'")
+        return max(value, 0.0) * self.time_scale
+
+
+def load_mock_config(model: str, raw: str | None = None) -> MockConfig:
+    """Resolve the config for ``model`` from MOCK_VISION_CONFIG (file path or inline JSON)."""
+    raw = raw if raw is not None else os.getenv("MOCK_VISION_CONFIG", "")
+    if not raw:
+        return MockConfig()
+    if raw.lstrip().startswith("{"):
+        data = json.loads(raw)
+    else:
+        with open(raw) as f:
+            data = json.load(f)
+    overrides = data.get("models", {}).get(model, {})
+    return MockConfig.from_dict({**data, **overrides})
+
+
+def _digest(*parts: object) -> int:
+    h = hashlib.sha256("\x1f".join(str(p) for p in parts).encode("utf-8")).digest()
+    return int.from_bytes(h[:8], "big")
+
+
+def card_words(image: str) -> list[str]:
+    """The fixed word set a card 'depicts' — independent of model and prompt."""
+    return random.Random(_digest("card", image)).sample(_VOCABULARY, _WORDS_PER_CARD)
+
+
+def mock_response(seed: int, model: str, image: str, prompt: str) -> str:
+    """Deterministic clue or score for ``(seed, model, image, prompt)``."""
+    rng = random.Random(_digest(seed, model, image, prompt))
+    words = card_words(image)
+    if any(m in prompt for m in _VOTE_MARKERS):
+        match = re.search(r"'(.*)'", prompt, re.S)
+        clue_words = set(match.group(1).lower().split()) if match else set()
+        overlap = len(clue_words & set(words))
+        return str(min(10, 2 * overlap + rng.randint(0, 4)))
+    n_own = rng.randint(1, 3)
+    clue = rng.sample(words, n_own) + [rng.choice(_VOCABULARY)]
+    rng.shuffle(clue)
+    return " ".join(clue)
+
+
+class _MockBackend:
+    """httpx transport handler that simulates an OpenAI-compatible server."""
+
+    def __init__(self):
+        self._configs: dict[str, MockConfig] = {}
+        self._attempts: dict[int, int] = defaultdict(int)
+
+    def config_for(self, model: str) -> MockConfig:
+        if model not in self._configs:
+            self._configs[model] = load_mock_config(model)
+        return self._configs[model]
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        model = body["model"]
+        content = body["messages"][0]["content"]
+        prompt = next(p["text"] for p in content if p["type"] == "text")
+        image = next(p["image_url"]["url"] for p in content if p["type"] == "image_url")
+        cfg = self.config_for(model)
+
+        fingerprint = _digest(cfg.seed, model, image, prompt)
+        attempt = self._attempts[fingerprint]
+        self._attempts[fingerprint] += 1
+        rng = random.Random(_digest(fingerprint, attempt))
+
+        delay = cfg.sample_latency(rng)
+        if delay:
+            await asyncio.sleep(delay)
+
+        roll = rng.random()
+        if roll < cfg.rate_429:
+            return httpx.Response(429, headers={"retry-after": "1"}, json={"error": "rate limited (mock)"})
+        if roll < cfg.rate_429 + cfg.rate_5xx:
+            return httpx.Response(rng.choice((500, 502, 503)), json={"error": "server error (mock)"})
+        if roll < cfg.rate_429 + cfg.rate_5xx + cfg.empty_rate:
+            text = ""
+        else:
+            text = mock_response(cfg.seed, model, image, prompt)
+        usage = {"prompt_tokens": len(prompt.split()) + 85, "completion_tokens": len(text.split()), "cost": 0.0}
+        return httpx.Response(200, json={"choices": [{"message": {"content": text}}], "usage": usage})
+
+
+class MockVision(OpenAICompatibleVision):
+    """Offline, deterministic stand-in for a real vision model."""
+
+    vision_api_name = "MockVision"
+
+    def __init__(self, model: str):
+        super().__init__(model, provider="mock", base_url="http://mock.invalid/v1", api_key="mock")
+
+    def _http_client(self) -> httpx.AsyncClient:
+        return shared_client(
+            "http:mock",
+            lambda: httpx.AsyncClient(transport=httpx.MockTransport(_MockBackend()), timeout=None),
+        )
@@ -1,22 +1,25 @@
 """OpenAI direct provider (fallback)."""
 
-import asyncio
 import base64
 import os
 
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI
 
-from vision.base import VisionAPI
+from vision.base import VisionAPI, shared_client
+from vision.instrumentation import recorded_call
 
 load_dotenv()
 
 
+def _get_client() -> AsyncOpenAI:
+    return shared_client("openai", lambda: AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY")))
+
+
 class OpenAIVision(VisionAPI):
     def __init__(self, model: str):
         # Strip "openai/" prefix — the native OpenAI SDK expects bare names like "gpt-4o"
         self.model = model.removeprefix("openai/")
-        self._client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
     async def analyze_image(self, image_path: str, prompt: str, max_tokens: int = 60, temperature: float = 1.0) -> str:
         if image_path.startswith(("http://", "https://")):
@@ -26,10 +29,8 @@ class OpenAIVision(VisionAPI):
                 image_b64 = base64.b64encode(f.read()).decode("utf-8")
             image_url_str = f"data:image/jpeg;base64,{image_b64}"
 
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            lambda: self._client.chat.completions.create(
+        with recorded_call("openai", self.model) as rec:
+            response = await _get_client().chat.completions.create(
                 model=self.model,
                 max_completion_tokens=max_tokens,
                 temperature=temperature,
@@ -42,9 +43,13 @@ class OpenAIVision(VisionAPI):
                         ],
                     }
                 ],
-            ),
-        )
-        return response.choices[0].message.content
+            )
+            content = response.choices[0].message.content
+            rec.ok, rec.status = bool(content), 200
+            if response.usage is not None:
+                rec.prompt_tokens = response.usage.prompt_tokens
+                rec.completion_tokens = response.usage.completion_tokens
+        return content
 
     def to_dict(self) -> dict:
         return {"model": self.model, "vision_api": "OpenAIVision"}
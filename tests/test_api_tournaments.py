@@ -0,0 +1,53 @@
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.routes import tournaments
+from core import tournament as core_tournament
+from core.tournament import Tournament
+
+CARDS = str(Path(__file__).resolve().parent.parent / "data" / "1_full")
+CONFIG = {
+    "defaults": {"cards": CARDS, "max_rounds": 1},
+    "runs": [{"name": "trio", "trials": 2, "players": [{"model": "mock/a"}, {"model": "mock/b"}, {"model": "mock/c"}]}],
+}
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.include_router(tournaments.router)
+    return TestClient(app)
+
+
+def test_config_budget_caps_the_tournament(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    async def _no_run(self, event_bus=None, trials=None):
+        pass
+
+    monkeypatch.setattr(Tournament, "run", _no_run)
+    client = _client()
+    resp = client.post("/api/tournaments", json={"config": {**CONFIG, "budget": {"requests": 50}}})
+    assert resp.status_code == 200
+    status = client.get(resp.json()["status_url"]).json()
+    assert status["settings"]["budget"] == {"requests": 50}
+    assert status["budget"]["limits"] == {"requests": 50}
+
+    resp = client.post("/api/tournaments", json={"config": {**CONFIG, "budget": {"dollars": 5}}})
+    assert resp.status_code == 422 and "dollars" in resp.json()["detail"]
+
+
+def test_api_tournaments_share_a_game_cap(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(tournaments, "_game_slots", None)
+    monkeypatch.setattr(core_tournament, "_active", {})
+
+    async def _no_run(self, event_bus=None, trials=None):
+        pass
+
+    monkeypatch.setattr(Tournament, "run", _no_run)
+    client = _client()
+    ids = [client.post("/api/tournaments", json={"config": CONFIG}).json()["tournament_id"] for _ in range(2)]
+    assert tournaments._game_slots is not None
+    assert all(core_tournament._active[i].game_slots is tournaments._game_slots for i in ids)
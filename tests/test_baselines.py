@@ -0,0 +1,63 @@
+import random
+
+import numpy as np
+
+from api.routes.leaderboard import _aggregate_from_logs
+from core.baselines import BaselineCache, round_deltas, simulate_baseline
+from core.scoring import compute_score_changes
+
+
+def test_vectorised_scoring_matches_core_scoring():
+    rng = random.Random(0)
+    for _ in range(300):
+        n = rng.randint(3, 6)
+        storyteller = rng.randrange(n)
+        voters = [p for p in range(n) if p != storyteller]
+        votes = [rng.choice([q for q in range(n) if q != v]) for v in voters]
+        deltas = round_deltas(np.array([votes]), storyteller, n)[0]
+        names = [str(p) for p in range(n)]
+        expected = compute_score_changes(
+            storyteller_name=str(storyteller),
+            all_player_names=names,
+            votes={str(v): str(c) for v, c in zip(voters, votes)},
+            played_cards={p: p for p in names},
+            storyteller_card_path=str(storyteller),
+        ).score_changes
+        assert {str(p): int(d) for p, d in enumerate(deltas) if d} == expected
+
+
+def test_baselines_are_cached_by_configuration(tmp_path):
+    path = str(tmp_path / "baselines.json")
+    first = BaselineCache(path, games=5000).get(3, max_rounds=6)
+    assert abs(sum(first["seat_win_rates"]) - 1) < 1e-3
+    assert BaselineCache(path, games=5000).get(3, max_rounds=6) == first  # read back from disk
+    assert simulate_baseline(3, 6, voter="oracle:0.9", games=5000)["score_mean"] != first["score_mean"]
+
+
+def test_leaderboard_reports_scores_relative_to_baseline(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    players = [{"name": f"p{i}", "model": f"mock/m{i}"} for i in range(3)]
+    log = {
+        "game_configuration": {"players": players, "max_rounds": 2, "score_to_win": 30},
+        "rounds": [
+            {"storyteller": "p0", "storyteller_votes": 1, "current_scores": {"p0": 3, "p1": 3, "p2": 1}},
+            {"storyteller": "p1", "storyteller_votes": 1, "current_scores": {"p0": 9, "p1": 6, "p2": 1}},
+        ],
+    }
+    board = {row["model"]: row for row in _aggregate_from_logs([log])}
+    assert 0 < board["mock/m0"]["baseline_win_rate"] < 1
+    assert board["mock/m0"]["avg_score_vs_baseline"] > 0 > board["mock/m2"]["avg_score_vs_baseline"]
+    assert board["mock/m0"]["score_percentile"] > board["mock/m2"]["score_percentile"]
+
+
+def test_tied_winners_share_the_win_against_the_baseline(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    players = [{"name": f"p{i}", "model": f"mock/m{i}"} for i in range(3)]
+    log = {
+        "game_configuration": {"players": players, "max_rounds": 1, "score_to_win": 30},
+        "rounds": [{"storyteller": "p0", "storyteller_votes": 0, "current_scores": {"p0": 0, "p1": 3, "p2": 3}}],
+    }
+    board = {row["model"]: row for row in _aggregate_from_logs([log])}
+    for model in ("mock/m1", "mock/m2"):
+        row = board[model]
+        assert row["win_rate_vs_baseline"] == round(0.5 - row["baseline_win_rate"], 3)
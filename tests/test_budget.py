@@ -0,0 +1,52 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from core.budget import BudgetExceeded
+from core.checkpoint import load_checkpoint
+from core.game import play_game, resume_game
+from core.game_log import find_log, load_log
+from core.tournament import Tournament, random_trials
+
+CARDS = str(Path(__file__).resolve().parent.parent / "data" / "1_full")
+PLAYERS = [{"model": "mock/a"}, {"model": "mock/b"}, {"model": "mock/c"}]
+
+
+def test_game_stops_at_its_budget(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    # A 3-player round makes 17 requests, so round 2 runs out during its pick phase
+    with pytest.raises(BudgetExceeded) as info:
+        asyncio.run(play_game(CARDS, PLAYERS, max_rounds=3, score_to_win=100, use_cache=False,
+                              seed=5, game_id="capped", budget={"requests": 20}))
+    assert info.value.scope == "game"
+    assert len(load_checkpoint("capped")["log"]["rounds"]) == 1
+    log = load_log(find_log("game_logs", "capped"))
+    assert log["status"] == "budget_exhausted" and log["status_detail"]["rounds"] == 1
+
+    # With "degrade" the exhausted players play on with fallback answers
+    log = asyncio.run(play_game(CARDS, PLAYERS, max_rounds=3, score_to_win=100, use_cache=False, seed=5,
+                                budget={"per_model": {"mock/a": {"requests": 5}}, "on_exhausted": "degrade"}))
+    assert len(log["rounds"]) == 3
+    assert log["budget"]["models"]["mock/a"]["requests"] == 5
+    assert set(log["budget"]["degraded"]) == {"mock/a"}
+
+    # The checkpoint keeps the spend so far: resuming under the same cap stops straight away
+    with pytest.raises(BudgetExceeded):
+        asyncio.run(resume_game("capped"))
+    assert len(load_checkpoint("capped")["log"]["rounds"]) == 1
+
+
+def test_tournament_budget_stops_new_games(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    trials = random_trials(CARDS, 6, 3, ["mock/a", "mock/b", "mock/c"], seed=2, max_rounds=2,
+                           score_to_win=100, use_cache=False)
+    tour = Tournament(trials, state_path=str(tmp_path / "state.json"), max_concurrent_games=1,
+                      budget={"requests": 80})
+    asyncio.run(tour.run())
+
+    statuses = [t.status for t in tour.trials]
+    assert tour.status == "budget_exhausted"
+    assert statuses[:2] == ["done", "done"] and statuses[2] == "stopped"
+    assert set(statuses[3:]) == {"pending"}
+    assert tour.spend.spent.requests == 80
@@ -0,0 +1,54 @@
+import asyncio
+import gzip
+import json
+
+import httpx
+import pytest
+
+from vision.cassette import Cassette, CassetteMiss, CassetteTransport
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"echo": request.content.decode()})
+
+
+async def _post(transport: httpx.AsyncBaseTransport, body: dict) -> httpx.Response:
+    async with httpx.AsyncClient(transport=transport) as client:
+        return await client.post("https://api.example/v1/chat/completions", json=body)
+
+
+def test_record_then_replay(tmp_path):
+    path = str(tmp_path / "c.jsonl.gz")
+    recorder = Cassette(path, "record")
+    live = asyncio.run(_post(CassetteTransport(recorder, httpx.MockTransport(_handler)), {"b": 1, "a": 2}))
+    recorder.close()
+
+    def _offline(request):
+        raise AssertionError("replay must not hit the network")
+
+    player = Cassette(path, "replay")
+    # Key order in the JSON body does not change the fingerprint
+    replayed = asyncio.run(_post(CassetteTransport(player, httpx.MockTransport(_offline)), {"a": 2, "b": 1}))
+    assert replayed.json() == live.json()
+    assert player.stats()["hits"] == 1
+
+    with pytest.raises(CassetteMiss):
+        asyncio.run(_post(CassetteTransport(player, httpx.MockTransport(_offline)), {"a": 3}))
+    assert player.misses == 1
+
+
+def test_records_gzip_encoded_responses(tmp_path):
+    def _gzipped(request):
+        body = gzip.compress(json.dumps({"choices": [{"message": {"content": "dusk"}}]}).encode())
+        return httpx.Response(200, headers={"content-type": "application/json", "content-encoding": "gzip"},
+                              content=body)
+
+    path = str(tmp_path / "c.jsonl.gz")
+    recorder = Cassette(path, "record")
+    live = asyncio.run(_post(CassetteTransport(recorder, httpx.MockTransport(_gzipped)), {"a": 1}))
+    recorder.close()
+    assert live.json()["choices"][0]["message"]["content"] == "dusk"
+    assert recorder.recorded == 1
+
+    replayed = asyncio.run(_post(CassetteTransport(Cassette(path, "replay"), httpx.MockTransport(_gzipped)), {"a": 1}))
+    assert replayed.json() == live.json()
@@ -0,0 +1,47 @@
+import asyncio
+import random
+from pathlib import Path
+
+import pytest
+
+import core.rules
+from core.checkpoint import load_checkpoint
+from core.game import play_game, resume_game
+
+CARDS = str(Path(__file__).resolve().parent.parent / "data" / "1_full")
+PLAYERS = [{"model": "mock/a"}, {"model": "mock/b"}, {"model": "mock/c"}]
+
+
+def test_resumed_game_matches_uninterrupted_run(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    random.seed(3)
+    full = asyncio.run(play_game(CARDS, PLAYERS, max_rounds=4, use_cache=False, game_id="straight"))
+    assert load_checkpoint("straight") is None  # removed once the game finishes
+
+    # Crash while scoring round 3
+    real_scoring = core.rules.compute_score_changes
+    calls = []
+
+    def _crash_on_third(**kwargs):
+        calls.append(1)
+        if len(calls) == 3:
+            raise RuntimeError("simulated crash")
+        return real_scoring(**kwargs)
+
+    monkeypatch.setattr(core.rules, "compute_score_changes", _crash_on_third)
+    random.seed(3)
+    with pytest.raises(RuntimeError):
+        asyncio.run(play_game(CARDS, PLAYERS, max_rounds=4, use_cache=False, game_id="crashy"))
+    assert load_checkpoint("crashy")["round"] == 2
+
+    monkeypatch.setattr(core.rules, "compute_score_changes", real_scoring)
+    random.seed(99)  # resume must not depend on the process-wide RNG state
+    resumed = asyncio.run(resume_game("crashy"))
+    assert resumed["rounds"] == full["rounds"]
+    assert load_checkpoint("crashy") is None
+
+
+def test_resume_unknown_game(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(resume_game("nope"))
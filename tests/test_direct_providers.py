@@ -0,0 +1,66 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from vision import instrumentation
+from vision.instrumentation import call_purpose
+from vision.providers import claude, openai_provider
+
+
+class _Failure(Exception):
+    status_code = 529
+
+
+def _fake_create(response):
+    async def _create(**kwargs):
+        if isinstance(response, Exception):
+            raise response
+        return response
+    return _create
+
+
+@pytest.fixture
+def records():
+    seen = []
+    instrumentation.add_listener(seen.append)
+    yield seen
+    instrumentation.remove_listener(seen.append)
+
+
+def _analyze(client, image_url="https://cards.example/1.jpg", purpose="clue"):
+    async def _run():
+        token = call_purpose.set(purpose)
+        try:
+            return await client.analyze_image(image_url, "clue?")
+        finally:
+            call_purpose.reset(token)
+    return asyncio.run(_run())
+
+
+def test_direct_sdk_calls_are_recorded_with_usage(monkeypatch, records):
+    message = SimpleNamespace(content=[SimpleNamespace(text="harbour")],
+                              usage=SimpleNamespace(input_tokens=812, output_tokens=3))
+    fake = SimpleNamespace(messages=SimpleNamespace(create=_fake_create(message)))
+    monkeypatch.setattr(claude, "_get_client", lambda: fake)
+    assert _analyze(claude.ClaudeVision("anthropic/claude-test")) == "harbour"
+
+    completion = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="7"))],
+                                 usage=SimpleNamespace(prompt_tokens=790, completion_tokens=1))
+    fake = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=_fake_create(completion))))
+    monkeypatch.setattr(openai_provider, "_get_client", lambda: fake)
+    assert _analyze(openai_provider.OpenAIVision("openai/gpt-test"), purpose="score") == "7"
+
+    assert [(r.provider, r.model, r.purpose, r.ok, r.status, r.prompt_tokens, r.completion_tokens) for r in records] == [
+        ("anthropic", "claude-test", "clue", True, 200, 812, 3),
+        ("openai", "gpt-test", "score", True, 200, 790, 1),
+    ]
+    assert all(r.latency_s >= 0 and r.attempts == 1 for r in records)
+
+
+def test_failed_sdk_call_is_recorded_and_raised(monkeypatch, records):
+    fake = SimpleNamespace(messages=SimpleNamespace(create=_fake_create(_Failure("overloaded"))))
+    monkeypatch.setattr(claude, "_get_client", lambda: fake)
+    with pytest.raises(_Failure):
+        _analyze(claude.ClaudeVision("anthropic/claude-test"))
+    assert [(r.ok, r.status, r.purpose) for r in records] == [(False, 529, "clue")]
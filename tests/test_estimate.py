@@ -0,0 +1,38 @@
+import asyncio
+from pathlib import Path
+
+from core.call_history import CallHistory
+from core.estimate import estimate_trials, requests_per_round
+from core.game import play_game
+from core.tournament import trials_from_config
+from vision import instrumentation
+
+CARDS = str(Path(__file__).resolve().parent.parent / "data" / "1_full")
+PLAYERS = [{"model": "mock/a"}, {"model": "mock/b"}, {"model": "mock/c"}]
+
+
+def test_dry_run_matches_the_calls_a_game_makes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("core.cache._instance", None)
+    history = CallHistory(str(tmp_path / "history.db"))
+    instrumentation.add_listener(history.record)
+    try:
+        asyncio.run(play_game(CARDS, PLAYERS, max_rounds=2, score_to_win=100, seed=3))
+    finally:
+        instrumentation.remove_listener(history.record)
+    stats = history.model_stats()
+    made = {p: sum(s[p]["calls"] for s in stats.values() if p in s) for p in ("clue", "score")}
+    per_round = requests_per_round(3)
+    assert made == {"clue": 2 * per_round["clue"], "score": 2 * (per_round["pick"] + per_round["vote"])}
+
+    cfg = {
+        "defaults": {"cards": CARDS, "max_rounds": 2, "score_to_win": 100},
+        "runs": [{"name": "trio", "trials": 60, "players": PLAYERS}],
+    }
+    est = estimate_trials(trials_from_config(cfg), max_concurrent_games=1, history=stats)
+    assert est["requests"]["total"] == 60 * sum(made.values())
+    assert [p["pick"] for p in est["players"]] == [60 * 2 * 2 / 3 * 6] * 3
+    # The game above cached one clue each for mock/a and mock/b: 1 card in 84 of their clue requests
+    assert est["clue_cache_hits"] == round(2 * 60 * 2 / 3 / 84, 1)
+    assert est["cost"] == 0.0 and est["prompt_tokens"] > 0
+    assert est["no_history_models"] == [] and est["bottleneck"] == "games"
@@ -0,0 +1,103 @@
+import asyncio
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+import core.cache
+from core.cache import ImageAnalysisCache
+from core.game import play_game
+from core.game_log import find_log, load_log
+
+CARDS = str(Path(__file__).resolve().parent.parent / "data" / "1_full")
+
+
+@pytest.fixture(autouse=True)
+def _in_tmp(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.fixture
+def players():
+    return [{"model": "mock/a"}, {"model": "mock/b"}, {"model": "mock/c"}]
+
+
+def _play(players: list[dict], cards: str = CARDS, **kwargs) -> dict:
+    kwargs.setdefault("use_cache", False)
+    return asyncio.run(play_game(cards, players, **kwargs))
+
+
+def test_small_deck_game_ends_when_a_hand_runs_out(tmp_path, players):
+    deck = tmp_path / "deck"
+    deck.mkdir()
+    for card in sorted(Path(CARDS).glob("*.jpg"))[:20]:
+        shutil.copy(card, deck / card.name)
+    log = _play(players, cards=str(deck), max_rounds=30, score_to_win=1000, seed=1)
+    assert len(log["rounds"]) == 6
+
+
+def test_logs_go_to_game_logs_dir(monkeypatch, players):
+    monkeypatch.setattr("core.game.GAME_LOGS_DIR", "elsewhere")
+    log = _play(players, max_rounds=1, score_to_win=100, seed=1)
+    assert find_log("game_logs", log["game_id"]) is None
+    assert load_log(find_log("elsewhere", log["game_id"]))["rounds"] == log["rounds"]
+
+
+def test_pick_scores_are_reused_in_the_vote(players):
+    log = _play(players, max_rounds=3, seed=3)
+    for rnd in log["rounds"]:
+        # Each voter's own played card was already scored in the pick phase
+        assert rnd["scores_reused"] == len(players) - 1
+        for name, pick in rnd["played_cards"].items():
+            own = pick["selected_card"]
+            assert rnd["votes"][name]["card_scores"][own] == pick["card_scores"][own]
+
+
+def test_pick_deadline_fills_straggler_scores(monkeypatch, players):
+    monkeypatch.setenv("MOCK_VISION_CONFIG", json.dumps(
+        {"models": {"mock/b": {"latency": {"dist": "fixed", "value_s": 30.0}}}}
+    ))
+    log = _play(players, max_rounds=1, phase_timeouts={"pick": 0.2, "vote": 0.2})
+    rnd = log["rounds"][0]
+    slow = log["game_configuration"]["players"][1]["name"]
+    assert set(rnd["timeouts"]) == {"pick", "vote"}
+    assert len(rnd["timeouts"]["pick"][slow]) == 6
+    assert set(rnd["played_cards"][slow]["card_scores"].values()) == {5.0}
+
+
+def test_pipelined_votes_match_sequential(monkeypatch, players):
+    monkeypatch.setenv("MOCK_VISION_CONFIG", json.dumps({"latency": {"dist": "uniform", "low_s": 0.0, "high_s": 0.02}}))
+    players = players + [{"model": "mock/d"}]
+    sequential = _play(players, max_rounds=3, seed=11, pipeline_votes=False)
+    pipelined = _play(players, max_rounds=3, seed=11, pipeline_votes=True)
+    assert pipelined["rounds"] == sequential["rounds"]
+
+
+def test_speculative_clues_are_reused(players):
+    plain = _play(players, max_rounds=4, seed=5)
+    spec = _play(players, max_rounds=4, seed=5, speculative_clues=5, speculation_budget=8)
+    assert [r["clue"] for r in spec["rounds"]] == [r["clue"] for r in plain["rounds"]]
+    stats = spec["speculation"]
+    assert stats["hits"] > 0 and stats["wasted"] <= 8
+    assert stats["calls"] == stats["hits"] + stats["wasted"]
+
+
+def test_seeded_rerun_is_served_from_cache(monkeypatch, players):
+    monkeypatch.setattr(core.cache, "_instance", None)  # a fresh cache database in tmp_path
+    misses = []
+    real_set = ImageAnalysisCache.set
+
+    def _counting_set(self, *args):
+        misses.append(args)
+        return real_set(self, *args)
+
+    monkeypatch.setattr(ImageAnalysisCache, "set", _counting_set)
+    first = _play(players, max_rounds=3, seed=11, use_cache=True)
+    first_misses = len(misses)
+    assert first["game_configuration"]["seed"] == 11
+
+    misses.clear()
+    second = _play(players, max_rounds=3, seed=11, use_cache=True)
+    assert first_misses > 0 and misses == []
+    assert second["rounds"] == first["rounds"]
@@ -0,0 +1,82 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from core.game import play_game
+from core.game_log import GameLogWriter, find_log, load_log, read_summary, tail_log
+from core.log_schema import compact_log, expand_log
+
+CARDS = str(Path(__file__).resolve().parent.parent / "data" / "1_full")
+
+
+def _round(n: int) -> dict:
+    own, other = f"https://example.com/cards/{n}.jpg", "https://example.com/cards/0.jpg"
+    return {
+        "round": n,
+        "storyteller": "a",
+        "clue": "dusk",
+        "storyteller_card": own,
+        "played_cards": {"b": {"selected_card": other, "card_scores": {other: 6.0, "x.jpg": 2.0}}},
+        "votes": {"b": {"selected_card": own, "card_scores": {own: 8.0, other: 6.0}}},
+        "current_scores": {"a": n, "b": 0},
+    }
+
+
+def test_running_log_is_readable_and_tailable(tmp_path):
+    path = str(tmp_path / "dixit_game_log_g1.jsonl")
+    writer = GameLogWriter(path)
+    writer.header("g1", {"max_rounds": 3})
+    writer.round(_round(1))
+    writer.round(_round(2))
+    with open(path, "a") as f:
+        f.write('{"type": "round", "da')  # torn line being written right now
+
+    log = load_log(path)
+    assert log["status"] == "in_progress" and [r["round"] for r in log["rounds"]] == [1, 2]
+    assert [r["round"] for r in tail_log(path, after_round=1)["rounds"]] == [2]
+    summary = read_summary(path)
+    assert summary["rounds_total"] == 2 and summary["rounds"] == [_round(2)]
+
+
+def test_legacy_json_logs_still_load(tmp_path):
+    legacy = {"game_id": "old", "game_configuration": {}, "rounds": [_round(1)]}
+    (tmp_path / "dixit_game_log_old.json").write_text(json.dumps(legacy, indent=2))
+    path = find_log(str(tmp_path), "old")
+    assert load_log(path)["status"] == "finished"
+    assert tail_log(path, after_round=1)["rounds"] == []
+
+
+def test_play_game_writes_jsonl(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    players = [{"model": "mock/a"}, {"model": "mock/b"}, {"model": "mock/c"}]
+    log = asyncio.run(play_game(CARDS, players, max_rounds=2, use_cache=False, game_id="jl"))
+    on_disk = load_log(find_log("game_logs", "jl"))
+    assert on_disk["status"] == "finished"
+    assert on_disk["rounds"] == log["rounds"]
+    assert on_disk["game_configuration"] == log["game_configuration"]
+
+
+def test_compact_schema_round_trips(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    players = [{"model": "mock/a"}, {"model": "mock/b"}, {"model": "mock/c"}, {"model": "mock/d"}]
+    log = asyncio.run(play_game(CARDS, players, max_rounds=3, use_cache=False, game_id="cmp"))
+    compact = compact_log(log)
+    assert compact["schema_version"] == 2
+    assert expand_log(json.loads(json.dumps(compact))) == log
+    assert len(json.dumps(compact)) < len(json.dumps(log))
+
+
+@pytest.mark.parametrize("codec", ["gzip", "zstd"])
+def test_compressed_logs_read_transparently(tmp_path, monkeypatch, codec):
+    if codec == "zstd":
+        pytest.importorskip("zstandard")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GAME_LOG_COMPRESSION", codec)
+    players = [{"model": "mock/a"}, {"model": "mock/b"}, {"model": "mock/c"}]
+    log = asyncio.run(play_game(CARDS, players, max_rounds=2, use_cache=False, game_id="z"))
+    path = find_log("game_logs", "z")
+    assert path.endswith(".jsonl" + {"gzip": ".gz", "zstd": ".zst"}[codec])
+    assert load_log(path)["rounds"] == log["rounds"]
+    assert read_summary(path)["status"] == "finished"
@@ -0,0 +1,65 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from google.api_core import exceptions as google_exceptions
+
+from vision import instrumentation
+from vision.providers import gemini
+
+
+class _FakeModel:
+    """Fails the first request for each file URI in ``fail_uris`` with the matching error."""
+
+    def __init__(self, fail_uris: dict):
+        self.fail_uris = fail_uris
+        self.calls = []
+
+    def generate_content(self, parts, generation_config):
+        uri = parts[0]["file_data"]["file_uri"]
+        self.calls.append(uri)
+        if uri in self.fail_uris:
+            raise self.fail_uris.pop(uri)
+        return SimpleNamespace(text=f"seen {uri}")
+
+
+@pytest.fixture
+def uploads(tmp_path, monkeypatch):
+    uploaded = []
+
+    def _upload(data, mime_type):
+        uploaded.append(mime_type)
+        return SimpleNamespace(uri=f"files/{len(uploaded)}", expiration_time=None)
+
+    monkeypatch.setattr(gemini, "INLINE_MAX_BYTES", 0)  # force the File API path
+    monkeypatch.setattr(gemini, "_file_cache", gemini.GeminiFileCache(str(tmp_path / "files.db")))
+    monkeypatch.setattr(gemini.genai, "upload_file", _upload)
+    return uploaded
+
+
+def _card(tmp_path) -> str:
+    path = tmp_path / "card.jpg"
+    path.write_bytes(b"\xff\xd8 not really a jpeg")
+    return str(path)
+
+
+def test_expired_file_is_uploaded_again_once(tmp_path, monkeypatch, uploads):
+    model = _FakeModel({"files/1": google_exceptions.NotFound("File files/1 not found")})
+    monkeypatch.setattr(gemini, "_get_model", lambda name: model)
+    records = []
+    instrumentation.add_listener(records.append)
+    try:
+        text = asyncio.run(gemini.GeminiVision("google/gemini-test").analyze_image(_card(tmp_path), "clue?"))
+    finally:
+        instrumentation.remove_listener(records.append)
+    assert text == "seen files/2"
+    assert len(uploads) == 2 and model.calls == ["files/1", "files/2"]
+    assert [(r.provider, r.model, r.ok) for r in records] == [("google", "gemini-test", True)]
+
+
+def test_other_errors_propagate_without_reupload(tmp_path, monkeypatch, uploads):
+    model = _FakeModel({"files/1": google_exceptions.ResourceExhausted("quota")})
+    monkeypatch.setattr(gemini, "_get_model", lambda name: model)
+    with pytest.raises(google_exceptions.ResourceExhausted):
+        asyncio.run(gemini.GeminiVision("google/gemini-test").analyze_image(_card(tmp_path), "clue?"))
+    assert len(uploads) == 1 and model.calls == ["files/1"]
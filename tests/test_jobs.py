@@ -0,0 +1,108 @@
+import asyncio
+import json
+from pathlib import Path
+
+from core.game_log import find_log, load_log
+from core.jobs import JobQueue
+from core.workers import get_pool
+
+CARDS = str(Path(__file__).resolve().parent.parent / "data" / "1_full")
+PLAYERS = [{"model": "mock/a"}, {"model": "mock/b"}, {"model": "mock/c"}]
+
+
+class _RecordingBus:
+    def __init__(self):
+        self.events = []
+
+    async def publish(self, game_id, event):
+        self.events.append((game_id, event["type"]))
+
+
+def _params(**overrides) -> dict:
+    return {"image_directory": CARDS, "players": PLAYERS, "max_rounds": 1, "use_cache": False, **overrides}
+
+
+async def _wait_idle(queue: JobQueue) -> None:
+    while queue._tasks:
+        await asyncio.sleep(0.01)
+
+
+def test_jobs_run_by_priority_within_concurrency_limit(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    bus = _RecordingBus()
+
+    async def _main():
+        queue = JobQueue(db_path="jobs.db", max_concurrent=1)
+        ids = [queue.enqueue(_params(), priority=p)["game_id"] for p in (0, 5, 1)]
+        assert len(set(ids)) == 3
+        queue.start(bus)
+        assert len(queue._tasks) == 1
+        await asyncio.wait_for(_wait_idle(queue), 30)
+        return queue, ids
+
+    queue, ids = asyncio.run(_main())
+    started = [gid for gid, kind in bus.events if kind == "game_config"]
+    assert started == [ids[1], ids[2], ids[0]]
+    assert [j["status"] for j in queue.list()] == ["done"] * 3
+    assert all(find_log("game_logs", gid) for gid in ids)
+
+
+def test_cancel_stops_running_game_and_its_requests(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("MOCK_VISION_CONFIG", json.dumps({"latency": {"dist": "fixed", "value_s": 30.0}}))
+
+    async def _main():
+        queue = JobQueue(db_path="jobs.db", max_concurrent=1)
+        queue.start()
+        running = queue.enqueue(_params())["game_id"]
+        waiting = queue.enqueue(_params())["game_id"]
+        await asyncio.sleep(0.2)
+        assert (await queue.cancel(waiting))["status"] == "cancelled"
+        job = await asyncio.wait_for(queue.cancel(running), 5)
+        await asyncio.sleep(0)
+        # Nothing of the cancelled game is left running on the loop
+        leftover = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        return job, leftover
+
+    job, leftover = asyncio.run(_main())
+    assert job["status"] == "cancelled"
+    assert leftover == []
+    # The game's log says so too, so it isn't listed as in progress forever
+    assert load_log(find_log("game_logs", job["game_id"]))["status"] == "cancelled"
+
+
+def test_running_jobs_are_requeued_after_restart(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    async def _main():
+        before = JobQueue(db_path="jobs.db")
+        game_id = before.enqueue(_params())["game_id"]
+        before._set(game_id, status="running")  # the process died mid-game
+        after = JobQueue(db_path="jobs.db")
+        after.start()
+        await asyncio.wait_for(_wait_idle(after), 30)
+        return after.get(game_id)
+
+    job = asyncio.run(_main())
+    assert job["status"] == "done"
+    assert job["result"]["rounds"] == 1
+
+
+def test_game_stopped_by_its_budget_in_a_worker(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GAME_WORKERS", "1")
+    monkeypatch.setattr("core.workers._instance", None)
+
+    async def _main():
+        queue = JobQueue(db_path="jobs.db", max_concurrent=1)
+        queue.start()
+        game_id = queue.enqueue(_params(max_rounds=3, budget={"requests": 20}))["game_id"]
+        try:
+            await asyncio.wait_for(_wait_idle(queue), 60)
+        finally:
+            get_pool().shutdown()
+        return queue.get(game_id)
+
+    job = asyncio.run(_main())
+    assert job["status"] == "stopped"
+    assert "game budget exhausted" in job["error"]
@@ -0,0 +1,38 @@
+import hashlib
+import os
+
+from core.manifest import ManifestCache
+
+
+def _bump_mtime(path) -> None:
+    # Make the change visible on filesystems with coarse directory mtimes
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+def test_local_manifest_is_cached_until_directory_changes(tmp_path):
+    (tmp_path / "b.jpg").write_bytes(b"bbb")
+    (tmp_path / "a.png").write_bytes(b"aa")
+    (tmp_path / "notes.txt").write_text("ignored")
+    cache = ManifestCache(data_dir=str(tmp_path.parent))
+
+    first = cache.local(str(tmp_path))
+    assert [c.filename for c in first.cards] == ["a.png", "b.jpg"]
+    assert first.cards[1].sha256 == hashlib.sha256(b"bbb").hexdigest()
+    assert cache.local(str(tmp_path)) is first
+
+    (tmp_path / "c.jpg").write_bytes(b"c")
+    _bump_mtime(tmp_path)
+    second = cache.local(str(tmp_path))
+    assert [c.filename for c in second.cards] == ["a.png", "b.jpg", "c.jpg"]
+    assert second.cards[0] is first.cards[0]  # unchanged files are not rehashed
+
+
+def test_sha256_is_dropped_when_file_changes(tmp_path):
+    card = tmp_path / "x.jpg"
+    card.write_bytes(b"one")
+    cache = ManifestCache()
+    cache.local(str(tmp_path))
+    assert cache.sha256(str(card)) == hashlib.sha256(b"one").hexdigest()
+    card.write_bytes(b"changed")
+    assert cache.sha256(str(card)) is None
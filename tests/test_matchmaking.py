@@ -0,0 +1,45 @@
+import asyncio
+import random
+
+from core.matchmaking import ActiveMatchmaker, new_active_tournament, run_active
+from core.tournament import Tournament
+
+MODELS = [f"mock/m{i}" for i in range(6)]
+
+
+def test_active_sampling_converges_faster_than_uniform():
+    mm = ActiveMatchmaker(MODELS, 4, confidence=0.9, max_games=300, seed=0)
+    strengths = {m: 8.0 * i for i, m in enumerate(MODELS)}
+    rng = random.Random(0)
+    active = sum(mm._simulated_games(strengths, True, 3000, rng) for _ in range(10))
+    uniform = sum(mm._simulated_games(strengths, False, 3000, rng) for _ in range(10))
+    assert active < uniform
+
+
+def test_run_active_stops_on_a_confident_ranking_and_resumes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    played = []
+
+    async def _fake_play_game(**kwargs):
+        # A model's score is its index: m5 always wins, m0 always loses
+        played.append(kwargs["game_id"])
+        scores = {f"{p['model'].split('/')[-1]}_{i+1}": int(p["model"][-1]) for i, p in enumerate(kwargs["players"])}
+        return {"rounds": [{"current_scores": scores}] * 3}
+
+    monkeypatch.setattr("core.tournament.play_game", _fake_play_game)
+    state_path = str(tmp_path / "state.json")
+    tour = new_active_tournament(MODELS, 3, "cards", confidence=0.8, max_games=200, seed=1,
+                                 state_path=state_path, max_concurrent_games=2)
+    report = asyncio.run(run_active(tour, replications=5))
+
+    assert report["converged"]
+    assert [r["model"] for r in report["ranking"]] == MODELS[::-1]
+    assert report["games"] == len(played) < 200
+    assert report["calls_per_game"] == 3 * (1 + 2 * 6 + 2 * 2)
+    assert report["games_saved"] >= 0 and report["calls_saved"] >= 0
+
+    # A resumed run rebuilds the same ratings and has nothing left to play
+    resumed = Tournament.resume(state_path)
+    again = asyncio.run(run_active(resumed, replications=5))
+    assert len(played) == report["games"]
+    assert again["ranking"] == report["ranking"]
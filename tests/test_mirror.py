@@ -0,0 +1,79 @@
+import asyncio
+import hashlib
+
+import httpx
+
+from core.mirror import CardMirror
+
+URLS = [f"https://cards.example/c/{i}.jpg" for i in range(3)]
+
+
+class _Server:
+    """Serves every card with an ETag; answers matching conditional requests with 304."""
+
+    def __init__(self, broken: set[str] = frozenset()):
+        self.broken = broken
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        url = str(request.url)
+        if url in self.broken:
+            return httpx.Response(500)
+        etag = f'"{hashlib.sha1(url.encode()).hexdigest()}"'
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304)
+        headers = {"etag": etag, "last-modified": "Mon, 19 Oct 2026 04:00:00 GMT"}
+        return httpx.Response(200, headers=headers, content=url.encode())
+
+
+def test_prefetch_persists_the_index_and_revalidates(tmp_path):
+    root = str(tmp_path / "mirror")
+    server = _Server()
+    counts = asyncio.run(CardMirror(root).prefetch(URLS, transport=httpx.MockTransport(server)))
+    assert counts["downloaded"] == 3
+
+    # A new instance reads the index back from disk
+    mirror = CardMirror(root, max_age=0)
+    assert mirror.read_bytes(URLS[0]) == URLS[0].encode()
+    assert mirror.sha256(URLS[0]) == hashlib.sha256(URLS[0].encode()).hexdigest()
+
+    # Past max_age every card is revalidated conditionally and answered with 304
+    server.requests.clear()
+    counts = asyncio.run(mirror.prefetch(URLS, transport=httpx.MockTransport(server)))
+    assert counts["revalidated"] == 3 and counts["downloaded"] == 0
+    assert all(r.headers.get("if-none-match") and r.headers.get("if-modified-since") for r in server.requests)
+
+    # Within max_age nothing is requested at all
+    server.requests.clear()
+    counts = asyncio.run(CardMirror(root).prefetch(URLS, transport=httpx.MockTransport(server)))
+    assert counts["fresh"] == 3 and server.requests == []
+
+
+def test_failed_downloads_are_counted_and_not_indexed(tmp_path):
+    root = str(tmp_path / "mirror")
+    server = _Server(broken={URLS[1]})
+    counts = asyncio.run(CardMirror(root).prefetch(URLS, transport=httpx.MockTransport(server)))
+    assert counts == {"fresh": 0, "revalidated": 0, "downloaded": 2, "failed": 1}
+
+    mirror = CardMirror(root)
+    assert mirror.read_bytes(URLS[1]) is None and mirror.local_path(URLS[1]) is None
+    assert mirror.read_bytes(URLS[2]) == URLS[2].encode()
+
+
+def test_concurrent_prefetches_of_one_collection(tmp_path):
+    root = tmp_path / "mirror"
+
+    async def _both():
+        transport = httpx.MockTransport(_Server())
+        return await asyncio.gather(*[CardMirror(str(root)).prefetch(URLS, transport=transport) for _ in range(2)])
+
+    assert [c["downloaded"] for c in asyncio.run(_both())] == [3, 3]
+    assert not list(root.glob("*.part"))
+    assert CardMirror(str(root)).read_bytes(URLS[2]) == URLS[2].encode()
+
+    # An index that can't be written is logged, not raised into the game
+    (root / "index.json").unlink()
+    (root / "index.json").mkdir()
+    counts = asyncio.run(CardMirror(str(root)).prefetch(URLS, transport=httpx.MockTransport(_Server())))
+    assert counts["downloaded"] == 3
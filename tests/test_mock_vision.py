@@ -0,0 +1,59 @@
+import asyncio
+import json
+from pathlib import Path
+
+from core.game import play_game
+from vision.factory import create_vision_client
+from vision.providers.mock import MockVision, card_words, load_mock_config, mock_response
+
+CARDS = str(Path(__file__).resolve().parent.parent / "data" / "1_full")
+_real_sleep = asyncio.sleep
+VOTE_PROMPT = "On a scale of 0–10, how well does this card match the clue '{clue}'? Reply with a single number only."
+
+
+async def _no_sleep(delay, *args, **kwargs):
+    await _real_sleep(0)
+
+
+def test_factory_routes_mock_models(monkeypatch):
+    monkeypatch.setenv("OPENROUTER_API_KEY", "sk-test")
+    assert isinstance(create_vision_client("mock/alpha"), MockVision)
+
+
+def test_responses_are_deterministic():
+    a = mock_response(0, "mock/a", "img-1", "Give a clue")
+    assert a == mock_response(0, "mock/a", "img-1", "Give a clue")
+    assert float(mock_response(0, "mock/a", "img-1", VOTE_PROMPT.format(clue=a)))
+
+
+def test_matching_clue_scores_higher_on_average():
+    images = [f"img-{i}" for i in range(200)]
+    own = sum(int(mock_response(0, "m", im, VOTE_PROMPT.format(clue=" ".join(card_words(im))))) for im in images)
+    other = sum(int(mock_response(0, "m", im, VOTE_PROMPT.format(clue="zzz qqq"))) for im in images)
+    assert own > other
+
+
+def test_config_model_overrides():
+    raw = json.dumps({"rate_429": 0.1, "models": {"mock/slow": {"latency": {"dist": "fixed", "value_s": 2.0}}}})
+    cfg = load_mock_config("mock/slow", raw)
+    assert cfg.rate_429 == 0.1 and cfg.latency["value_s"] == 2.0
+    assert load_mock_config("mock/fast", raw).latency["dist"] == "fixed"
+
+
+def test_analyze_image_retries_through_failures(monkeypatch):
+    monkeypatch.setenv("MOCK_VISION_CONFIG", json.dumps({"rate_5xx": 0.5}))
+    monkeypatch.setattr(asyncio, "sleep", _no_sleep)
+
+    async def run() -> list[str]:
+        client = MockVision("mock/flaky")
+        return [await client.analyze_image(f"{CARDS}/{i}.jpg", "Give a clue") for i in range(1, 11)]
+
+    assert sum(1 for r in asyncio.run(run()) if r) >= 7
+
+
+def test_play_game_offline(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    players = [{"model": "mock/a"}, {"model": "mock/b"}, {"model": "mock/c"}]
+    log = asyncio.run(play_game(CARDS, players, max_rounds=3, use_cache=False, game_id="mock_test"))
+    assert len(log["rounds"]) == 3
+    assert (tmp_path / "game_logs").is_dir()
@@ -0,0 +1,26 @@
+import asyncio
+from pathlib import Path
+
+from core.game import play_game
+from core.round_eval import evaluate_models, logged_rounds
+
+CARDS = str(Path(__file__).resolve().parent.parent / "data" / "1_full")
+PLAYERS = [{"model": "mock/a"}, {"model": "mock/b"}, {"model": "mock/c"}]
+
+
+def test_models_are_scored_on_logged_rounds(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    for i in range(2):
+        asyncio.run(play_game(CARDS, PLAYERS, max_rounds=3, use_cache=False, game_id=f"g{i}"))
+    rounds = logged_rounds("game_logs")
+    assert len(rounds) == 6
+    assert all(r.storyteller_card in r.table and len(r.table) == 3 for r in rounds)
+    assert len(logged_rounds("game_logs", limit=4)) == 4
+
+    votes = asyncio.run(evaluate_models(["mock/x", "mock/y"], rounds, "vote", use_cache=False))
+    assert [r["model"] for r in votes] == ["mock/x", "mock/y"]
+    assert votes[0]["rounds"] == 6 and votes[0]["errors"] == 0
+    assert 0 <= votes[0]["accuracy"] <= 1 and votes[0]["chance"] == round(1 / 3, 3)
+
+    clues = asyncio.run(evaluate_models(["mock/x"], rounds, "clue", judges=["mock/a", "mock/b"], use_cache=False))
+    assert clues[0]["rounds"] == 6 and 0 <= clues[0]["judge_accuracy"] <= 1
@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from core.rules import DixitState
+from core.simulate import make_agent, play_fast, play_headless, simulate
+
+
+def _state(**kwargs) -> DixitState:
+    return DixitState.deal(["ann", "bob", "cat"], list(range(30)), rng=random.Random(0), **kwargs)
+
+
+def test_round_state_machine_scores_and_refills_hands():
+    state = _state()
+    rnd = state.start_round()
+    assert rnd.storyteller == "ann" and rnd.others == ["bob", "cat"]
+    with pytest.raises(ValueError):
+        rnd.play("bob", 6)  # still the clue phase
+    rnd.tell(0, "storm")
+    with pytest.raises(ValueError):
+        rnd.play("bob", 0)  # not in bob's hand
+    rnd.play("cat", 12)
+    rnd.play("bob", 6)
+    assert sorted(rnd.table) == [0, 6, 12] and rnd.phase == "vote"
+    rnd.vote("bob", 0)
+    rnd.vote("cat", 6)
+    result = rnd.score()
+    # ann found by one of two voters: ann +3, bob +3, bob +1 for cat's vote
+    assert result.score_changes == {"ann": 3, "bob": 4}
+    assert state.scores == {"ann": 3, "bob": 4, "cat": 0}
+    assert state.hands["ann"] == [1, 2, 3, 4, 5, 18]
+    assert state.deck[0] == 21
+
+
+def test_game_ends_at_max_rounds_or_target_score():
+    state = play_headless([make_agent("random")] * 3, random.Random(1), max_rounds=5)
+    assert state.finished and state.round == 5
+    state = play_headless([make_agent("oracle")] * 4, random.Random(1), max_rounds=50, score_to_win=10)
+    assert state.round < 50 and max(state.scores.values()) >= 10
+    # Six players run through an 84-card deck: 8 rounds refill hands, 6 more empty them
+    state = play_headless([make_agent("random")] * 6, random.Random(1), max_rounds=40, score_to_win=1000)
+    assert state.finished and state.round == 14 and not any(state.hands.values())
+
+
+def test_game_ends_when_any_hand_runs_out():
+    # 20 cards, 3 players: the 2 spare cards refill seats 0 and 1 only, so seat 2 empties first
+    agents = [make_agent("random")] * 3
+    state = play_headless(agents, random.Random(2), deck_size=20, max_rounds=100, score_to_win=1000)
+    assert state.finished and state.round == 6
+    assert [len(state.hands[p]) for p in state.players] == [1, 1, 0]
+    scores, rounds = play_fast(agents, random.Random(2), deck_size=20, max_rounds=100, score_to_win=1000)
+    assert rounds == 6 and scores == [state.scores[p] for p in state.players]
+
+
+def test_simulation_is_reproducible_and_rewards_skill():
+    agents = [make_agent("oracle:0.8"), make_agent("random"), make_agent("random")]
+    a = simulate(agents, 2000, seed=3).to_dict()
+    b = simulate(agents, 2000, seed=3).to_dict()
+    assert a["agents"] == b["agents"]
+    assert a["agents"][0]["win_rate"] > 0.5
+
+
+def test_fast_path_matches_the_validated_rules():
+    agents = [make_agent("oracle:0.5"), make_agent("random"), make_agent("random"), make_agent("random")]
+    for kwargs in ({}, {"max_rounds": 40, "score_to_win": 1000, "deck_size": 40}):
+        fast = simulate(agents, 500, seed=9, **kwargs).to_dict()
+        checked = simulate(agents, 500, seed=9, validate=True, **kwargs).to_dict()
+        assert (fast["agents"], fast["mean_rounds"]) == (checked["agents"], checked["mean_rounds"])
@@ -0,0 +1,116 @@
+import asyncio
+import json
+from pathlib import Path
+
+from core.tournament import Tournament, cancel_game, random_trials, register, trials_from_config
+
+CARDS = str(Path(__file__).resolve().parent.parent / "data" / "1_full")
+
+
+def test_trials_from_config_merges_defaults():
+    cfg = {
+        "defaults": {"cards": CARDS, "max_rounds": 2},
+        "runs": [{"name": "duo", "trials": 2, "players": [{"model": "mock/a"}, {"model": "mock/b"}]}],
+    }
+    trials = trials_from_config(cfg)
+    assert [t.key for t in trials] == ["duo#00", "duo#01"]
+    assert trials[0].params["image_directory"] == CARDS
+    assert trials[0].params["max_rounds"] == 2
+
+
+def test_random_trials_are_reproducible():
+    a = random_trials(CARDS, 5, 3, ["mock/a", "mock/b", "mock/c", "mock/d"], seed=7)
+    b = random_trials(CARDS, 5, 3, ["mock/a", "mock/b", "mock/c", "mock/d"], seed=7)
+    assert [t.params for t in a] == [t.params for t in b]
+
+
+def test_resume_skips_completed_trials(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    trials = random_trials(CARDS, 4, 3, ["mock/a", "mock/b", "mock/c"], seed=1, max_rounds=2, use_cache=False)
+    state_path = str(tmp_path / "state.json")
+    tour = Tournament(trials, state_path=state_path, max_concurrent_games=4)
+    asyncio.run(tour.run())
+    assert tour.status == "completed"
+
+    # Simulate a crash that lost the last trial
+    state = json.loads(Path(state_path).read_text())
+    state["trials"][-1]["status"] = "running"
+    Path(state_path).write_text(json.dumps(state))
+
+    resumed = Tournament.resume(state_path)
+    started = []
+    monkeypatch.setattr("core.tournament.play_game", _recording_play_game(started))
+    asyncio.run(resumed.run())
+    assert len(started) == 1 and started[0].endswith("random_003")
+    assert resumed.progress()["done"] == 4
+
+
+def test_tournaments_share_game_slots(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    running, peak = 0, 0
+
+    async def _fake(**kwargs):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {"rounds": []}
+
+    monkeypatch.setattr("core.tournament.play_game", _fake)
+
+    async def _main():
+        slots = asyncio.Semaphore(1)
+        tours = [
+            Tournament(random_trials(CARDS, 3, 3, ["mock/a", "mock/b", "mock/c"], seed=i), tournament_id=f"t{i}",
+                       state_path=str(tmp_path / f"t{i}.json"), max_concurrent_games=2, game_slots=slots)
+            for i in range(2)
+        ]
+        await asyncio.gather(*[t.run() for t in tours])
+        return tours
+
+    tours = asyncio.run(_main())
+    assert peak == 1
+    assert all(t.status == "completed" and t.progress()["done"] == 3 for t in tours)
+
+
+def test_cancel_game_stops_only_that_trial(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("core.tournament._active", {})
+
+    async def _fake(**kwargs):
+        await asyncio.sleep(30 if kwargs["game_id"].endswith("_000") else 0.01)
+        return {"rounds": [{"current_scores": {"x": 1}}]}
+
+    monkeypatch.setattr("core.tournament.play_game", _fake)
+    state_path = str(tmp_path / "state.json")
+    tour = Tournament(random_trials(CARDS, 3, 3, ["mock/a", "mock/b", "mock/c"], seed=1),
+                      state_path=state_path, max_concurrent_games=3)
+    register(tour)
+
+    async def _main():
+        run = asyncio.create_task(tour.run())
+        while tour.trials[0].status != "running":
+            await asyncio.sleep(0.005)
+        cancelled = await cancel_game(tour.trials[0].game_id)
+        await run
+        return cancelled
+
+    cancelled = asyncio.run(_main())
+    assert cancelled["tournament_id"] == tour.tournament_id and cancelled["status"] == "cancelled"
+    assert [t.status for t in tour.trials] == ["cancelled", "done", "done"]
+    assert tour.status == "completed" and tour.progress()["cancelled"] == 1
+    assert asyncio.run(cancel_game("no_such_game")) is None
+
+    # A cancelled trial stays cancelled when the tournament is resumed
+    started = []
+    monkeypatch.setattr("core.tournament.play_game", _recording_play_game(started))
+    asyncio.run(Tournament.resume(state_path).run())
+    assert started == []
+
+
+def _recording_play_game(started: list):
+    async def _fake(**kwargs):
+        started.append(kwargs["game_id"])
+        return {"rounds": [{"current_scores": {"x": 1}}]}
+    return _fake
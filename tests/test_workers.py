@@ -0,0 +1,68 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from core.checkpoint import load_checkpoint
+from core.game_log import find_log
+from core.workers import GameProcessPool
+
+CARDS = str(Path(__file__).resolve().parent.parent / "data" / "1_full")
+
+
+class _RecordingBus:
+    def __init__(self):
+        self.events = []
+
+    async def publish(self, game_id, event):
+        self.events.append((game_id, event["type"]))
+
+
+def test_games_run_in_worker_processes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    players = [{"model": "mock/a"}, {"model": "mock/b"}, {"model": "mock/c"}]
+    bus = _RecordingBus()
+
+    async def _main():
+        pool = GameProcessPool(workers=1, games_per_worker=2)
+        pool.start(bus)
+        try:
+            return await asyncio.wait_for(asyncio.gather(*[
+                pool.submit({"image_directory": CARDS, "players": players, "max_rounds": 2,
+                             "use_cache": False, "game_id": f"w{i}"})
+                for i in range(2)
+            ]), 60)
+        finally:
+            pool.shutdown()
+
+    results = asyncio.run(_main())
+    assert [r["rounds"] for r in results] == [2, 2]
+    for gid in ("w0", "w1"):
+        assert (gid, "game_over") in bus.events
+        assert find_log("game_logs", gid) is not None
+
+
+def test_cancelled_game_can_be_resumed(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("MOCK_VISION_CONFIG", json.dumps({"latency": {"dist": "fixed", "value_s": 0.2}}))
+    players = [{"model": "mock/a"}, {"model": "mock/b"}, {"model": "mock/c"}]
+
+    async def _main():
+        # Two single-game workers: the one not playing the game also receives the cancel
+        pool = GameProcessPool(workers=2, games_per_worker=1)
+        pool.start()
+        try:
+            fut = pool.submit({"image_directory": CARDS, "players": players, "max_rounds": 3,
+                               "use_cache": False, "game_id": "c1"})
+            while load_checkpoint("c1") is None:
+                await asyncio.sleep(0.05)
+            pool.cancel("c1")
+            with pytest.raises(asyncio.CancelledError):
+                await asyncio.wait_for(fut, 30)
+            return await asyncio.wait_for(pool.submit({"game_id": "c1"}, kind="resume"), 60)
+        finally:
+            pool.shutdown()
+
+    result = asyncio.run(_main())
+    assert result["rounds"] == 3